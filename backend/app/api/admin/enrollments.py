@@ -2,11 +2,24 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from ...application.enrollment.dto import EnrollmentResponse, BulkEnrollmentRequest, BulkEnrollmentResponse
+from ...application.enrollment.dto import (
+    EnrollmentResponse,
+    BulkEnrollmentRequest,
+    BulkEnrollmentResponse,
+    ExamEnrollmentRequest,
+    ExamEnrollmentResponse,
+)
 from ...application.enrollment.services import EnrollmentService
-from ...core.dependencies import get_current_user, get_current_user_role, get_registration_repository
+from ...core.dependencies import (
+    get_current_principal,
+    get_exam_repository,
+    get_registration_repository,
+)
+from ...core.security import Principal
+from ...domain.exam.exceptions import ExamNotFoundError
+from ...domain.exam.repository import ExamRepository
 from ...domain.registration.repository import RegistrationRepository
-from ...domain.user.entity import User, UserRole
+from ...domain.user.entity import UserRole
 from ...domain.registration.exceptions import RegistrationNotFoundError
 
 router = APIRouter(prefix="/admin/registrations", tags=["admin-enrollments"])
@@ -14,16 +27,16 @@ router = APIRouter(prefix="/admin/registrations", tags=["admin-enrollments"])
 
 def get_enrollment_service(
     registration_repository: RegistrationRepository = Depends(get_registration_repository),
+    exam_repository: ExamRepository = Depends(get_exam_repository),
 ) -> EnrollmentService:
     """Dependency to get enrollment service."""
-    return EnrollmentService(registration_repository)
+    return EnrollmentService(registration_repository, exam_repository)
 
 
 @router.post("/{registration_id}/enroll", response_model=EnrollmentResponse, status_code=status.HTTP_200_OK)
 async def enroll_registration(
     registration_id: UUID,
-    current_user: User = Depends(get_current_user),
-    user_role: UserRole = Depends(get_current_user_role),
+    principal: Principal = Depends(get_current_principal),
     enrollment_service: EnrollmentService = Depends(get_enrollment_service),
 ):
     """
@@ -31,7 +44,7 @@ async def enroll_registration(
     Only ADMIN can access this endpoint.
     Transitions status from PAID/REGISTERED/PAYMENT_PENDING to ENROLLED.
     """
-    if user_role != UserRole.ADMIN:
+    if principal.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only ADMIN can enroll registrations",
@@ -39,7 +52,7 @@ async def enroll_registration(
     
     try:
         result = await enrollment_service.enroll_registration(
-            registration_id, current_user.id, current_user.role
+            registration_id, principal.id, principal.role
         )
         return EnrollmentResponse(**result)
     except PermissionError as e:
@@ -62,8 +75,7 @@ async def enroll_registration(
 @router.post("/enroll/bulk", response_model=BulkEnrollmentResponse, status_code=status.HTTP_200_OK)
 async def bulk_enroll_registrations(
     request: BulkEnrollmentRequest,
-    current_user: User = Depends(get_current_user),
-    user_role: UserRole = Depends(get_current_user_role),
+    principal: Principal = Depends(get_current_principal),
     enrollment_service: EnrollmentService = Depends(get_enrollment_service),
 ):
     """
@@ -71,7 +83,7 @@ async def bulk_enroll_registrations(
     Only ADMIN can access this endpoint.
     Allows partial success - some registrations may fail while others succeed.
     """
-    if user_role != UserRole.ADMIN:
+    if principal.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only ADMIN can bulk enroll registrations",
@@ -79,7 +91,7 @@ async def bulk_enroll_registrations(
     
     try:
         result = await enrollment_service.bulk_enroll_registrations(
-            request.registration_ids, current_user.id, current_user.role
+            request.registration_ids, principal.id, principal.role
         )
         return result
     except PermissionError as e:
@@ -93,3 +105,51 @@ async def bulk_enroll_registrations(
             detail=str(e),
         )
 
+
+@router.post("/enroll/exam/{exam_id}", response_model=ExamEnrollmentResponse, status_code=status.HTTP_200_OK)
+async def enroll_exam_registrations(
+    exam_id: UUID,
+    request: ExamEnrollmentRequest = ExamEnrollmentRequest(),
+    principal: Principal = Depends(get_current_principal),
+    enrollment_service: EnrollmentService = Depends(get_enrollment_service),
+):
+    """
+    Enroll every enrollable registration of an exam.
+    Only ADMIN can access this endpoint.
+    Runs as a single server-side update; with dry_run only reports how many
+    registrations would be enrolled.
+    """
+    if principal.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only ADMIN can enroll registrations",
+        )
+    
+    try:
+        return await enrollment_service.enroll_exam_registrations(
+            exam_id,
+            principal.id,
+            principal.role,
+            statuses=set(request.statuses) if request.statuses else None,
+            dry_run=request.dry_run,
+        )
+    except PermissionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e),
+        )
+    except ExamNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
@@ -1,6 +1,7 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from ...application.export.service import ExportService
 from ...core.dependencies import get_current_user_role, get_exam_repository, get_registration_repository, get_user_repository
@@ -26,12 +27,14 @@ def get_export_service(
 @router.get("/{exam_id}/registrations/export")
 async def export_exam_registrations_csv(
     exam_id: UUID,
+    stream: bool = Query(False, description="Stream the CSV in chunks instead of building it in memory"),
     user_role: UserRole = Depends(get_current_user_role),
     export_service: ExportService = Depends(get_export_service),
 ):
     """
     Export all registrations for an exam as CSV.
     Only ADMIN can access this endpoint.
+    With stream=true the CSV is sent page by page as it is produced.
     """
     if user_role != UserRole.ADMIN:
         raise HTTPException(
@@ -39,15 +42,23 @@ async def export_exam_registrations_csv(
             detail="Only ADMIN can export registrations",
         )
     
+    # Set response headers
+    filename = f"exam_{exam_id}_registrations.csv"
+    headers = {
+        "Content-Type": "text/csv; charset=utf-8",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    
     try:
-        csv_content = await export_service.export_exam_registrations_to_csv(exam_id)
+        if stream:
+            chunks = await export_service.stream_exam_registrations_csv(exam_id)
+            return StreamingResponse(
+                chunks,
+                headers=headers,
+                media_type="text/csv",
+            )
         
-        # Set response headers
-        filename = f"exam_{exam_id}_registrations.csv"
-        headers = {
-            "Content-Type": "text/csv; charset=utf-8",
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        }
+        csv_content = await export_service.export_exam_registrations_to_csv(exam_id)
         
         return Response(
             content=csv_content,
@@ -64,4 +75,3 @@ async def export_exam_registrations_csv(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
-
@@ -1,14 +1,24 @@
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from ...application.registration.admin_query_service import AdminRegistrationQueryService
 from ...application.registration.dto import RegistrationWithUserResponse
-from ...core.dependencies import get_current_user_role, get_exam_repository, get_registration_repository, get_user_repository
+from ...core.dependencies import (
+    get_current_user_role,
+    get_exam_repository,
+    get_registration_repository,
+    get_registration_user_query,
+    get_user_repository,
+)
 from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor
+from ...domain.registration.queries import RegistrationUserQuery
 from ...domain.registration.repository import RegistrationRepository
 from ...domain.user.entity import UserRole
 from ...domain.user.repository import UserRepository
+from ..pagination import PageParams, set_next_cursor
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -17,21 +27,34 @@ def get_admin_registration_query_service(
     registration_repository: RegistrationRepository = Depends(get_registration_repository),
     exam_repository: ExamRepository = Depends(get_exam_repository),
     user_repository: UserRepository = Depends(get_user_repository),
+    registration_user_query: Optional[RegistrationUserQuery] = Depends(get_registration_user_query),
 ) -> AdminRegistrationQueryService:
     """Dependency to get admin registration query service."""
     from ...application.registration.admin_query_service import AdminRegistrationQueryService
-    return AdminRegistrationQueryService(registration_repository, exam_repository, user_repository)
+    return AdminRegistrationQueryService(
+        registration_repository, exam_repository, user_repository, registration_user_query
+    )
 
 
 @router.get("/exams/{exam_id}/registrations", response_model=list[RegistrationWithUserResponse])
 async def get_exam_registrations(
     exam_id: UUID,
+    response: Response,
+    page: PageParams = Depends(),
     user_role: UserRole = Depends(get_current_user_role),
     query_service: AdminRegistrationQueryService = Depends(get_admin_registration_query_service),
 ):
-    """Get all registrations for an exam with user details. Only ADMIN can access."""
+    """Get all registrations for an exam with user details. Only ADMIN can access. Paginated with limit/after."""
     try:
-        registrations = await query_service.get_exam_registrations(exam_id, user_role)
+        registrations = await query_service.get_exam_registrations(
+            exam_id, user_role, limit=page.limit, after=page.after
+        )
+        if page.limit is not None and len(registrations) == page.limit:
+            last = registrations[-1]
+            set_next_cursor(
+                response,
+                PageCursor(created_at=last.registered_at, id=last.registration_id),
+            )
         return registrations
     except PermissionError as e:
         raise HTTPException(
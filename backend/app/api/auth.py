@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 from ..application.registration.dto import RegistrationResponse
 from ..application.registration.services import RegistrationService
@@ -9,15 +9,20 @@ from ..application.user.dto import (
     UserResponse,
 )
 from ..application.user.services import UserService
-from ..core.dependencies import get_current_user, get_exam_repository, get_registration_repository, get_user_repository
+from ..core.dependencies import get_current_user, get_current_user_access, get_exam_repository, get_registration_repository, get_user_repository
 from ..core.security import create_access_token
 from ..domain.exam.repository import ExamRepository
+from ..domain.pagination import PageCursor
 from ..domain.registration.repository import RegistrationRepository
-from ..domain.user.entity import User
+from ..domain.user.entity import User, UserAccess
 from ..domain.user.repository import UserRepository
+from .pagination import PageParams, set_next_cursor
+from .serialization import ListSerializer, json_list_response
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+registration_list_serializer = ListSerializer(RegistrationResponse)
+
 
 def get_user_service(
     user_repository: UserRepository = Depends(get_user_repository),
@@ -39,6 +44,7 @@ async def google_login(
         user_id=user.id,
         email=user.email,
         role=user.role,
+        role_version=user.role_version,
     )
     
     return AuthResponse(
@@ -50,7 +56,7 @@ async def google_login(
 @router.post("/mobile", response_model=UserResponse)
 async def update_mobile(
     request: MobileUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserAccess = Depends(get_current_user_access),
     user_service: UserService = Depends(get_user_service),
 ):
     """Update user's mobile number."""
@@ -85,13 +91,18 @@ def get_registration_service(
 
 @router.get("/me/registrations", response_model=list[RegistrationResponse])
 async def get_my_registrations(
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    page: PageParams = Depends(),
+    current_user: UserAccess = Depends(get_current_user_access),
     registration_service: RegistrationService = Depends(get_registration_service),
 ):
-    """Get current user's registrations."""
+    """Get current user's registrations. Paginated with limit/after."""
     try:
-        registrations = await registration_service.get_user_registrations(current_user.id)
-        return [registration_service.to_dto(reg) for reg in registrations]
+        registrations = await registration_service.get_user_registrations(
+            current_user.id, limit=page.limit, after=page.after
+        )
+        set_next_cursor(response, PageCursor.after_page(registrations, page.limit))
+        return json_list_response(registration_list_serializer, registrations, response)
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -0,0 +1,74 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+# Public catalog responses may be stored by browsers and shared caches but
+# must be revalidated (cheaply, via If-None-Match) on every use
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+
+# Responses that depend on the caller's role may only be stored by the browser
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values a representation is derived from.
+    
+    Callers pass identifying and versioning data (ids, updated_at, status,
+    page parameters) rather than the serialized body, so the tag can be
+    computed without serializing the response.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified_or_set_validators(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = PUBLIC_CACHE_CONTROL,
+) -> Optional[Response]:
+    """
+    Handle a conditional GET.
+    
+    Returns a 304 response when the request's If-None-Match matches etag.
+    Otherwise sets ETag, Last-Modified and Cache-Control on response and
+    returns None, and the endpoint builds its body as usual.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    if cache_control.startswith("private"):
+        headers["Vary"] = "Authorization"
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return None
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date. Naive datetimes are taken as UTC, as stored by MongoDB."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def latest(timestamps: Iterable[datetime]) -> Optional[datetime]:
+    """Most recent of timestamps, or None if there are none."""
+    return max(timestamps, default=None)
@@ -1,16 +1,23 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 
-from ..application.content.dto import ContentCreateRequest, ContentUpdateRequest, ContentResponse
+from ..application.content.dto import ContentCreateRequest, ContentUpdateRequest, ContentResponse, ContentSummaryResponse
 from ..application.content.services import ContentService
-from ..core.dependencies import get_current_user, get_current_user_role, get_content_repository
+from ..core.dependencies import get_current_user_role, get_content_repository
 from ..domain.content.repository import ContentRepository
 from ..domain.content.exceptions import ContentNotFoundError, InvalidContentTypeError
-from ..domain.user.entity import User, UserRole
+from ..domain.pagination import PageCursor
+from ..domain.user.entity import UserRole
+from .caching import PUBLIC_CACHE_CONTROL, latest, make_etag, not_modified_or_set_validators
+from .pagination import PageParams, set_next_cursor
+from .serialization import ListSerializer, json_list_response
 
 router = APIRouter(prefix="/content", tags=["content"])
 
+content_list_serializer = ListSerializer(ContentResponse)
+summary_list_serializer = ListSerializer(ContentSummaryResponse)
+
 
 def get_content_service(
     content_repository: ContentRepository = Depends(get_content_repository),
@@ -26,7 +33,6 @@ admin_router = APIRouter(prefix="/admin/content", tags=["admin-content"])
 @admin_router.post("", response_model=ContentResponse, status_code=status.HTTP_201_CREATED)
 async def create_content(
     request: ContentCreateRequest,
-    current_user: User = Depends(get_current_user),
     user_role: UserRole = Depends(get_current_user_role),
     content_service: ContentService = Depends(get_content_service),
 ):
@@ -51,7 +57,6 @@ async def create_content(
 async def update_content(
     content_id: UUID,
     request: ContentUpdateRequest,
-    current_user: User = Depends(get_current_user),
     user_role: UserRole = Depends(get_current_user_role),
     content_service: ContentService = Depends(get_content_service),
 ):
@@ -77,7 +82,6 @@ async def update_content(
 @admin_router.post("/{content_id}/publish", response_model=ContentResponse)
 async def publish_content(
     content_id: UUID,
-    current_user: User = Depends(get_current_user),
     user_role: UserRole = Depends(get_current_user_role),
     content_service: ContentService = Depends(get_content_service),
 ):
@@ -91,16 +95,26 @@ async def publish_content(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@admin_router.get("", response_model=List[ContentResponse])
+@admin_router.get("", response_model=Union[List[ContentResponse], List[ContentSummaryResponse]])
 async def list_content_admin(
+    response: Response,
     type: str = Query(..., description="Content type: COURSE, BLOG, or GALLERY"),
-    current_user: User = Depends(get_current_user),
+    summary: bool = Query(False, description="Return excerpts instead of full bodies"),
+    page: PageParams = Depends(),
     user_role: UserRole = Depends(get_current_user_role),
     content_service: ContentService = Depends(get_content_service),
 ):
-    """List all content (DRAFT + PUBLISHED) for admin. ADMIN only."""
+    """
+    List all content (DRAFT + PUBLISHED) for admin. ADMIN only. Paginated with limit/after.
+    With summary=true items carry an excerpt instead of body and seo_meta.
+    """
     try:
-        return await content_service.list_content_admin(type, user_role)
+        contents = await content_service.find_content_admin(
+            type, user_role, limit=page.limit, after=page.after, summary=summary
+        )
+        set_next_cursor(response, PageCursor.after_page(contents, page.limit))
+        serializer = summary_list_serializer if summary else content_list_serializer
+        return json_list_response(serializer, contents, response)
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
     except (InvalidContentTypeError, ValueError) as e:
@@ -108,14 +122,36 @@ async def list_content_admin(
 
 
 # Public APIs
-@router.get("", response_model=List[ContentResponse])
+@router.get("", response_model=Union[List[ContentResponse], List[ContentSummaryResponse]])
 async def list_content_public(
+    request: Request,
+    response: Response,
     type: str = Query(..., description="Content type: COURSE, BLOG, or GALLERY"),
+    summary: bool = Query(False, description="Return excerpts instead of full bodies"),
+    page: PageParams = Depends(),
     content_service: ContentService = Depends(get_content_service),
 ):
-    """List published content. Public access (no auth required)."""
+    """
+    List published content. Public access (no auth required). Paginated with limit/after.
+    With summary=true items carry an excerpt instead of body and seo_meta.
+    Supports conditional GET: a matching If-None-Match is answered with 304.
+    """
     try:
-        return await content_service.list_content_public(type)
+        contents = await content_service.find_content_public(
+            type, limit=page.limit, after=page.after, summary=summary
+        )
+        etag = make_etag(
+            "content", type.upper(), summary, page.limit, page.after.encode() if page.after else None,
+            [(c.id, c.updated_at, c.status) for c in contents],
+        )
+        not_modified = not_modified_or_set_validators(
+            request, response, etag, latest(c.updated_at for c in contents), PUBLIC_CACHE_CONTROL
+        )
+        set_next_cursor(not_modified or response, PageCursor.after_page(contents, page.limit))
+        if not_modified:
+            return not_modified
+        serializer = summary_list_serializer if summary else content_list_serializer
+        return json_list_response(serializer, contents, response)
     except (InvalidContentTypeError, ValueError) as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -123,11 +159,21 @@ async def list_content_public(
 @router.get("/{content_id}", response_model=ContentResponse)
 async def get_content_public(
     content_id: UUID,
+    request: Request,
+    response: Response,
     content_service: ContentService = Depends(get_content_service),
 ):
-    """Get published content by ID. Public access (no auth required)."""
+    """
+    Get published content by ID. Public access (no auth required).
+    Supports conditional GET: a matching If-None-Match is answered with 304.
+    """
     try:
-        return await content_service.get_content_public(content_id)
+        content = await content_service.get_content_public(content_id)
+        etag = make_etag("content", content.id, content.updated_at, content.status)
+        not_modified = not_modified_or_set_validators(
+            request, response, etag, content.updated_at, PUBLIC_CACHE_CONTROL
+        )
+        return not_modified or content
     except ContentNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
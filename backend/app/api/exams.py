@@ -1,19 +1,25 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from ..application.exam.dto import ExamCreateRequest, ExamResponse, ExamUpdateRequest
 from ..application.exam.services import ExamService
 from ..application.registration.dto import RegistrationResponse
 from ..application.registration.services import RegistrationService
-from ..core.dependencies import get_current_user, get_current_user_role, get_exam_repository, get_registration_repository, get_user_repository
+from ..core.dependencies import get_current_user_access, get_current_user_role, get_exam_repository, get_registration_repository, get_user_repository
 from ..domain.exam.repository import ExamRepository
+from ..domain.pagination import PageCursor
 from ..domain.registration.repository import RegistrationRepository
-from ..domain.user.entity import User, UserRole
+from ..domain.user.entity import UserAccess, UserRole
 from ..domain.user.repository import UserRepository
+from .caching import PRIVATE_CACHE_CONTROL, latest, make_etag, not_modified_or_set_validators
+from .pagination import PageParams, set_next_cursor
+from .serialization import ListSerializer, json_list_response
 
 router = APIRouter(prefix="/exams", tags=["exams"])
 
+exam_list_serializer = ListSerializer(ExamResponse)
+
 
 def get_exam_service(
     exam_repository: ExamRepository = Depends(get_exam_repository),
@@ -57,12 +63,29 @@ async def create_exam(
 
 @router.get("", response_model=list[ExamResponse])
 async def list_exams(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
     exam_service: ExamService = Depends(get_exam_service),
     user_role: UserRole = Depends(get_current_user_role),
 ):
-    """List exams. ADMIN sees all, USER sees only ACTIVE."""
-    exams = await exam_service.list_exams(user_role)
-    return [exam_service.to_dto(exam) for exam in exams]
+    """
+    List exams. ADMIN sees all, USER sees only ACTIVE. Paginated with limit/after.
+    Supports conditional GET: a matching If-None-Match is answered with 304.
+    """
+    exams = await exam_service.list_exams(user_role, limit=page.limit, after=page.after)
+    # The listing depends on the role, so the role is part of the tag
+    etag = make_etag(
+        "exams", user_role.value, page.limit, page.after.encode() if page.after else None,
+        [(exam.id, exam.updated_at, exam.status) for exam in exams],
+    )
+    not_modified = not_modified_or_set_validators(
+        request, response, etag, latest(exam.updated_at for exam in exams), PRIVATE_CACHE_CONTROL
+    )
+    set_next_cursor(not_modified or response, PageCursor.after_page(exams, page.limit))
+    if not_modified:
+        return not_modified
+    return json_list_response(exam_list_serializer, exams, response)
 
 
 @router.get("/{exam_id}", response_model=ExamResponse)
@@ -122,7 +145,7 @@ async def update_exam(
 @router.post("/{exam_id}/register", response_model=RegistrationResponse, status_code=status.HTTP_201_CREATED)
 async def register_for_exam(
     exam_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserAccess = Depends(get_current_user_access),
     registration_service: RegistrationService = Depends(get_registration_service),
 ):
     """Register current user for an exam. Only USER role can register."""
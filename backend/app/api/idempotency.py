@@ -0,0 +1,98 @@
+import re
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from fastapi import Header, HTTPException, Request, Response, status
+from pydantic import BaseModel
+
+from ..core.dependencies import get_idempotency_repository
+from ..domain.idempotency.entity import IdempotencyRecord
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+# Set on responses replayed for a repeated key
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Keys clients may send: up to 255 printable ASCII characters, e.g. a UUID
+VALID_IDEMPOTENCY_KEY = re.compile(r"[!-~]{1,255}")
+
+
+class Idempotency:
+    """
+    Dependency letting a POST endpoint replay its response for a repeated Idempotency-Key.
+    
+    The first request with a key claims it and runs. Its successful
+    response is stored and sent again, byte for byte and with an
+    Idempotent-Replayed header, to every repeat from the same user during
+    the replay window. A repeat arriving while the first request still runs
+    gets 409, and a key reused for a different request gets 422. A failed
+    or cancelled request releases its key, so its retry runs again;
+    failures change no state. Requests without the header run as before.
+    """
+    
+    def __init__(
+        self,
+        request: Request,
+        idempotency_key: Optional[str] = Header(
+            None,
+            alias=IDEMPOTENCY_KEY_HEADER,
+            description="Client-chosen key; repeats of the request with it get the first response",
+        ),
+    ):
+        if idempotency_key is not None and not VALID_IDEMPOTENCY_KEY.fullmatch(idempotency_key):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1 to 255 printable ASCII characters",
+            )
+        self.key = idempotency_key
+        self.request = f"{request.method} {request.url.path}"
+    
+    async def run(
+        self,
+        user_id: UUID,
+        operation: Callable[[], Awaitable[BaseModel]],
+        status_code: int = status.HTTP_200_OK,
+    ) -> Any:
+        """Run operation once per key and return its result, or replay the response of the run that did."""
+        if self.key is None:
+            return await operation()
+        
+        repository = get_idempotency_repository()
+        record = IdempotencyRecord(user_id, self.key, self.request)
+        stored = await repository.claim(record)
+        if stored.claim_id != record.claim_id:
+            return self._replay(stored)
+        
+        completed = False
+        try:
+            result = await operation()
+            record.complete(status_code, result.model_dump_json().encode())
+            await repository.complete(record)
+            completed = True
+        finally:
+            # Also when the request is cancelled (e.g. the client went away),
+            # so retries do not get 409 until the pending record expires
+            if not completed:
+                await repository.release(record)
+        return Response(record.body, status_code=status_code, media_type="application/json")
+    
+    def _replay(self, stored: IdempotencyRecord) -> Response:
+        """The stored response for a repeated key, or the error explaining why there is none."""
+        if stored.request != self.request:
+            raise HTTPException(
+                # 422 Unprocessable Content; Starlette renamed the constant between versions
+                status_code=422,
+                detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+            )
+        if stored.pending:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"A request with this {IDEMPOTENCY_KEY_HEADER} is still being processed",
+                headers={"Retry-After": "1"},
+            )
+        return Response(
+            stored.body,
+            status_code=stored.status_code,
+            media_type="application/json",
+            headers={IDEMPOTENT_REPLAYED_HEADER: "true"},
+        )
@@ -0,0 +1,87 @@
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.dependencies import get_current_principal
+from ..core.metrics import CONTENT_TYPE, REGISTRY, MetricsRegistry
+from ..core.security import Principal
+from ..domain.user.entity import UserRole
+
+# Route label of requests that matched no route (404s, CORS preflights);
+# raw paths are never used as labels, so scanners cannot blow up cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+router = APIRouter(tags=["monitoring"])
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request counts, statuses and latency.
+    
+    Requests are labelled with the route template (/exams/{exam_id}), which
+    FastAPI stores in the scope while routing, so the label is only known
+    once the request has been handled. In-flight requests are therefore
+    tracked per method. A pure ASGI middleware rather than BaseHTTPMiddleware:
+    it adds no task or stream per request, and streamed responses are timed
+    until their last chunk has been sent.
+    """
+    
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = REGISTRY):
+        self.app = app
+        self.requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests served, by method, route template and status code.",
+            ("method", "route", "status"),
+        )
+        self.latency = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency in seconds, by method and route template.",
+            ("method", "route"),
+        )
+        self.in_flight = registry.gauge(
+            "http_requests_in_progress",
+            "HTTP requests currently being served, by method.",
+            ("method",),
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status_code = 500
+        
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        in_flight_labels = (method,)
+        self.in_flight.inc(in_flight_labels)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.in_flight.dec(in_flight_labels)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            self.requests.inc((method, path, str(status_code)))
+            self.latency.observe(elapsed, (method, path))
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(principal: Principal = Depends(get_current_principal)):
+    """
+    Expose application metrics in the Prometheus text format. ADMIN only:
+    they reveal routes, repository operations and query shapes.
+    """
+    if principal.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only ADMIN can read metrics",
+        )
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from fastapi import HTTPException, Query, Response, status
+
+from ..domain.pagination import InvalidCursorError, PageCursor
+
+# Largest page a client may request
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """
+    Dependency parsing keyset pagination query parameters.
+    
+    Without limit the full listing is returned, as before pagination existed.
+    """
+    
+    def __init__(
+        self,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of items to return"),
+        after: Optional[str] = Query(None, description=f"Cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    ):
+        self.limit = limit
+        try:
+            self.after = PageCursor.decode(after) if after else None
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+
+def set_next_cursor(response: Response, cursor: Optional[PageCursor]) -> None:
+    """Expose the cursor of the next page, if any, as a response header."""
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor.encode()
@@ -1,17 +1,27 @@
-from uuid import UUID
+from datetime import datetime, timezone
+from uuid import UUID, uuid5
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ..application.payment.dto import PaymentConfirmationResponse, PaymentInitiationResponse
 from ..application.payment.services import PaymentService
-from ..core.dependencies import get_current_user, get_exam_repository, get_registration_repository, get_user_repository
+from ..core.dependencies import get_current_user_access, get_exam_repository, get_registration_repository, get_user_repository
 from ..domain.exam.repository import ExamRepository
 from ..domain.registration.repository import RegistrationRepository
-from ..domain.user.entity import User, UserRole
+from ..domain.user.entity import UserAccess, UserRole
 from ..domain.user.repository import UserRepository
+from .idempotency import Idempotency
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
+# Namespace of mock payment ids, derived from registration ids
+PAYMENT_ID_NAMESPACE = UUID("0b5c1f3e-8f2a-4d7c-9a61-5e2f4c8d9b17")
+
+
+def payment_id_for(registration_id: UUID) -> UUID:
+    """Mock payment id of a registration; the same for initiation, confirmation and retries."""
+    return uuid5(PAYMENT_ID_NAMESPACE, str(registration_id))
+
 
 def get_payment_service(
     registration_repository: RegistrationRepository = Depends(get_registration_repository),
@@ -26,83 +36,88 @@ def get_payment_service(
 @router.post("/registrations/{registration_id}/pay", response_model=PaymentInitiationResponse, status_code=status.HTTP_200_OK)
 async def initiate_payment(
     registration_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserAccess = Depends(get_current_user_access),
     payment_service: PaymentService = Depends(get_payment_service),
+    idempotency: Idempotency = Depends(),
 ):
-    """Initiate payment for a registration. Only USER role can initiate payment."""
-    try:
-        registration = await payment_service.initiate_payment(
-            registration_id, current_user.id, current_user.role
-        )
-        
-        # Generate mock payment_id
-        from uuid import uuid4
-        payment_id = uuid4()
-        
-        return PaymentInitiationResponse(
-            registration_id=registration.id,
-            status=registration.status,
-            payment_id=payment_id,
-            message="Payment initiated successfully. Please confirm payment.",
-        )
-    except PermissionError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        if "not found" in str(e).lower():
+    """
+    Initiate payment for a registration. Only USER role can initiate payment.
+    Retries sent with the same Idempotency-Key get the first response again.
+    """
+    async def initiate() -> PaymentInitiationResponse:
+        try:
+            registration = await payment_service.initiate_payment(
+                registration_id, current_user.id, current_user.role
+            )
+            
+            return PaymentInitiationResponse(
+                registration_id=registration.id,
+                status=registration.status,
+                payment_id=payment_id_for(registration.id),
+                message="Payment initiated successfully. Please confirm payment.",
+            )
+        except PermissionError as e:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=status.HTTP_403_FORBIDDEN,
                 detail=str(e),
             )
-        raise
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        except Exception as e:
+            if "not found" in str(e).lower():
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=str(e),
+                )
+            raise
+    
+    return await idempotency.run(current_user.id, initiate)
 
 
 @router.post("/{registration_id}/confirm", response_model=PaymentConfirmationResponse, status_code=status.HTTP_200_OK)
 async def confirm_payment(
     registration_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserAccess = Depends(get_current_user_access),
     payment_service: PaymentService = Depends(get_payment_service),
+    idempotency: Idempotency = Depends(),
 ):
-    """Confirm payment (mocked). Only USER role can confirm payment."""
-    try:
-        registration = await payment_service.confirm_payment(
-            registration_id, current_user.id, current_user.role
-        )
-        
-        # Generate mock payment_id (same as initiation)
-        from uuid import uuid4
-        payment_id = uuid4()
-        
-        from datetime import datetime, timezone
-        return PaymentConfirmationResponse(
-            registration_id=registration.id,
-            status=registration.status,
-            payment_id=payment_id,
-            confirmed_at=datetime.now(timezone.utc),
-            message="Payment confirmed successfully.",
-        )
-    except PermissionError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        if "not found" in str(e).lower():
+    """
+    Confirm payment (mocked). Only USER role can confirm payment.
+    Retries sent with the same Idempotency-Key get the first response again.
+    """
+    async def confirm() -> PaymentConfirmationResponse:
+        try:
+            registration = await payment_service.confirm_payment(
+                registration_id, current_user.id, current_user.role
+            )
+            
+            return PaymentConfirmationResponse(
+                registration_id=registration.id,
+                status=registration.status,
+                payment_id=payment_id_for(registration.id),
+                confirmed_at=datetime.now(timezone.utc),
+                message="Payment confirmed successfully.",
+            )
+        except PermissionError as e:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=str(e),
+            )
+        except ValueError as e:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e),
             )
-        raise
+        except Exception as e:
+            if "not found" in str(e).lower():
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=str(e),
+                )
+            raise
+    
+    return await idempotency.run(current_user.id, confirm)
 
@@ -0,0 +1,58 @@
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
+
+
+class ListSerializer:
+    """
+    Serializes lists of entities straight to JSON bytes in the shape of a response model.
+    
+    The response model's fields are compiled once into a TypedDict list
+    serializer; each entity is read field by field into a plain dict and the
+    whole list is encoded by pydantic-core without building or validating a
+    DTO per item. Output is identical to returning the DTOs with
+    response_model set.
+    """
+    
+    def __init__(self, model: Type[BaseModel]):
+        fields = {name: field.annotation for name, field in model.model_fields.items()}
+        row_type = TypedDict(f"{model.__name__}Row", fields)  # type: ignore[misc]
+        self.model = model
+        self._names = tuple(fields)
+        self._getter = attrgetter(*self._names)
+        self._adapter = TypeAdapter(List[row_type])
+    
+    def to_rows(self, items: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Read the response model's fields from each item."""
+        names = self._names
+        getter = self._getter
+        if len(names) == 1:
+            return [{names[0]: getter(item)} for item in items]
+        return [dict(zip(names, getter(item))) for item in items]
+    
+    def dump_json(self, items: Iterable[Any]) -> bytes:
+        """Serialize items (entities or DTOs) to a JSON array."""
+        return self._adapter.dump_json(self.to_rows(items))
+
+
+def json_list_response(serializer: ListSerializer, items: Iterable[Any], response: Response) -> Response:
+    """
+    Build a JSON response from pre-serialized items.
+    
+    Returning a Response skips FastAPI's response_model validation, so the
+    headers and status code set on the endpoint's response parameter
+    (e.g. X-Next-Cursor, ETag) are carried over here.
+    """
+    headers = {
+        key: value for key, value in response.headers.items()
+        if key not in ("content-length", "content-type")
+    }
+    return Response(
+        content=serializer.dump_json(items),
+        status_code=response.status_code or 200,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,82 @@
+import os
+import re
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.tracing import TRACER, Tracer, current_request_id, current_span
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Request ids accepted from clients or proxies; anything else is replaced
+VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+
+class RequestContextMiddleware:
+    """
+    ASGI middleware giving every request an id and, when sampled, a trace.
+    
+    The id comes from the X-Request-ID request header when it looks like
+    one, or is generated; it is echoed in the response and available to
+    the rest of the request as current_request_id, and recorded on the
+    root span. Generated ids double as the trace id, so a request id read
+    from a response or log finds its trace directly. Ids sent by clients
+    never do: they could collide with, or join, unrelated traces. The root
+    span is named after the route template once routing has run.
+    """
+    
+    def __init__(self, app: ASGIApp, tracer: Tracer = TRACER):
+        self.app = app
+        self.tracer = tracer
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        trace_id = None
+        if request_id is None or not VALID_REQUEST_ID.fullmatch(request_id):
+            request_id = trace_id = os.urandom(16).hex()
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+        status_code = 500
+        
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
+        
+        method = scope["method"]
+        root = self.tracer.start_trace(
+            method,
+            attributes={"http.request.method": method, "url.path": scope["path"], "request.id": request_id},
+            trace_id=trace_id,
+        )
+        request_token = current_request_id.set(request_id)
+        if root is None:
+            try:
+                await self.app(scope, receive, send_with_request_id)
+            finally:
+                current_request_id.reset(request_token)
+            return
+        
+        span_token = current_span.set(root)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except BaseException as e:
+            root.record_error(e)
+            raise
+        finally:
+            current_span.reset(span_token)
+            current_request_id.reset(request_token)
+            route = getattr(scope.get("route"), "path", None)
+            if route:
+                root.name = f"{method} {route}"
+                root.set_attribute("http.route", route)
+            root.set_attribute("http.response.status_code", status_code)
+            self.tracer.end_trace(root)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Dict, Optional
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ...domain.content.entity import ContentStatus, ContentType
 
@@ -35,3 +35,16 @@ class ContentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+
+class ContentSummaryResponse(BaseModel):
+    """Response DTO for content in list views: an excerpt instead of the full body."""
+    id: UUID
+    content_type: ContentType
+    title: str
+    excerpt: str = Field(..., description="First characters of the body")
+    body_length: int = Field(..., description="Length of the full body in characters")
+    truncated: bool = Field(..., description="Whether the body continues after the excerpt")
+    metadata: Dict
+    status: ContentStatus
+    created_at: datetime
+    updated_at: datetime
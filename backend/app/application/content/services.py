@@ -1,14 +1,17 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 from datetime import datetime, timezone
 
-from ...domain.content.entity import Content, ContentType, ContentStatus
+from ...domain.content.entity import Content, ContentSummary, ContentType, ContentStatus
 from ...domain.content.repository import ContentRepository
 from ...domain.content.exceptions import ContentNotFoundError, InvalidContentTypeError
+from ...domain.pagination import PageCursor
 from ...domain.user.entity import UserRole
+from ...core.tracing import trace_methods
 from .dto import ContentResponse
 
 
+@trace_methods
 class ContentService:
     """Service for managing CMS content."""
     
@@ -129,35 +132,46 @@ class ContentService:
         
         return await self.content_repository.update(content)
     
-    async def list_content_admin(
+    async def find_content_admin(
         self,
         content_type: str,
         user_role: UserRole = None,
-    ) -> List[ContentResponse]:
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+        summary: bool = False,
+    ) -> Union[List[Content], List[ContentSummary]]:
         """
-        List content for admin (includes DRAFT and PUBLISHED).
-        Only ADMIN can access this.
+        Get content entities for admin (includes DRAFT and PUBLISHED), or their
+        summaries. Only ADMIN can access this.
         """
         if user_role != UserRole.ADMIN:
             raise PermissionError("Only ADMIN can list all content")
         
         content_type_enum = self._validate_content_type(content_type)
-        contents = await self.content_repository.get_by_type_for_admin(content_type_enum)
-        
-        return [self.to_dto(content) for content in contents]
+        if summary:
+            return await self.content_repository.get_summaries_by_type(
+                content_type_enum, limit=limit, after=after
+            )
+        return await self.content_repository.get_by_type_for_admin(
+            content_type_enum, limit=limit, after=after
+        )
     
-    async def list_content_public(
+    async def find_content_public(
         self,
         content_type: str,
-    ) -> List[ContentResponse]:
-        """
-        List published content for public access.
-        No authentication required (GUEST or USER can access).
-        """
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+        summary: bool = False,
+    ) -> Union[List[Content], List[ContentSummary]]:
+        """Get published content entities, or their summaries, for public access."""
         content_type_enum = self._validate_content_type(content_type)
-        contents = await self.content_repository.get_published_by_type(content_type_enum)
-        
-        return [self.to_dto(content) for content in contents]
+        if summary:
+            return await self.content_repository.get_summaries_by_type(
+                content_type_enum, status=ContentStatus.PUBLISHED, limit=limit, after=after
+            )
+        return await self.content_repository.get_published_by_type(
+            content_type_enum, limit=limit, after=after
+        )
     
     async def get_content_public(
         self,
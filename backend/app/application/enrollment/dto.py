@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -30,3 +30,19 @@ class BulkEnrollmentResponse(BaseModel):
     success: List[UUID] = Field(..., description="List of successfully enrolled registration IDs")
     failed: List[FailedEnrollmentItem] = Field(default_factory=list, description="List of failed enrollments with reasons")
 
+
+class ExamEnrollmentRequest(BaseModel):
+    """Request DTO for enrolling all registrations of an exam."""
+    statuses: Optional[List[RegistrationStatus]] = Field(
+        None,
+        description="Only enroll registrations in these statuses (defaults to all enrollable statuses)",
+    )
+    dry_run: bool = Field(False, description="Only count the registrations that would be enrolled")
+
+
+class ExamEnrollmentResponse(BaseModel):
+    """Response DTO for enrolling all registrations of an exam."""
+    exam_id: UUID
+    matched: int = Field(..., description="Number of registrations eligible for enrollment")
+    enrolled: int = Field(..., description="Number of registrations enrolled (0 for a dry run)")
+    dry_run: bool = False
@@ -1,29 +1,31 @@
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional, Set
 from uuid import UUID
 
 from ...domain.registration.repository import RegistrationRepository
+from ...domain.exam.repository import ExamRepository
+from ...domain.exam.exceptions import ExamNotFoundError
 from ...domain.registration.entity import RegistrationStatus
-from ...domain.registration.exceptions import RegistrationNotFoundError
+from ...domain.registration.transitions import ENROLL
 from ...domain.user.entity import UserRole
-from .dto import EnrollmentResponse, BulkEnrollmentResponse, FailedEnrollmentItem
+from ...core.tracing import trace_methods
+from .dto import EnrollmentResponse, BulkEnrollmentResponse, FailedEnrollmentItem, ExamEnrollmentResponse
 
 
+@trace_methods
 class EnrollmentService:
     """Service for handling enrollment operations."""
     
     # Valid statuses that can be enrolled
-    ENROLLABLE_STATUSES = {
-        RegistrationStatus.PAID,
-        RegistrationStatus.REGISTERED,
-        RegistrationStatus.PAYMENT_PENDING,
-    }
+    ENROLLABLE_STATUSES = set(ENROLL.sources)
     
     def __init__(
         self,
         registration_repository: RegistrationRepository,
+        exam_repository: Optional[ExamRepository] = None,
     ):
         self.registration_repository = registration_repository
+        self.exam_repository = exam_repository
     
     async def enroll_registration(
         self,
@@ -51,29 +53,10 @@ class EnrollmentService:
         if admin_role != UserRole.ADMIN:
             raise PermissionError("Only ADMIN can enroll registrations")
         
-        registration = await self.registration_repository.get_by_id(registration_id)
-        if not registration:
-            raise RegistrationNotFoundError(f"Registration {registration_id} not found")
-        
-        # Check if already enrolled
-        if registration.status == RegistrationStatus.ENROLLED:
-            raise ValueError(
-                f"Registration {registration_id} is already ENROLLED"
-            )
-        
-        # Check if status is enrollable
-        if registration.status not in self.ENROLLABLE_STATUSES:
-            raise ValueError(
-                f"Cannot enroll registration in {registration.status.value} status. "
-                f"Must be one of: {', '.join(s.value for s in self.ENROLLABLE_STATUSES)}"
-            )
-        
-        # Perform atomic status update
-        # We allow enrollment from any of the enrollable statuses
-        updated_registration = await self.registration_repository.update_status(
-            registration_id,
-            RegistrationStatus.ENROLLED,
-            expected_statuses=self.ENROLLABLE_STATUSES,
+        # Atomic update from any of the enrollable statuses; the registration
+        # is only read when it fails, to explain why
+        updated_registration = await self.registration_repository.apply_transition(
+            registration_id, ENROLL
         )
         
         return {
@@ -91,6 +74,8 @@ class EnrollmentService:
         """
         Bulk enroll multiple registrations.
         Allows partial success - some registrations may fail while others succeed.
+        All registrations are enrolled with a single bulk_update_status call;
+        failure reasons match those of enroll_registration.
         
         Args:
             registration_ids: List of registration IDs to enroll
@@ -106,40 +91,93 @@ class EnrollmentService:
         if admin_role != UserRole.ADMIN:
             raise PermissionError("Only ADMIN can bulk enroll registrations")
         
+        registrations, enrolled = await self.registration_repository.bulk_update_status(
+            registration_ids,
+            RegistrationStatus.ENROLLED,
+            expected_statuses=self.ENROLLABLE_STATUSES,
+        )
+        
         success_ids: List[UUID] = []
         failed_items: List[FailedEnrollmentItem] = []
         
         for registration_id in registration_ids:
-            try:
-                # Try to enroll this registration
-                await self.enroll_registration(registration_id, admin_id, admin_role)
+            if registration_id in enrolled:
                 success_ids.append(registration_id)
-            except RegistrationNotFoundError as e:
-                failed_items.append(
-                    FailedEnrollmentItem(
-                        registration_id=registration_id,
-                        reason=f"Registration not found: {str(e)}"
-                    )
-                )
-            except ValueError as e:
-                # Already enrolled or invalid status
-                failed_items.append(
-                    FailedEnrollmentItem(
-                        registration_id=registration_id,
-                        reason=str(e)
-                    )
-                )
-            except Exception as e:
-                # Catch any other unexpected errors
-                failed_items.append(
-                    FailedEnrollmentItem(
-                        registration_id=registration_id,
-                        reason=f"Unexpected error: {str(e)}"
-                    )
+                # A repeated ID finds its registration already enrolled
+                enrolled.discard(registration_id)
+                continue
+            
+            registration = registrations.get(registration_id)
+            error = ENROLL.rejection(registration_id, registration)
+            reason = str(error) if error else f"Registration {registration_id} changed concurrently, try again"
+            if not registration:
+                reason = f"Registration not found: {reason}"
+            failed_items.append(
+                FailedEnrollmentItem(
+                    registration_id=registration_id,
+                    reason=reason,
                 )
+            )
         
         return BulkEnrollmentResponse(
             success=success_ids,
             failed=failed_items,
         )
-
+    
+    async def enroll_exam_registrations(
+        self,
+        exam_id: UUID,
+        admin_id: UUID,
+        admin_role: UserRole,
+        statuses: Optional[Set[RegistrationStatus]] = None,
+        dry_run: bool = False,
+    ) -> ExamEnrollmentResponse:
+        """
+        Enroll every registration of an exam in one server-side update.
+        
+        Args:
+            exam_id: ID of the exam whose registrations to enroll
+            admin_id: ID of the admin performing the enrollment
+            admin_role: Role of the user performing the enrollment
+            statuses: Only enroll registrations in these statuses (defaults to ENROLLABLE_STATUSES)
+            dry_run: If True, only count the registrations that would be enrolled
+        
+        Returns:
+            ExamEnrollmentResponse with matched and enrolled counts
+        
+        Raises:
+            PermissionError: If user is not ADMIN
+            ExamNotFoundError: If exam not found
+            ValueError: If statuses contains a status that cannot be enrolled
+        """
+        if admin_role != UserRole.ADMIN:
+            raise PermissionError("Only ADMIN can enroll registrations")
+        
+        if statuses:
+            invalid = set(statuses) - self.ENROLLABLE_STATUSES
+            if invalid:
+                raise ValueError(
+                    f"Cannot enroll registrations in {', '.join(sorted(s.value for s in invalid))} status. "
+                    f"Must be one of: {', '.join(s.value for s in self.ENROLLABLE_STATUSES)}"
+                )
+            expected_statuses = set(statuses)
+        else:
+            expected_statuses = set(self.ENROLLABLE_STATUSES)
+        
+        if self.exam_repository is not None:
+            exam = await self.exam_repository.get_by_id(exam_id)
+            if not exam:
+                raise ExamNotFoundError(f"Exam with id {exam_id} not found")
+        
+        if dry_run:
+            matched = await self.registration_repository.count_by_exam_id(
+                exam_id, statuses=expected_statuses
+            )
+            return ExamEnrollmentResponse(exam_id=exam_id, matched=matched, enrolled=0, dry_run=True)
+        
+        enrolled = await self.registration_repository.update_status_by_exam_id(
+            exam_id,
+            RegistrationStatus.ENROLLED,
+            expected_statuses=expected_statuses,
+        )
+        return ExamEnrollmentResponse(exam_id=exam_id, matched=enrolled, enrolled=enrolled)
@@ -1,13 +1,17 @@
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional
 from uuid import UUID
 
 from ...domain.exam.entity import Exam, ExamStatus
 from ...domain.exam.exceptions import ExamNotFoundError
 from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor
 from ...domain.user.entity import UserRole
+from ...core.tracing import trace_methods
 from .dto import ExamCreateRequest, ExamResponse, ExamUpdateRequest
 
 
+@trace_methods
 class ExamService:
     """Application service for exam operations."""
     
@@ -51,12 +55,17 @@ class ExamService:
         
         return exam
     
-    async def list_exams(self, user_role: UserRole) -> List[Exam]:
+    async def list_exams(
+        self,
+        user_role: UserRole,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
         """List exams. ADMIN sees all, USER sees only ACTIVE."""
         if user_role == UserRole.ADMIN:
-            return await self.exam_repository.get_all()
+            return await self.exam_repository.get_all(limit=limit, after=after)
         else:
-            return await self.exam_repository.get_active()
+            return await self.exam_repository.get_active(limit=limit, after=after)
     
     async def update_exam(
         self,
@@ -99,6 +108,7 @@ class ExamService:
             if exam.start_date >= exam.end_date:
                 raise ValueError("start_date must be before end_date")
         
+        exam.updated_at = datetime.now(timezone.utc)
         return await self.exam_repository.update(exam)
     
     @staticmethod
@@ -1,4 +1,4 @@
-from typing import List
+from typing import AsyncIterator, Dict, List
 from uuid import UUID
 import csv
 import io
@@ -6,14 +6,34 @@ import io
 from ...domain.registration.repository import RegistrationRepository
 from ...domain.exam.repository import ExamRepository
 from ...domain.user.repository import UserRepository
-from ...domain.registration.entity import RegistrationStatus
+from ...domain.registration.entity import ExamRegistration, RegistrationStatus
+from ...domain.user.entity import UserContact
 from ...domain.exam.exceptions import ExamNotFoundError
-from .dto import CSVRegistrationRow
+from ...core.tracing import trace_methods
 
 
+@trace_methods
 class ExportService:
     """Service for exporting registrations to CSV."""
     
+    # Number of registrations read per page; each page costs one get_contacts_by_ids call
+    USER_BATCH_SIZE = 1000
+    
+    # Column order of the exported CSV
+    CSV_FIELDNAMES = [
+        "registration_id",
+        "user_id",
+        "user_name",
+        "email",
+        "mobile",
+        "registration_status",
+        "enrollment_status",
+        "payment_status",
+        "paid_at",
+        "enrolled_at",
+        "registered_at",
+    ]
+    
     def __init__(
         self,
         registration_repository: RegistrationRepository,
@@ -51,6 +71,30 @@ class ExportService:
         Returns:
             CSV content as string
         
+        Raises:
+            ExamNotFoundError: If exam not found
+        """
+        chunks = await self.stream_exam_registrations_csv(exam_id)
+        return "".join([chunk async for chunk in chunks])
+    
+    async def stream_exam_registrations_csv(
+        self,
+        exam_id: UUID,
+    ) -> AsyncIterator[str]:
+        """
+        Export all registrations for an exam as a stream of CSV chunks.
+        
+        The exam is verified before this method returns, so a missing exam
+        is reported before any output is produced. The returned iterator
+        yields the header first and then one chunk per page of registrations,
+        keeping memory flat regardless of exam size.
+        
+        Args:
+            exam_id: ID of the exam to export registrations for
+        
+        Returns:
+            Async iterator of CSV text chunks
+        
         Raises:
             ExamNotFoundError: If exam not found
         """
@@ -59,89 +103,74 @@ class ExportService:
         if not exam:
             raise ExamNotFoundError(f"Exam with id {exam_id} not found")
         
-        # Get all registrations for the exam
-        registrations = await self.registration_repository.get_by_exam_id(exam_id)
+        return self._iter_csv_chunks(exam_id)
+    
+    async def _iter_csv_chunks(self, exam_id: UUID) -> AsyncIterator[str]:
+        """Yield the CSV header, then one CSV chunk per page of registrations."""
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=self.CSV_FIELDNAMES)
+        writer.writeheader()
+        yield self._drain(output)
         
-        # Build CSV rows
-        csv_rows: List[CSVRegistrationRow] = []
+        pages = self.registration_repository.iter_by_exam_id(
+            exam_id, batch_size=self.USER_BATCH_SIZE
+        )
+        async for registrations in pages:
+            users = await self.user_repository.get_contacts_by_ids(
+                registration.user_id for registration in registrations
+            )
+            writer.writerows(self._build_records(registrations, users))
+            chunk = self._drain(output)
+            if chunk:
+                yield chunk
+    
+    def _build_records(
+        self,
+        registrations: List[ExamRegistration],
+        users: Dict[UUID, UserContact],
+    ) -> List[Dict[str, str]]:
+        """Build CSV records for a page of registrations and their users."""
+        records: List[Dict[str, str]] = []
         for registration in registrations:
-            # Get user details
-            user = await self.user_repository.get_by_id(registration.user_id)
+            user = users.get(registration.user_id)
             if not user:
                 continue  # Skip if user not found
             
-            # Derive statuses
-            enrollment_status = self._derive_enrollment_status(registration.status)
-            payment_status = self._derive_payment_status(registration.status)
-            
             # Determine paid_at and enrolled_at
-            paid_at = None
-            enrolled_at = None
+            paid_at = ""
+            enrolled_at = ""
+            registered_at = registration.created_at.isoformat()
             
             if registration.status in [RegistrationStatus.PAID, RegistrationStatus.ENROLLED]:
                 # For simplicity, use created_at as paid_at if status is PAID or ENROLLED
                 # In a real system, you'd track payment timestamps separately
-                paid_at = registration.created_at
+                paid_at = registered_at
             
             if registration.status == RegistrationStatus.ENROLLED:
                 # For simplicity, use created_at as enrolled_at
                 # In a real system, you'd track enrollment timestamps separately
-                enrolled_at = registration.created_at
+                enrolled_at = registered_at
             
-            csv_row = CSVRegistrationRow(
-                registration_id=registration.id,
-                user_id=user.id,
-                user_name=user.name,
-                email=user.email,
-                mobile=user.mobile,
-                registration_status=registration.status.value,
-                enrollment_status=enrollment_status,
-                payment_status=payment_status,
-                paid_at=paid_at,
-                enrolled_at=enrolled_at,
-                registered_at=registration.created_at,
-            )
-            csv_rows.append(csv_row)
-        
-        # Generate CSV content
-        return self._generate_csv(csv_rows)
-    
-    def _generate_csv(self, rows: List[CSVRegistrationRow]) -> str:
-        """Generate CSV content from rows."""
-        output = io.StringIO()
-        
-        # Define column order
-        fieldnames = [
-            "registration_id",
-            "user_id",
-            "user_name",
-            "email",
-            "mobile",
-            "registration_status",
-            "enrollment_status",
-            "payment_status",
-            "paid_at",
-            "enrolled_at",
-            "registered_at",
-        ]
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for row in rows:
-            writer.writerow({
-                "registration_id": str(row.registration_id),
-                "user_id": str(row.user_id),
-                "user_name": row.user_name,
-                "email": row.email,
-                "mobile": row.mobile or "",
-                "registration_status": row.registration_status,
-                "enrollment_status": row.enrollment_status,
-                "payment_status": row.payment_status,
-                "paid_at": row.paid_at.isoformat() if row.paid_at else "",
-                "enrolled_at": row.enrolled_at.isoformat() if row.enrolled_at else "",
-                "registered_at": row.registered_at.isoformat(),
+            records.append({
+                "registration_id": str(registration.id),
+                "user_id": str(user.id),
+                "user_name": user.name,
+                "email": user.email,
+                "mobile": user.mobile or "",
+                "registration_status": registration.status.value,
+                "enrollment_status": self._derive_enrollment_status(registration.status),
+                "payment_status": self._derive_payment_status(registration.status),
+                "paid_at": paid_at,
+                "enrolled_at": enrolled_at,
+                "registered_at": registered_at,
             })
         
-        return output.getvalue()
-
+        return records
+    
+    @staticmethod
+    def _drain(output: io.StringIO) -> str:
+        """Return buffered CSV text and reset the buffer for reuse."""
+        chunk = output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+        return chunk
@@ -1,15 +1,16 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from ...domain.exam.entity import ExamStatus
 from ...domain.exam.exceptions import ExamNotFoundError
 from ...domain.exam.repository import ExamRepository
-from ...domain.registration.entity import RegistrationStatus
-from ...domain.registration.exceptions import RegistrationNotFoundError
 from ...domain.registration.repository import RegistrationRepository
+from ...domain.registration.transitions import CONFIRM_PAYMENT, INITIATE_PAYMENT
 from ...domain.user.entity import UserRole
 from ...domain.user.repository import UserRepository
+from ...core.tracing import trace_methods
 
 
+@trace_methods
 class PaymentService:
     """Application service for payment operations."""
     
@@ -37,26 +38,28 @@ class PaymentService:
         - Only USER role can initiate payment
         - Registration must be in REGISTERED status
         - Exam must be ACTIVE (not DRAFT)
+        
+        The registration is read to find its exam, and every rule is checked
+        before anything is written. The atomic update then re-checks
+        ownership and Business Rule 1 in its filter, so a concurrent change
+        cannot slip in between.
+        
+        Unlike confirm_payment and enrollment this takes two round trips to
+        the registrations: Business Rule 3 depends on the exam, which lives
+        in another collection and cannot be part of the update's filter.
+        Checking it after the update would instead need a compensating
+        write for DRAFT exams.
         """
         if user_role != UserRole.USER:
             raise PermissionError("Only USER role can initiate payment")
         
-        # Get registration
+        # Ownership and Business Rule 1: Cannot initiate payment unless status = REGISTERED
         registration = await self.registration_repository.get_by_id(registration_id)
-        if not registration:
-            raise RegistrationNotFoundError(f"Registration with id {registration_id} not found")
-        
-        # Verify ownership
-        if registration.user_id != user_id:
-            raise PermissionError("Cannot initiate payment for another user's registration")
+        error = INITIATE_PAYMENT.rejection(registration_id, registration, user_id)
+        if error:
+            raise error
         
-        # Business Rule 1: Cannot initiate payment unless status = REGISTERED
-        if registration.status != RegistrationStatus.REGISTERED:
-            raise ValueError(
-                f"Cannot initiate payment. Registration status must be REGISTERED, but is {registration.status.value}"
-            )
-        
-        # Business Rule 3: Cannot pay for DRAFT exam
+        # Business Rule 3: Cannot pay for DRAFT exam (exams are usually cached)
         exam = await self.exam_repository.get_by_id(registration.exam_id)
         if not exam:
             raise ExamNotFoundError(f"Exam with id {registration.exam_id} not found")
@@ -65,13 +68,9 @@ class PaymentService:
             raise ValueError("Cannot initiate payment for DRAFT exam")
         
         # Atomic update: REGISTERED → PAYMENT_PENDING
-        updated_registration = await self.registration_repository.update_status(
-            registration_id=registration_id,
-            new_status=RegistrationStatus.PAYMENT_PENDING,
-            expected_status=RegistrationStatus.REGISTERED,
+        return await self.registration_repository.apply_transition(
+            registration_id, INITIATE_PAYMENT, user_id=user_id
         )
-        
-        return updated_registration
     
     async def confirm_payment(
         self,
@@ -91,28 +90,9 @@ class PaymentService:
         if user_role != UserRole.USER:
             raise PermissionError("Only USER role can confirm payment")
         
-        # Get registration
-        registration = await self.registration_repository.get_by_id(registration_id)
-        if not registration:
-            raise RegistrationNotFoundError(f"Registration with id {registration_id} not found")
-        
-        # Verify ownership
-        if registration.user_id != user_id:
-            raise PermissionError("Cannot confirm payment for another user's registration")
-        
-        # Business Rule 2: Cannot confirm payment unless status = PAYMENT_PENDING
-        if registration.status != RegistrationStatus.PAYMENT_PENDING:
-            raise ValueError(
-                f"Cannot confirm payment. Registration status must be PAYMENT_PENDING, but is {registration.status.value}"
-            )
-        
-        # Business Rule 4: Cannot confirm payment twice (enforced by atomic update)
-        # Atomic update: PAYMENT_PENDING → PAID
-        updated_registration = await self.registration_repository.update_status(
-            registration_id=registration_id,
-            new_status=RegistrationStatus.PAID,
-            expected_status=RegistrationStatus.PAYMENT_PENDING,
+        # Ownership, Business Rule 2 and Business Rule 4 (cannot confirm
+        # twice) are all enforced by the atomic update: PAYMENT_PENDING → PAID
+        return await self.registration_repository.apply_transition(
+            registration_id, CONFIRM_PAYMENT, user_id=user_id
         )
-        
-        return updated_registration
 
@@ -1,35 +1,51 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from ...domain.exam.exceptions import ExamNotFoundError
 from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor
+from ...domain.registration.queries import RegistrationUserQuery
 from ...domain.registration.repository import RegistrationRepository
 from ...domain.user.entity import UserRole
 from ...domain.user.repository import UserRepository
-from .dto import RegistrationWithUserResponse, UserInfoDTO
+from ...core.tracing import trace_methods
+from .dto import RegistrationWithUserResponse
 
 
+@trace_methods
 class AdminRegistrationQueryService:
-    """Query service for admin to view exam registrations."""
+    """
+    Query service for admin to view exam registrations.
+    
+    Registrations are joined with their users by registration_user_query
+    when the storage provides one, otherwise here with one batched user
+    lookup per page.
+    """
     
     def __init__(
         self,
         registration_repository: RegistrationRepository,
         exam_repository: ExamRepository,
         user_repository: UserRepository,
+        registration_user_query: Optional[RegistrationUserQuery] = None,
     ):
         self.registration_repository = registration_repository
         self.exam_repository = exam_repository
         self.user_repository = user_repository
+        self.registration_user_query = registration_user_query
     
     async def get_exam_registrations(
         self,
         exam_id: UUID,
         user_role: UserRole,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
     ) -> List[RegistrationWithUserResponse]:
         """
         Get all registrations for an exam with user details.
         Only ADMIN can access this endpoint.
+        Rows are ordered by (registered_at, registration_id) and can be
+        fetched one page at a time.
         """
         # Business Rule 1: Only ADMIN can access
         if user_role != UserRole.ADMIN:
@@ -40,27 +56,51 @@ class AdminRegistrationQueryService:
         if not exam:
             raise ExamNotFoundError(f"Exam with id {exam_id} not found")
         
-        # Get all registrations for this exam
-        registrations = await self.registration_repository.get_by_exam_id(exam_id)
-        
-        # Join with user data at application layer
-        result = []
-        for registration in registrations:
-            user = await self.user_repository.get_by_id(registration.user_id)
-            if user:
-                result.append(
-                    RegistrationWithUserResponse(
-                        registration_id=registration.id,
-                        user=UserInfoDTO(
-                            id=user.id,
-                            name=user.name,
-                            email=user.email,
-                            mobile=user.mobile,
-                        ),
-                        status=registration.status,
-                        registered_at=registration.created_at,
-                    )
-                )
-        
-        return result
-
+        if self.registration_user_query:
+            rows = await self.registration_user_query.get_with_users_by_exam_id(
+                exam_id, limit=limit, after=after
+            )
+        else:
+            rows = await self._join_users(exam_id, limit, after)
+        return [RegistrationWithUserResponse.model_validate(row) for row in rows]
+    
+    async def _join_users(
+        self,
+        exam_id: UUID,
+        limit: Optional[int],
+        after: Optional[PageCursor],
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a page of registrations, then its users with a single
+        get_contacts_by_ids call. Registrations whose user no longer exists
+        are dropped, and further registrations are read until the page is
+        full, as the storage-side join does; a short page means the end.
+        """
+        rows: List[Dict[str, Any]] = []
+        while True:
+            wanted = None if limit is None else limit - len(rows)
+            registrations = await self.registration_repository.get_by_exam_id(
+                exam_id, limit=wanted, after=after
+            )
+            users = await self.user_repository.get_contacts_by_ids(
+                registration.user_id for registration in registrations
+            )
+            
+            for registration in registrations:
+                user = users.get(registration.user_id)
+                if user:
+                    rows.append({
+                        "registration_id": registration.id,
+                        "status": registration.status,
+                        "registered_at": registration.created_at,
+                        "user": {
+                            "id": user.id,
+                            "name": user.name,
+                            "email": user.email,
+                            "mobile": user.mobile,
+                        },
+                    })
+            
+            after = PageCursor.after_page(registrations, wanted)
+            if after is None or len(rows) == limit:
+                return rows
@@ -1,18 +1,21 @@
-from typing import List
+import asyncio
+from typing import List, Optional
 from uuid import UUID
 
 from ...domain.exam.entity import ExamStatus
 from ...domain.exam.exceptions import ExamNotFoundError
 from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor
 from ...domain.registration.entity import ExamRegistration, RegistrationStatus
-from ...domain.registration.exceptions import DuplicateRegistrationError
 from ...domain.registration.repository import RegistrationRepository
 from ...domain.user.entity import User
 from ...domain.user.exceptions import UserNotFoundError
 from ...domain.user.repository import UserRepository
+from ...core.tracing import trace_methods
 from .dto import RegistrationResponse
 
 
+@trace_methods
 class RegistrationService:
     """Application service for registration operations."""
     
@@ -31,9 +34,19 @@ class RegistrationService:
         user_id: UUID,
         exam_id: UUID,
     ) -> ExamRegistration:
-        """Register a user for an exam. Enforces all business rules."""
+        """
+        Register a user for an exam. Enforces all business rules.
+        
+        The user and exam are looked up concurrently. Duplicate registrations
+        are detected by the repository on create (unique user/exam index)
+        rather than by a separate read.
+        """
+        user, exam = await asyncio.gather(
+            self.user_repository.get_by_id(user_id),
+            self.exam_repository.get_by_id(exam_id),
+        )
+        
         # Business Rule 1: User must have mobile (profile complete)
-        user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundError(f"User with id {user_id} not found")
         
@@ -41,7 +54,6 @@ class RegistrationService:
             raise ValueError("User profile must be complete (mobile number required) to register for exams")
         
         # Business Rule 2: Exam must exist
-        exam = await self.exam_repository.get_by_id(exam_id)
         if not exam:
             raise ExamNotFoundError(f"Exam with id {exam_id} not found")
         
@@ -50,15 +62,7 @@ class RegistrationService:
             raise ValueError("Cannot register for DRAFT exam. Only ACTIVE exams can be registered for.")
         
         # Business Rule 4: Cannot register twice for same exam
-        existing_registration = await self.registration_repository.get_by_user_and_exam(
-            user_id, exam_id
-        )
-        if existing_registration:
-            raise DuplicateRegistrationError(
-                f"User {user_id} is already registered for exam {exam_id}"
-            )
-        
-        # Create registration
+        # (create raises DuplicateRegistrationError)
         registration = ExamRegistration(
             user_id=user_id,
             exam_id=exam_id,
@@ -67,13 +71,20 @@ class RegistrationService:
         
         return await self.registration_repository.create(registration)
     
-    async def get_user_registrations(self, user_id: UUID) -> List[ExamRegistration]:
+    async def get_user_registrations(
+        self,
+        user_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
         """Get all registrations for a user."""
         user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundError(f"User with id {user_id} not found")
         
-        return await self.registration_repository.get_by_user_id(user_id)
+        return await self.registration_repository.get_by_user_id(
+            user_id, limit=limit, after=after
+        )
     
     @staticmethod
     def to_dto(registration: ExamRegistration) -> RegistrationResponse:
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
 from ...domain.user.entity import UserRole
 
@@ -10,7 +10,13 @@ from ...domain.user.entity import UserRole
 class GoogleLoginRequest(BaseModel):
     """DTO for Google login request."""
     email: EmailStr
-    name: str = Field(..., min_length=1)
+    name: str
+    
+    @model_validator(mode="after")
+    def normalize_name(self) -> "GoogleLoginRequest":
+        """Strip the name, falling back to the email's local part when it is blank."""
+        self.name = self.name.strip() or self.email.split("@", 1)[0]
+        return self
 
 
 class MobileUpdateRequest(BaseModel):
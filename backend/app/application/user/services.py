@@ -4,9 +4,11 @@ from uuid import UUID
 from ...domain.user.entity import User, UserRole
 from ...domain.user.exceptions import UserNotFoundError
 from ...domain.user.repository import UserRepository
+from ...core.tracing import trace_methods
 from .dto import GoogleLoginRequest, MobileUpdateRequest, UserResponse
 
 
+@trace_methods
 class UserService:
     """Application service for user operations."""
     
@@ -14,30 +16,35 @@ class UserService:
         self.user_repository = user_repository
     
     async def login_with_google(self, request: GoogleLoginRequest) -> User:
-        """Handle Google login - create user if not exists, return existing if exists."""
-        existing_user = await self.user_repository.get_by_email(request.email)
+        """
+        Handle Google login - create user if not exists, return existing if exists.
         
-        if existing_user:
-            return existing_user
-        
-        # Create new user
+        One atomic upsert, so a user signing in from two tabs at once gets
+        the same account instead of a duplicate email error.
+        """
         new_user = User(
             email=request.email,
             name=request.name,
             role=UserRole.USER,
         )
         
-        return await self.user_repository.create(new_user)
+        return await self.user_repository.upsert_by_email(new_user)
     
     async def update_mobile(self, user_id: UUID, request: MobileUpdateRequest) -> User:
-        """Update user's mobile number."""
+        """
+        Update user's mobile number.
+        
+        The user may come from a cache, so only the validated mobile number
+        is written; writing the whole user back could undo a role change
+        made elsewhere in the meantime.
+        """
         user = await self.user_repository.get_by_id(user_id)
         
         if not user:
             raise UserNotFoundError(f"User with id {user_id} not found")
         
         user.update_mobile(request.mobile)
-        return await self.user_repository.update(user)
+        return await self.user_repository.update_mobile(user.id, user.mobile)
     
     async def get_user_by_id(self, user_id: UUID) -> User:
         """Get user by ID."""
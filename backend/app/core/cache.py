@@ -0,0 +1,135 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with per-entry expiry and LRU eviction.
+    
+    Entries expire ttl seconds after they are stored; when the cache is full
+    the least recently used entry is evicted. Entries can carry tags, and
+    invalidate_tag() evicts every entry with a given tag. Hit, miss and
+    eviction counters are kept for monitoring. Not thread-safe: intended to
+    be used from the event loop only.
+    
+    Read-through callers should take generation before loading a value and
+    pass it to set(): if anything was invalidated in the meantime the value
+    may be stale and is not stored.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, FrozenSet[Hashable]]]" = OrderedDict()
+        self._keys_by_tag: Dict[Hashable, Set[Hashable]] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, value, _ = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[Hashable] = (),
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store a value, optionally with a shorter or longer ttl than the default.
+        
+        If generation is given and anything was invalidated since it was
+        read, the value is not stored.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        
+        if key in self._entries:
+            self._remove(key)
+        tags = frozenset(tags)
+        self._entries[key] = (self._clock() + (ttl if ttl is not None else self.ttl), value, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a value if present."""
+        self.generation += 1
+        self._remove(key)
+    
+    def invalidate_tag(self, *tags: Hashable) -> None:
+        """Remove every value stored with any of the given tags."""
+        self.generation += 1
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+    
+    def clear(self) -> None:
+        """Remove all values. Counters are kept."""
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+    
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and unlink it from its tags."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache size and counters."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
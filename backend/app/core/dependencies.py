@@ -4,10 +4,13 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from ..core.security import TokenData, verify_token
+from ..core.security import Principal, TokenData, role_versions, verify_token
+from ..core.tracing import span
 from ..domain.exam.repository import ExamRepository
+from ..domain.idempotency.repository import IdempotencyRepository
+from ..domain.registration.queries import RegistrationUserQuery
 from ..domain.registration.repository import RegistrationRepository
-from ..domain.user.entity import User, UserRole
+from ..domain.user.entity import User, UserAccess, UserRole
 from ..domain.user.exceptions import UserNotFoundError
 from ..domain.user.repository import UserRepository
 
@@ -30,13 +33,10 @@ def get_user_repository() -> UserRepository:
     return _user_repository
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_repository: UserRepository = Depends(get_user_repository),
-) -> User:
-    """Dependency to get current authenticated user."""
-    token = credentials.credentials
-    token_data = verify_token(token)
+def _verified_token(credentials: HTTPAuthorizationCredentials) -> TokenData:
+    """Verify the bearer token or raise 401."""
+    with span("auth.verify_token"):
+        token_data = verify_token(credentials.credentials)
     
     if token_data is None:
         raise HTTPException(
@@ -45,23 +45,77 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    return token_data
+
+
+def _user_not_found() -> HTTPException:
+    """401 for a valid token whose user no longer exists."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="User not found",
+    )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> User:
+    """Dependency to get current authenticated user."""
+    token_data = _verified_token(credentials)
+    
     user = await user_repository.get_by_id(token_data.user_id)
     
     if user is None:
+        raise _user_not_found()
+    
+    return user
+
+
+async def get_current_user_access(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> UserAccess:
+    """
+    Dependency to get the id, role and mobile of the current authenticated user.
+    Reads only those fields; use it instead of get_current_user when the
+    endpoint needs nothing else.
+    """
+    token_data = _verified_token(credentials)
+    
+    access = await user_repository.get_access_by_id(token_data.user_id)
+    
+    if access is None:
+        raise _user_not_found()
+    
+    return access
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> Principal:
+    """
+    Dependency to get the id and role of the caller from the token alone.
+    Does no database read: use it for endpoints that authorize by role.
+    Tokens issued before the user's role last changed are rejected, so
+    the client signs in again and receives the new role.
+    """
+    token_data = _verified_token(credentials)
+    
+    if not role_versions.is_current(token_data):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Role has changed, please sign in again",
+            headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return user
+    return Principal.from_token(token_data)
 
 
 async def get_current_user_role(
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
 ) -> UserRole:
-    """Dependency to get current user's role."""
-    from ..domain.user.entity import UserRole
-    return current_user.role
+    """Dependency to get current user's role, from the token alone."""
+    return principal.role
 
 
 # Exam repository dependency
@@ -98,6 +152,39 @@ def get_registration_repository() -> RegistrationRepository:
     return _registration_repository
 
 
+# Registration/user join query dependency; optional, services join in
+# the application when there is none
+_registration_user_query: Optional[RegistrationUserQuery] = None
+
+
+def set_registration_user_query(query: Optional[RegistrationUserQuery]) -> None:
+    """Set the registration/user join query instance."""
+    global _registration_user_query
+    _registration_user_query = query
+
+
+def get_registration_user_query() -> Optional[RegistrationUserQuery]:
+    """Get the registration/user join query instance, if any."""
+    return _registration_user_query
+
+
+# Idempotency repository dependency
+_idempotency_repository: Optional[IdempotencyRepository] = None
+
+
+def set_idempotency_repository(repository: IdempotencyRepository) -> None:
+    """Set the idempotency repository instance."""
+    global _idempotency_repository
+    _idempotency_repository = repository
+
+
+def get_idempotency_repository() -> IdempotencyRepository:
+    """Get the idempotency repository instance."""
+    if _idempotency_repository is None:
+        raise RuntimeError("Idempotency repository not initialized")
+    return _idempotency_repository
+
+
 # Content repository dependency
 from typing import TYPE_CHECKING
 
@@ -0,0 +1,227 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds (the Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value; integral values are written without a fraction."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set as {name="value",...}, or nothing when there are no labels."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """
+    Base class of a named metric with a fixed set of label names.
+    
+    Every label combination is one series, stored in a dict keyed by the
+    tuple of label values. Metrics are also updated from other threads
+    (pymongo command listeners run on Motor's workers), so each metric has
+    a lock held while recording a sample and while samples() copies the
+    series; rendering never iterates a dict that another thread is adding
+    a series to. Keep label values low-cardinality (route templates, not
+    raw paths).
+    """
+    
+    type_name = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def samples(self) -> Iterable[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """Yield (name, label names, label values, value) for every sample."""
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for name, labelnames, labelvalues, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count, e.g. requests served."""
+    
+    type_name = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+    
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """Increase the series with the given label values."""
+        values = self._values
+        with self._lock:
+            values[labels] = values.get(labels, 0) + amount
+    
+    def get(self, labels: Labels = ()) -> float:
+        """Current value of a series (0 if it was never increased)."""
+        return self._values.get(labels, 0)
+    
+    def samples(self):
+        with self._lock:
+            series = sorted(self._values.items())
+        for labels, value in series:
+            yield self.name, self.labelnames, labels, value
+
+
+class Gauge(Counter):
+    """Value that goes up and down, e.g. requests in flight."""
+    
+    type_name = "gauge"
+    
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        """Decrease the series with the given label values."""
+        values = self._values
+        with self._lock:
+            values[labels] = values.get(labels, 0) - amount
+    
+    def set(self, value: float, labels: Labels = ()) -> None:
+        """Set the series with the given label values."""
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values over fixed buckets, e.g. request latency.
+    
+    Each series keeps one count per bucket plus the sum of observations;
+    an observation increments a single bucket (found by bisection), and the
+    cumulative counts Prometheus expects are only computed when rendering.
+    """
+    
+    type_name = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets:
+            raise ValueError("buckets must not be empty")
+        # [count per bucket..., count above the last bucket, sum]
+        self._series: Dict[Labels, List[float]] = {}
+    
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """Record one observation in the series with the given label values."""
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[bucket] += 1
+            series[-1] += value
+    
+    def count(self, labels: Labels = ()) -> int:
+        """Number of observations in a series."""
+        with self._lock:
+            series = self._series.get(labels)
+            return sum(series[:-1]) if series else 0
+    
+    def samples(self):
+        bucket_labelnames = self.labelnames + ("le",)
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        with self._lock:
+            snapshot = sorted((labels, list(series)) for labels, series in self._series.items())
+        for labels, series in snapshot:
+            cumulative = 0
+            for bound, count in zip(bounds, series[:-1]):
+                cumulative += count
+                yield f"{self.name}_bucket", bucket_labelnames, labels + (bound,), cumulative
+            yield f"{self.name}_count", self.labelnames, labels, cumulative
+            yield f"{self.name}_sum", self.labelnames, labels, series[-1]
+
+
+class MetricsRegistry:
+    """
+    Set of metrics exposed together on /metrics.
+    
+    counter(), gauge() and histogram() return the already registered metric
+    of that name, so independent components can share a registry without
+    coordinating who creates what, from any thread.
+    """
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _get_or_create(self, metric_type: type, name: str, *args, **kwargs) -> Metric:
+        """Return the metric registered under name, registering it first if needed."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(name, *args, **kwargs)
+        if type(metric) is not metric_type:
+            raise ValueError(f"Metric {name} is already registered as a {metric.type_name}")
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or register a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or register a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or register a histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+    
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines: List[str] = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Registry used by the application
+REGISTRY = MetricsRegistry()
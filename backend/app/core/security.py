@@ -1,27 +1,101 @@
+import hashlib
 import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 from jose import JWTError, jwt
 
 from ..domain.user.entity import UserRole
+from ..domain.user.repository import UserRepository
+from .cache import TTLCache
 
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", str(30 * 24 * 60)))  # 30 days
 
+# Verified-token cache (TOKEN_CACHE_MAX_SIZE=0 disables it). Entries never
+# outlive the token's own exp claim; the TTL only bounds how long a token
+# that stops being presented stays in memory.
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "3600"))
+
+_token_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+    if TOKEN_CACHE_MAX_SIZE > 0
+    else None
+)
+
 
 class TokenData:
     """Token payload data."""
-    def __init__(self, user_id: UUID, email: str, role: UserRole):
+    def __init__(self, user_id: UUID, email: str, role: UserRole, role_version: int = 0):
         self.user_id = user_id
         self.email = email
         self.role = role
+        self.role_version = role_version
+
 
+class Principal:
+    """
+    Caller identity taken from a verified access token, without a user lookup.
+    
+    Enough for endpoints that only authorize by role. The role is the one
+    the token was issued with; RoleVersions rejects tokens whose role has
+    since changed.
+    """
+    
+    __slots__ = ("id", "role")
+    
+    def __init__(self, id: UUID, role: UserRole):
+        self.id = id
+        self.role = role
+    
+    @classmethod
+    def from_token(cls, token_data: TokenData) -> "Principal":
+        """Build the principal from verified token claims."""
+        return cls(id=token_data.user_id, role=token_data.role)
+    
+    def __repr__(self):
+        return f"<Principal id={self.id} role={self.role.value}>"
+
+
+class RoleVersions:
+    """
+    In-process copy of the role version of every user whose role has changed.
+    
+    A token is current when it was issued at or after the user's latest
+    role version. The mapping is tiny (only users whose role ever changed)
+    and is refreshed in the background, so checking a token is a dict
+    lookup. A role change is therefore enforced within one refresh interval.
+    """
+    
+    def __init__(self):
+        self._versions: Dict[UUID, int] = {}
+    
+    def is_current(self, token_data: TokenData) -> bool:
+        """Check that a token's role has not changed since it was issued."""
+        return token_data.role_version >= self._versions.get(token_data.user_id, 0)
+    
+    def replace(self, versions: Dict[UUID, int]) -> None:
+        """Replace the known versions with a fresh read."""
+        self._versions = dict(versions)
+    
+    async def refresh(self, user_repository: UserRepository) -> None:
+        """Re-read the role versions from the user repository."""
+        self.replace(await user_repository.get_role_versions())
+    
+    def __len__(self) -> int:
+        return len(self._versions)
 
-def create_access_token(user_id: UUID, email: str, role: UserRole) -> str:
+
+# Role versions used by the application; refreshed by a task started at startup
+role_versions = RoleVersions()
+
+
+def create_access_token(user_id: UUID, email: str, role: UserRole, role_version: int = 0) -> str:
     """Create JWT access token."""
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
@@ -29,14 +103,15 @@ def create_access_token(user_id: UUID, email: str, role: UserRole) -> str:
         "sub": str(user_id),
         "email": email,
         "role": role.value,
+        "rv": role_version,
         "exp": expire,
     }
     
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def verify_token(token: str) -> Optional[TokenData]:
-    """Verify and decode JWT token."""
+def decode_token(token: str) -> Optional[Tuple[TokenData, int]]:
+    """Fully verify and decode a JWT token, returning its data and exp claim."""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
@@ -46,11 +121,60 @@ def verify_token(token: str) -> Optional[TokenData]:
         if user_id is None or email is None:
             return None
         
-        return TokenData(
+        # Tokens issued before role versions existed carry no "rv" claim
+        token_data = TokenData(
             user_id=UUID(user_id),
             email=email,
             role=UserRole(role),
+            role_version=int(payload.get("rv", 0)),
         )
+        return token_data, payload.get("exp")
     except (JWTError, ValueError):
         return None
 
+
+def verify_token(token: str) -> Optional[TokenData]:
+    """
+    Verify and decode JWT token.
+    
+    Successfully verified tokens are cached by digest together with their
+    exp claim, so a token presented again skips signature verification until
+    the moment it expires.
+    """
+    if _token_cache is None:
+        decoded = decode_token(token)
+        return decoded[0] if decoded else None
+    
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        token_data, exp = cached
+        # Same rule as jose: the token is valid up to and including second exp
+        if int(time.time()) <= exp:
+            return token_data
+        _token_cache.invalidate(key)
+        return None
+    
+    decoded = decode_token(token)
+    if decoded is None:
+        return None
+    
+    token_data, exp = decoded
+    if isinstance(exp, int):
+        remaining = exp - time.time()
+        if remaining > 0:
+            _token_cache.set(key, (token_data, exp), ttl=min(remaining + 1, TOKEN_CACHE_TTL_SECONDS))
+    return token_data
+
+
+def token_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the verified-token cache."""
+    if _token_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **_token_cache.stats()}
+
+
+def clear_token_cache() -> None:
+    """Drop all cached verified tokens."""
+    if _token_cache is not None:
+        _token_cache.clear()
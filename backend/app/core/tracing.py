@@ -0,0 +1,299 @@
+import functools
+import inspect
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Id of the request being served by the current task
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+
+class Span:
+    """One timed operation of a trace. Times are Unix epoch nanoseconds."""
+    
+    __slots__ = (
+        "trace", "span_id", "parent_span_id", "name", "kind",
+        "start_time", "end_time", "attributes", "status_code", "status_message",
+    )
+    
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_span_id: Optional[str] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        start_time: Optional[int] = None,
+    ):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_time = start_time or time.time_ns()
+        self.end_time: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+    
+    def child(self, name: str, kind: int = SPAN_KIND_INTERNAL, **kwargs) -> "Span":
+        """Start a span nested in this one."""
+        return Span(self.trace, name, parent_span_id=self.span_id, kind=kind, **kwargs)
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute; values should be str, bool, int or float."""
+        self.attributes[key] = value
+    
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span failed. Only the exception type is kept: messages may hold user data."""
+        self.status_code = STATUS_ERROR
+        self.status_message = type(error).__name__
+    
+    def end(self, end_time: Optional[int] = None) -> None:
+        """Finish the span and hand it to its trace."""
+        self.end_time = end_time or time.time_ns()
+        # list.append is atomic, so spans may end on other threads (see CommandMetricsListener)
+        self.trace.spans.append(self)
+
+
+class Trace:
+    """Spans of one sampled request; exported together when the root span ends."""
+    
+    __slots__ = ("trace_id", "spans")
+    
+    def __init__(self, trace_id: Optional[str] = None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.spans: List[Span] = []
+
+
+# Innermost open span of the current task; None when the request is not sampled
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in attributes.items()]
+
+
+def span_to_otlp(span: Span) -> Dict[str, Any]:
+    """Encode a finished span in the OTLP/JSON format."""
+    encoded = {
+        "traceId": span.trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time),
+        "endTimeUnixNano": str(span.end_time),
+        "attributes": _attributes(span.attributes),
+        "status": {"code": span.status_code},
+    }
+    if span.parent_span_id:
+        encoded["parentSpanId"] = span.parent_span_id
+    if span.status_message:
+        encoded["status"]["message"] = span.status_message
+    return encoded
+
+
+class SpanExporter:
+    """Destination of finished traces."""
+    
+    def export(self, trace: Trace) -> None:
+        raise NotImplementedError
+    
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonLinesFileExporter(SpanExporter):
+    """
+    Write traces to a size-rotated local file, one OTLP/JSON line per trace.
+    
+    Every line is a complete ExportTraceServiceRequest, the format of the
+    OpenTelemetry Collector's file exporter, so the files can be replayed
+    into a collector or read with jq. Encoding happens on the caller's
+    thread; writing and rotation happen on a background thread behind a
+    queue, so the event loop never waits for the disk.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        service_name: str = "lifeschool-backend",
+    ):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(records, handler)
+        self._listener.start()
+        
+        # A private logger: trace lines must not reach the application's handlers
+        self._logger = logging.Logger(f"app.tracing.{path}")
+        self._logger.addHandler(logging.handlers.QueueHandler(records))
+        self._resource = {"attributes": _attributes({"service.name": service_name})}
+    
+    def export(self, trace: Trace) -> None:
+        """Queue a finished trace for writing."""
+        request = {
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{
+                    "scope": {"name": "app"},
+                    "spans": [span_to_otlp(span) for span in trace.spans],
+                }],
+            }],
+        }
+        self._logger.info(json.dumps(request, separators=(",", ":")))
+    
+    def shutdown(self) -> None:
+        """Flush queued traces and close the file."""
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+
+
+class Tracer:
+    """
+    Head-sampling tracer.
+    
+    start_trace() decides once per request whether it is sampled. Unsampled
+    requests leave current_span unset, so every nested span() and traced
+    call costs one context variable lookup. A sampled request's spans are
+    collected in memory and exported together by end_trace().
+    """
+    
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_rate: float = 0.0,
+        sampler: Callable[[], float] = random.random,
+    ):
+        self.configure(exporter, sample_rate)
+        self._sampler = sampler
+    
+    def configure(self, exporter: Optional[SpanExporter], sample_rate: float) -> None:
+        """Set where traces go and the fraction of requests traced (0 disables tracing)."""
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.exporter = exporter
+        self.sample_rate = sample_rate if exporter is not None else 0.0
+    
+    def start_trace(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_SERVER,
+        attributes: Optional[Dict[str, Any]] = None,
+        trace_id: Optional[str] = None,
+    ) -> Optional[Span]:
+        """
+        Start a trace and return its root span, or None when not sampled.
+        
+        The caller makes the root span current while the traced work runs
+        and passes it to end_trace() afterwards.
+        """
+        if not self.sample_rate or self._sampler() >= self.sample_rate:
+            return None
+        return Span(Trace(trace_id), name, kind=kind, attributes=attributes)
+    
+    def end_trace(self, root: Span) -> None:
+        """End the root span and export its trace."""
+        root.end()
+        self.exporter.export(root.trace)
+
+
+# Tracer used by the application; configured at startup
+TRACER = Tracer()
+
+
+class _SpanScope:
+    """Context manager making a span current for the duration of a block."""
+    
+    __slots__ = ("span", "token")
+    
+    def __init__(self, span: Span):
+        self.span = span
+        self.token = None
+    
+    def __enter__(self) -> Span:
+        self.token = current_span.set(self.span)
+        return self.span
+    
+    def __exit__(self, error_type, error, traceback) -> bool:
+        if error is not None:
+            self.span.record_error(error)
+        current_span.reset(self.token)
+        self.span.end()
+        return False
+
+
+# Shared by every span() of an unsampled request
+_NO_SPAN = nullcontext()
+
+
+def span(name: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+    """Time a block as a child of the current span; a no-op when not sampled."""
+    parent = current_span.get()
+    if parent is None:
+        return _NO_SPAN
+    return _SpanScope(parent.child(name, attributes=attributes))
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Decorator running a coroutine function in a span named name."""
+    def decorate(function: Callable) -> Callable:
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            if current_span.get() is None:
+                return await function(*args, **kwargs)
+            with span(name):
+                return await function(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorate
+
+
+def trace_methods(cls: type) -> type:
+    """
+    Class decorator tracing every public coroutine method of a class.
+    
+    Spans are named {class}.{method}, e.g. RegistrationService.register_for_exam.
+    """
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("_") and inspect.iscoroutinefunction(value):
+            setattr(cls, attribute, traced(f"{cls.__name__}.{attribute}")(value))
+    return cls
@@ -20,6 +20,11 @@ class ContentStatus(str, Enum):
 class Content:
     """Domain entity representing CMS content."""
     
+    __slots__ = (
+        "id", "content_type", "title", "body", "metadata",
+        "status", "seo_meta", "created_at", "updated_at",
+    )
+    
     def __init__(
         self,
         content_type: ContentType,
@@ -49,6 +54,35 @@ class Content:
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
     
+    @classmethod
+    def hydrate(
+        cls,
+        id: UUID,
+        content_type: ContentType,
+        title: str,
+        body: str,
+        metadata: Dict,
+        status: ContentStatus,
+        seo_meta: Dict,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "Content":
+        """
+        Rebuild content from stored data without re-validating it.
+        For mappers only: the values were validated when the content was saved.
+        """
+        content = cls.__new__(cls)
+        content.id = id
+        content.content_type = content_type
+        content.title = title
+        content.body = body
+        content.metadata = metadata
+        content.status = status
+        content.seo_meta = seo_meta
+        content.created_at = created_at
+        content.updated_at = updated_at
+        return content
+    
     def __eq__(self, other):
         if not isinstance(other, Content):
             return False
@@ -57,3 +91,64 @@ class Content:
     def __repr__(self):
         return f"<Content id={self.id} type={self.content_type.value} title={self.title[:30]}>"
 
+
+class ContentSummary:
+    """
+    Read model of content for list pages.
+    
+    Carries everything a listing shows, but instead of the full body only
+    an excerpt of its first EXCERPT_LENGTH characters and its length.
+    """
+    
+    __slots__ = (
+        "id", "content_type", "title", "excerpt", "body_length",
+        "status", "metadata", "created_at", "updated_at",
+    )
+    
+    # Number of body characters kept in the excerpt
+    EXCERPT_LENGTH = 200
+    
+    def __init__(
+        self,
+        id: UUID,
+        content_type: ContentType,
+        title: str,
+        excerpt: str,
+        body_length: int,
+        status: ContentStatus,
+        metadata: Optional[Dict] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.content_type = content_type
+        self.title = title
+        self.excerpt = excerpt
+        self.body_length = body_length
+        self.status = status
+        self.metadata = metadata or {}
+        self.created_at = created_at or datetime.now(timezone.utc)
+        self.updated_at = updated_at or self.created_at
+    
+    @classmethod
+    def from_content(cls, content: Content) -> "ContentSummary":
+        """Summarize a full content entity."""
+        return cls(
+            id=content.id,
+            content_type=content.content_type,
+            title=content.title,
+            excerpt=content.body[:cls.EXCERPT_LENGTH],
+            body_length=len(content.body),
+            status=content.status,
+            metadata=content.metadata,
+            created_at=content.created_at,
+            updated_at=content.updated_at,
+        )
+    
+    @property
+    def truncated(self) -> bool:
+        """Whether the excerpt is shorter than the body."""
+        return self.body_length > len(self.excerpt)
+    
+    def __repr__(self):
+        return f"<ContentSummary id={self.id} type={self.content_type.value} title={self.title[:30]}>"
@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
-from .entity import Content, ContentType
+from ..pagination import PageCursor, paginate
+from .entity import Content, ContentStatus, ContentSummary, ContentType
 
 
 class ContentRepository(ABC):
@@ -24,12 +25,42 @@ class ContentRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_type_for_admin(self, content_type: ContentType) -> List[Content]:
-        """Get all content of a type (for admin - includes DRAFT and PUBLISHED)."""
+    async def get_by_type_for_admin(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get all content of a type (for admin - includes DRAFT and PUBLISHED), ordered by (created_at, id)."""
         pass
     
     @abstractmethod
-    async def get_published_by_type(self, content_type: ContentType) -> List[Content]:
-        """Get published content of a type (for public access)."""
+    async def get_published_by_type(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get published content of a type (for public access), ordered by (created_at, id)."""
         pass
-
+    
+    async def get_summaries_by_type(
+        self,
+        content_type: ContentType,
+        status: Optional[ContentStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ContentSummary]:
+        """Get summaries of content of a type, optionally only in one status, ordered by (created_at, id)."""
+        if status == ContentStatus.PUBLISHED:
+            contents = await self.get_published_by_type(content_type, limit=limit, after=after)
+        elif status is None:
+            contents = await self.get_by_type_for_admin(content_type, limit=limit, after=after)
+        else:
+            contents = [
+                content
+                for content in await self.get_by_type_for_admin(content_type)
+                if content.status == status
+            ]
+            contents = paginate(contents, limit, after)
+        return [ContentSummary.from_content(content) for content in contents]
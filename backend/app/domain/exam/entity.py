@@ -13,6 +13,11 @@ class ExamStatus(str, Enum):
 class Exam:
     """Domain entity representing an exam."""
     
+    __slots__ = (
+        "id", "title", "description", "start_date", "end_date",
+        "fee", "status", "created_at", "updated_at",
+    )
+    
     def __init__(
         self,
         title: str,
@@ -23,6 +28,7 @@ class Exam:
         fee: Decimal = Decimal("0.00"),
         status: ExamStatus = ExamStatus.DRAFT,
         created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
     ):
         if not title or not title.strip():
             raise ValueError("Title is required")
@@ -41,6 +47,36 @@ class Exam:
         self.fee = fee
         self.status = status
         self.created_at = created_at or datetime.now(timezone.utc)
+        self.updated_at = updated_at or self.created_at
+    
+    @classmethod
+    def hydrate(
+        cls,
+        id: UUID,
+        title: str,
+        description: Optional[str],
+        start_date: datetime,
+        end_date: datetime,
+        fee: Decimal,
+        status: ExamStatus,
+        created_at: datetime,
+        updated_at: Optional[datetime] = None,
+    ) -> "Exam":
+        """
+        Rebuild an exam from stored data without re-validating it.
+        For mappers only: the values were validated when the exam was saved.
+        """
+        exam = cls.__new__(cls)
+        exam.id = id
+        exam.title = title
+        exam.description = description
+        exam.start_date = start_date
+        exam.end_date = end_date
+        exam.fee = fee
+        exam.status = status
+        exam.created_at = created_at
+        exam.updated_at = updated_at or created_at
+        return exam
     
     def activate(self) -> None:
         """Activate the exam."""
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
+from ..pagination import PageCursor
 from .entity import Exam
 
 
@@ -19,13 +20,21 @@ class ExamRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_all(self) -> List[Exam]:
-        """Get all exams."""
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all exams, ordered by (created_at, id), optionally one page at a time."""
         pass
     
     @abstractmethod
-    async def get_active(self) -> List[Exam]:
-        """Get all active exams."""
+    async def get_active(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all active exams, ordered by (created_at, id), optionally one page at a time."""
         pass
     
     @abstractmethod
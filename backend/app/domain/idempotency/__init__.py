@@ -0,0 +1,2 @@
+# Idempotency domain module
+
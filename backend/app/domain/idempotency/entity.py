@@ -0,0 +1,55 @@
+import os
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class IdempotencyRecord:
+    """
+    The outcome of a request sent with an Idempotency-Key.
+    
+    A record is claimed before its request runs and completed with the
+    response afterwards; until then it is pending. Keys are scoped to the
+    user who sent them. The record remembers the request it was claimed
+    for (e.g. "POST /payments/{id}/confirm"), so a key reused for another
+    request can be told apart from a retry. claim_id identifies the caller
+    that claimed the record.
+    """
+    
+    __slots__ = ("user_id", "key", "request", "claim_id", "status_code", "body", "expires_at")
+    
+    def __init__(
+        self,
+        user_id: UUID,
+        key: str,
+        request: str,
+        claim_id: Optional[str] = None,
+        status_code: Optional[int] = None,
+        body: Optional[bytes] = None,
+        expires_at: Optional[datetime] = None,
+    ):
+        self.user_id = user_id
+        self.key = key
+        self.request = request
+        self.claim_id = claim_id or os.urandom(16).hex()
+        self.status_code = status_code
+        self.body = body
+        self.expires_at = expires_at
+    
+    @property
+    def id(self) -> str:
+        """Storage key: the Idempotency-Key within its user's scope."""
+        return f"{self.user_id}:{self.key}"
+    
+    @property
+    def pending(self) -> bool:
+        """Whether the request is still running (or died without releasing the key)."""
+        return self.status_code is None
+    
+    def complete(self, status_code: int, body: bytes) -> None:
+        """Record the response to replay for repeats of the request."""
+        self.status_code = status_code
+        self.body = body
+    
+    def __repr__(self):
+        return f"<IdempotencyRecord id={self.id} request={self.request} status_code={self.status_code}>"
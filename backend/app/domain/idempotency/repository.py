@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+
+from .entity import IdempotencyRecord
+
+
+class IdempotencyRepository(ABC):
+    """
+    Repository interface for IdempotencyRecord entity.
+    
+    Records expire: pending ones shortly, so a key whose request died is
+    freed again, and completed ones after the replay window.
+    """
+    
+    @abstractmethod
+    async def claim(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        """
+        Store a pending record unless its key is already taken, atomically.
+        
+        Returns the stored record: record itself when it was claimed,
+        otherwise the record holding the key, which has a different
+        claim_id.
+        """
+        pass
+    
+    @abstractmethod
+    async def complete(self, record: IdempotencyRecord) -> None:
+        """Store the response of a record claimed by this caller and keep it for the replay window."""
+        pass
+    
+    @abstractmethod
+    async def release(self, record: IdempotencyRecord) -> None:
+        """Delete a pending record claimed by this caller, so its key can be used again."""
+        pass
@@ -0,0 +1,88 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor token cannot be decoded."""
+    pass
+
+
+class PageCursor:
+    """
+    Keyset position in a listing ordered by (created_at, id).
+    
+    A cursor points at the last item of a page; the next page holds the
+    items that sort strictly after it. Cursors travel to clients as opaque
+    URL-safe tokens.
+    """
+    
+    def __init__(self, created_at: datetime, id: UUID):
+        self.created_at = created_at
+        self.id = id
+    
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        payload = json.dumps(
+            {"c": self.created_at.isoformat(), "i": str(self.id)},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+    
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode a token produced by encode()."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(
+                created_at=datetime.fromisoformat(payload["c"]),
+                id=UUID(payload["i"]),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError(f"Invalid pagination cursor: {token}") from e
+    
+    @classmethod
+    def after_page(cls, items: Sequence[Any], limit: Optional[int]) -> Optional["PageCursor"]:
+        """
+        Get the cursor of the page that follows items.
+        
+        Returns None when no limit was applied or the page was not full,
+        meaning there is nothing more to fetch.
+        """
+        if limit is None or len(items) < limit:
+            return None
+        last = items[-1]
+        return cls(created_at=last.created_at, id=last.id)
+    
+    def __eq__(self, other):
+        if not isinstance(other, PageCursor):
+            return False
+        return self.created_at == other.created_at and self.id == other.id
+    
+    def __repr__(self):
+        return f"<PageCursor created_at={self.created_at.isoformat()} id={self.id}>"
+
+
+def paginate(
+    items: Iterable[T],
+    limit: Optional[int] = None,
+    after: Optional[PageCursor] = None,
+) -> List[T]:
+    """
+    Apply keyset pagination to items held in memory.
+    
+    Items are ordered by (created_at, id), matching the order used by the
+    database-backed repositories.
+    """
+    ordered = sorted(items, key=lambda item: (item.created_at, str(item.id)))
+    if after is not None:
+        position = (after.created_at, str(after.id))
+        ordered = [item for item in ordered if (item.created_at, str(item.id)) > position]
+    if limit is not None:
+        ordered = ordered[:limit]
+    return ordered
@@ -14,6 +14,8 @@ class RegistrationStatus(str, Enum):
 class ExamRegistration:
     """Domain entity representing an exam registration."""
     
+    __slots__ = ("id", "user_id", "exam_id", "status", "created_at")
+    
     def __init__(
         self,
         user_id: UUID,
@@ -33,6 +35,27 @@ class ExamRegistration:
         self.status = status
         self.created_at = created_at or datetime.now(timezone.utc)
     
+    @classmethod
+    def hydrate(
+        cls,
+        id: UUID,
+        user_id: UUID,
+        exam_id: UUID,
+        status: RegistrationStatus,
+        created_at: datetime,
+    ) -> "ExamRegistration":
+        """
+        Rebuild a registration from stored data without re-validating it.
+        For mappers only: the values were validated when the registration was created.
+        """
+        registration = cls.__new__(cls)
+        registration.id = id
+        registration.user_id = user_id
+        registration.exam_id = exam_id
+        registration.status = status
+        registration.created_at = created_at
+        return registration
+    
     def __eq__(self, other):
         if not isinstance(other, ExamRegistration):
             return False
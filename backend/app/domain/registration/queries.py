@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from ..pagination import PageCursor
+
+
+class RegistrationUserQuery(ABC):
+    """Read-model query joining exam registrations with their users inside the storage."""
+    
+    @abstractmethod
+    async def get_with_users_by_exam_id(
+        self,
+        exam_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all registrations for an exam joined with their users.
+        
+        Each row has the shape of the admin registration view:
+        {"registration_id", "status", "registered_at",
+         "user": {"id", "name", "email", "mobile"}}.
+        Registrations whose user does not exist are omitted. Rows are
+        ordered by (registered_at, registration_id) and paginated like
+        RegistrationRepository.get_by_exam_id.
+        """
+        pass
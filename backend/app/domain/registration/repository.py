@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Set
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
+from ..pagination import PageCursor
 from .entity import ExamRegistration
+from .exceptions import RegistrationNotFoundError
+from .transitions import RegistrationTransition
 
 
 class RegistrationRepository(ABC):
@@ -27,16 +30,40 @@ class RegistrationRepository(ABC):
         """Get registration by user_id and exam_id."""
         pass
     
+    async def exists_for_user_and_exam(self, user_id: UUID, exam_id: UUID) -> bool:
+        """Check whether a user is registered for an exam."""
+        return await self.get_by_user_and_exam(user_id, exam_id) is not None
+    
     @abstractmethod
-    async def get_by_user_id(self, user_id: UUID) -> List[ExamRegistration]:
-        """Get all registrations for a user."""
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
+        """Get all registrations for a user, ordered by (created_at, id), optionally one page at a time."""
         pass
     
     @abstractmethod
-    async def get_by_exam_id(self, exam_id: UUID) -> List[ExamRegistration]:
-        """Get all registrations for an exam."""
+    async def get_by_exam_id(
+        self,
+        exam_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
+        """Get all registrations for an exam, ordered by (created_at, id), optionally one page at a time."""
         pass
     
+    async def iter_by_exam_id(
+        self,
+        exam_id: UUID,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[ExamRegistration]]:
+        """Iterate over all registrations for an exam, ordered by (created_at, id), one page at a time."""
+        registrations = await self.get_by_exam_id(exam_id)
+        for start in range(0, len(registrations), batch_size):
+            yield registrations[start:start + batch_size]
+    
     @abstractmethod
     async def update_status(
         self,
@@ -62,4 +89,132 @@ class RegistrationRepository(ABC):
             ValueError: If expected_status/expected_statuses doesn't match current status
         """
         pass
-
+    
+    async def apply_transition(
+        self,
+        registration_id: UUID,
+        transition: RegistrationTransition,
+        user_id: Optional[UUID] = None,
+    ) -> ExamRegistration:
+        """
+        Apply a status transition to a registration atomically.
+        
+        Args:
+            registration_id: ID of the registration
+            transition: The transition to apply
+            user_id: The acting user; owner-only transitions require it, and require it to own the registration
+        
+        Returns:
+            Updated registration
+        
+        Raises:
+            RegistrationNotFoundError: If registration not found
+            PermissionError: If the transition is owner-only and user_id does not own the registration
+            ValueError: If the registration's status is not one of the transition's sources,
+                or the transition is owner-only and user_id is None
+        """
+        transition.require_user(user_id)
+        registration = await self.get_by_id(registration_id)
+        error = transition.rejection(registration_id, registration, user_id)
+        if error:
+            raise error
+        return await self.update_status(
+            registration_id,
+            transition.target,
+            expected_statuses=set(transition.sources),
+        )
+    
+    async def bulk_update_status(
+        self,
+        registration_ids: Iterable[UUID],
+        new_status: "RegistrationStatus",  # type: ignore
+        expected_statuses: Optional[Set["RegistrationStatus"]] = None,  # type: ignore
+    ) -> Tuple[Dict[UUID, ExamRegistration], Set[UUID]]:
+        """
+        Update the status of many registrations, each one atomically.
+        
+        A registration is only updated if its current status is in
+        expected_statuses (when given) and is not already new_status, so
+        the updated IDs are exactly those this call changed. Duplicate IDs
+        are updated once.
+        
+        Args:
+            registration_ids: IDs of the registrations to update
+            new_status: The new status to set
+            expected_statuses: If provided, only update registrations whose current status is in this set
+        
+        Returns:
+            Tuple of (registrations found, keyed by ID and reflecting the last
+            state read, IDs of the registrations that were updated). IDs
+            missing from the first element do not exist.
+        """
+        found: Dict[UUID, ExamRegistration] = {}
+        updated: Set[UUID] = set()
+        for registration_id in dict.fromkeys(registration_ids):
+            registration = await self.get_by_id(registration_id)
+            if not registration:
+                continue
+            
+            found[registration_id] = registration
+            if registration.status == new_status:
+                continue
+            if expected_statuses and registration.status not in expected_statuses:
+                continue
+            
+            try:
+                found[registration_id] = await self.update_status(
+                    registration_id,
+                    new_status,
+                    expected_status=registration.status,
+                )
+                updated.add(registration_id)
+            except (ValueError, RegistrationNotFoundError):
+                # Changed concurrently; report the state it changed to
+                current = await self.get_by_id(registration_id)
+                if current:
+                    found[registration_id] = current
+                else:
+                    del found[registration_id]
+        
+        return found, updated
+    
+    async def count_by_exam_id(
+        self,
+        exam_id: UUID,
+        statuses: Optional[Set["RegistrationStatus"]] = None,  # type: ignore
+    ) -> int:
+        """Count registrations for an exam, optionally only those in statuses."""
+        registrations = await self.get_by_exam_id(exam_id)
+        return sum(
+            1 for registration in registrations
+            if not statuses or registration.status in statuses
+        )
+    
+    async def update_status_by_exam_id(
+        self,
+        exam_id: UUID,
+        new_status: "RegistrationStatus",  # type: ignore
+        expected_statuses: Set["RegistrationStatus"],  # type: ignore
+    ) -> int:
+        """
+        Update every registration of an exam whose status is in expected_statuses.
+        
+        Returns:
+            Number of registrations updated
+        """
+        updated = 0
+        for registration in await self.get_by_exam_id(exam_id):
+            if registration.status not in expected_statuses:
+                continue
+            try:
+                await self.update_status(
+                    registration.id,
+                    new_status,
+                    expected_statuses=expected_statuses,
+                )
+                updated += 1
+            except (ValueError, RegistrationNotFoundError):
+                # Changed concurrently; no longer matches
+                continue
+        
+        return updated
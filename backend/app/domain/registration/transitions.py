@@ -0,0 +1,119 @@
+from typing import FrozenSet, Optional
+from uuid import UUID
+
+from .entity import ExamRegistration, RegistrationStatus
+from .exceptions import RegistrationNotFoundError
+
+# Statuses in lifecycle order, for messages
+ORDER = (
+    RegistrationStatus.REGISTERED,
+    RegistrationStatus.PAYMENT_PENDING,
+    RegistrationStatus.PAID,
+    RegistrationStatus.ENROLLED,
+)
+
+
+class RegistrationTransition:
+    """
+    One allowed change of a registration's status.
+    
+    A transition applies when the registration is in one of its sources
+    and, for owner-only transitions, belongs to the acting user. Both
+    conditions are plain field predicates, so a repository can check them
+    in the filter of a single conditional update and only read the
+    registration, to explain the failure, when that update matches nothing.
+    
+    Error messages are templates filled with the registration {id}, its
+    current {status} and the allowed {sources}.
+    """
+    
+    __slots__ = ("name", "sources", "target", "owner_only", "not_found", "wrong_status", "repeated")
+    
+    def __init__(
+        self,
+        name: str,
+        sources: FrozenSet[RegistrationStatus],
+        target: RegistrationStatus,
+        owner_only: bool = False,
+        not_found: str = "Registration with id {id} not found",
+        wrong_status: str = "Cannot {name}. Registration status must be one of {sources}, but is {status}",
+        repeated: Optional[str] = None,
+    ):
+        self.name = name
+        self.sources = sources
+        self.target = target
+        self.owner_only = owner_only
+        self.not_found = not_found
+        self.wrong_status = wrong_status
+        self.repeated = repeated
+    
+    def require_user(self, user_id: Optional[UUID]) -> None:
+        """Refuse to run an owner-only transition without knowing who the owner must be."""
+        if self.owner_only and user_id is None:
+            raise ValueError(f"Cannot {self.name} without the acting user's id")
+    
+    def rejection(
+        self,
+        registration_id: UUID,
+        registration: Optional[ExamRegistration],
+        user_id: Optional[UUID] = None,
+    ) -> Optional[Exception]:
+        """
+        The error explaining why the transition cannot be applied, or None if it can.
+        
+        Args:
+            registration_id: ID the transition was requested for
+            registration: The registration as it is now, None if it does not exist
+            user_id: The acting user, checked against the owner of owner-only transitions
+        
+        Raises:
+            ValueError: If the transition is owner-only and user_id is None
+        """
+        self.require_user(user_id)
+        if registration is None:
+            return RegistrationNotFoundError(self.not_found.format(id=registration_id))
+        if self.owner_only and registration.user_id != user_id:
+            return PermissionError(f"Cannot {self.name} for another user's registration")
+        if registration.status in self.sources:
+            return None
+        if self.repeated and registration.status == self.target:
+            return ValueError(self.repeated.format(id=registration_id))
+        return ValueError(self.wrong_status.format(
+            name=self.name,
+            id=registration_id,
+            status=registration.status.value,
+            sources=", ".join(status.value for status in ORDER if status in self.sources),
+        ))
+
+
+INITIATE_PAYMENT = RegistrationTransition(
+    "initiate payment",
+    sources=frozenset({RegistrationStatus.REGISTERED}),
+    target=RegistrationStatus.PAYMENT_PENDING,
+    owner_only=True,
+    wrong_status="Cannot initiate payment. Registration status must be {sources}, but is {status}",
+)
+
+CONFIRM_PAYMENT = RegistrationTransition(
+    "confirm payment",
+    sources=frozenset({RegistrationStatus.PAYMENT_PENDING}),
+    target=RegistrationStatus.PAID,
+    owner_only=True,
+    wrong_status="Cannot confirm payment. Registration status must be {sources}, but is {status}",
+)
+
+ENROLL = RegistrationTransition(
+    "enroll",
+    sources=frozenset({
+        RegistrationStatus.REGISTERED,
+        RegistrationStatus.PAYMENT_PENDING,
+        RegistrationStatus.PAID,
+    }),
+    target=RegistrationStatus.ENROLLED,
+    not_found="Registration {id} not found",
+    wrong_status="Cannot enroll registration in {status} status. Must be one of: {sources}",
+    repeated="Registration {id} is already ENROLLED",
+)
+
+# Every status change a single registration can go through
+TRANSITIONS = (INITIATE_PAYMENT, CONFIRM_PAYMENT, ENROLL)
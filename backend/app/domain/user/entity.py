@@ -10,7 +10,14 @@ class UserRole(str, Enum):
 
 
 class User:
-    """Domain entity representing a user."""
+    """
+    Domain entity representing a user.
+    
+    role_version counts role changes. Access tokens carry the version they
+    were issued at, so tokens issued before a change can be told apart.
+    """
+    
+    __slots__ = ("id", "email", "name", "mobile", "role", "created_at", "role_version")
     
     def __init__(
         self,
@@ -20,6 +27,7 @@ class User:
         mobile: Optional[str] = None,
         role: UserRole = UserRole.USER,
         created_at: Optional[datetime] = None,
+        role_version: int = 0,
     ):
         if not email or not email.strip():
             raise ValueError("Email is required")
@@ -32,6 +40,38 @@ class User:
         self.mobile = mobile
         self.role = role
         self.created_at = created_at or datetime.now(timezone.utc)
+        self.role_version = role_version
+    
+    @classmethod
+    def hydrate(
+        cls,
+        id: UUID,
+        email: str,
+        name: str,
+        mobile: Optional[str],
+        role: UserRole,
+        created_at: datetime,
+        role_version: int = 0,
+    ) -> "User":
+        """
+        Rebuild a user from stored data without re-validating it.
+        For mappers only: the values were validated when the user was created.
+        """
+        user = cls.__new__(cls)
+        user.id = id
+        user.email = email
+        user.name = name
+        user.mobile = mobile
+        user.role = role
+        user.created_at = created_at
+        user.role_version = role_version
+        return user
+    
+    def change_role(self, role: UserRole) -> None:
+        """Change the role, invalidating tokens issued for the previous one."""
+        if role != self.role:
+            self.role = role
+            self.role_version += 1
     
     def update_mobile(self, mobile: str) -> None:
         """Update mobile number with validation."""
@@ -61,3 +101,52 @@ class User:
     def __repr__(self):
         return f"<User id={self.id} email={self.email} name={self.name}>"
 
+
+
+class UserAccess:
+    """
+    Read model of a user for authorizing requests.
+    
+    Carries only what access checks need: the id, the role and the mobile
+    number that decides whether the profile is complete.
+    """
+    
+    __slots__ = ("id", "role", "mobile")
+    
+    def __init__(self, id: UUID, role: UserRole, mobile: Optional[str] = None):
+        self.id = id
+        self.role = role
+        self.mobile = mobile
+    
+    @classmethod
+    def from_user(cls, user: User) -> "UserAccess":
+        """Reduce a full user entity to its access fields."""
+        return cls(id=user.id, role=user.role, mobile=user.mobile)
+    
+    @property
+    def is_profile_complete(self) -> bool:
+        """Check if user profile is complete (has mobile number)."""
+        return self.mobile is not None and len(self.mobile) == 10
+    
+    def __repr__(self):
+        return f"<UserAccess id={self.id} role={self.role.value}>"
+
+
+class UserContact:
+    """Read model of a user for joins that only show contact details."""
+    
+    __slots__ = ("id", "name", "email", "mobile")
+    
+    def __init__(self, id: UUID, name: str, email: str, mobile: Optional[str] = None):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.mobile = mobile
+    
+    @classmethod
+    def from_user(cls, user: User) -> "UserContact":
+        """Reduce a full user entity to its contact fields."""
+        return cls(id=user.id, name=user.name, email=user.email, mobile=user.mobile)
+    
+    def __repr__(self):
+        return f"<UserContact id={self.id} email={self.email}>"
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 
-from .entity import User
+from .entity import User, UserAccess, UserContact
+from .exceptions import UserAlreadyExistsError
 
 
 class UserRepository(ABC):
@@ -27,4 +28,48 @@ class UserRepository(ABC):
     async def update(self, user: User) -> User:
         """Update an existing user."""
         pass
-
+    
+    @abstractmethod
+    async def update_mobile(self, user_id: UUID, mobile: str) -> User:
+        """Set a user's mobile number, leaving the other fields as stored."""
+        pass
+    
+    @abstractmethod
+    async def get_role_versions(self) -> Dict[UUID, int]:
+        """
+        Get the role version of every user whose role has changed.
+        Users absent from the mapping are at version 0.
+        """
+        pass
+    
+    async def upsert_by_email(self, user: User) -> User:
+        """Get the user with user's email, creating user if there is none."""
+        existing = await self.get_by_email(user.email)
+        if existing:
+            return existing
+        try:
+            return await self.create(user)
+        except UserAlreadyExistsError:
+            existing = await self.get_by_email(user.email)
+            if existing is None:
+                raise
+            return existing
+    
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get many users by ID; IDs that do not resolve to a user are absent from the mapping."""
+        users: Dict[UUID, User] = {}
+        for user_id in set(user_ids):
+            user = await self.get_by_id(user_id)
+            if user:
+                users[user.id] = user
+        return users
+    
+    async def get_access_by_id(self, user_id: UUID) -> Optional[UserAccess]:
+        """Get the fields needed to authorize a request for a user."""
+        user = await self.get_by_id(user_id)
+        return UserAccess.from_user(user) if user else None
+    
+    async def get_contacts_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, UserContact]:
+        """Get the contact details of many users by ID."""
+        users = await self.get_by_ids(user_ids)
+        return {user_id: UserContact.from_user(user) for user_id, user in users.items()}
@@ -0,0 +1,170 @@
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo import monitoring
+
+from ..core.metrics import MetricsRegistry
+from ..core.tracing import SPAN_KIND_CLIENT, STATUS_ERROR, current_request_id, current_span
+from .instrumentation import current_operation
+
+# Slow commands are logged here as one JSON object per record
+slow_command_logger = logging.getLogger("app.mongodb.slow_commands")
+
+# Command latency buckets in seconds; finer than request latency at the low end
+COMMAND_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Operation label of commands not issued through an instrumented repository
+UNATTRIBUTED = "unattributed"
+
+# Connection and session housekeeping; not interesting for latency
+IGNORED_COMMANDS = frozenset({
+    "hello", "ismaster", "isMaster", "ping", "buildInfo", "endSessions",
+    "saslStart", "saslContinue", "authenticate", "getnonce",
+})
+
+# Where each command keeps its filter
+FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+
+# Stands in for every value in a query shape
+VALUE = "?"
+
+
+def query_shape(value: Any) -> Any:
+    """
+    Reduce a filter to its shape: field names and operators, no values.
+    
+    {"user_id": uuid, "status": {"$in": ["PAID"]}} becomes
+    {"user_id": "?", "status": {"$in": "?"}}. Lists of sub-filters ($or,
+    $and, pipelines) keep their structure; any other value becomes "?".
+    """
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and value and all(isinstance(item, dict) for item in value):
+        return [query_shape(item) for item in value]
+    return VALUE
+
+
+def command_shape(command_name: str, command: Dict[str, Any]) -> Any:
+    """Shape of the filter (or pipeline, or write filters) a command runs with."""
+    field = FILTER_FIELDS.get(command_name)
+    if field is not None:
+        return query_shape(command.get(field, {}))
+    if command_name == "aggregate":
+        return query_shape(command.get("pipeline", []))
+    if command_name == "update":
+        return [query_shape(update.get("q", {})) for update in command.get("updates", [])[:1]]
+    if command_name == "delete":
+        return [query_shape(delete.get("q", {})) for delete in command.get("deletes", [])[:1]]
+    return None
+
+
+def command_collection(command_name: str, command: Dict[str, Any]) -> str:
+    """Collection a command targets ("" for database-level commands)."""
+    target = command.get(command_name)
+    if isinstance(target, str):
+        return target
+    # getMore carries the cursor id under its name and the collection separately
+    return command.get("collection", "")
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """
+    pymongo command listener timing every command sent to MongoDB.
+    
+    Each command is attributed to the repository method that issued it
+    (InstrumentedRepository sets current_operation; Motor carries it into
+    the worker thread that runs the command). Durations feed per-collection,
+    per-command and per-operation histograms when a registry is given, and
+    commands at or above slow_threshold_ms are written to the slow command
+    log with the shape of their filter, never its values, and the id of
+    the request that caused them. In sampled requests every command is also
+    a client span under the repository operation's span.
+    
+    Listener callbacks run on Motor's worker threads rather than the event
+    loop; the metrics take their own locks, so /metrics can render while
+    commands are recorded.
+    """
+    
+    def __init__(self, registry: Optional[MetricsRegistry] = None, slow_threshold_ms: float = 0):
+        self.slow_threshold_micros = slow_threshold_ms * 1000
+        self._started: Dict[Tuple[Any, int], Tuple[str, str, str, Dict[str, Any], Optional[str], Any]] = {}
+        self.durations = self.failures = None
+        if registry is not None:
+            self.durations = registry.histogram(
+                "mongodb_command_duration_seconds",
+                "MongoDB command latency in seconds, by collection, command and repository operation.",
+                ("collection", "command", "operation"),
+                buckets=COMMAND_BUCKETS,
+            )
+            self.failures = registry.counter(
+                "mongodb_command_failures_total",
+                "Failed MongoDB commands, by collection, command and repository operation.",
+                ("collection", "command", "operation"),
+            )
+    
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command_name = event.command_name
+        if command_name in IGNORED_COMMANDS:
+            return
+        command = event.command
+        collection = command_collection(command_name, command)
+        parent = current_span.get()
+        command_span = None
+        if parent is not None:
+            command_span = parent.child(f"mongodb.{command_name}", kind=SPAN_KIND_CLIENT, attributes={
+                "db.system": "mongodb",
+                "db.collection.name": collection,
+                "db.operation.name": command_name,
+            })
+        # Keep the command itself; its shape is only worked out if it turns out slow
+        self._started[(event.connection_id, event.request_id)] = (
+            collection,
+            command_name,
+            current_operation.get() or UNATTRIBUTED,
+            command,
+            current_request_id.get(),
+            command_span,
+        )
+    
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event, failed=False)
+    
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finished(event, failed=True)
+    
+    def _finished(self, event, failed: bool) -> None:
+        """Record a finished command and log it if it was slow."""
+        started = self._started.pop((event.connection_id, event.request_id), None)
+        if started is None:
+            return
+        collection, command_name, operation, command, request_id, command_span = started
+        labels = (collection, command_name, operation)
+        
+        if command_span is not None:
+            if failed:
+                command_span.status_code = STATUS_ERROR
+            command_span.end()
+        
+        if self.durations is not None:
+            self.durations.observe(event.duration_micros / 1e6, labels)
+            if failed:
+                self.failures.inc(labels)
+        
+        if self.slow_threshold_micros and event.duration_micros >= self.slow_threshold_micros:
+            slow_command_logger.warning(json.dumps({
+                "event": "slow_command",
+                "database": event.database_name,
+                "collection": collection,
+                "command": command_name,
+                "operation": operation,
+                "request_id": request_id,
+                "duration_ms": round(event.duration_micros / 1000, 3),
+                "failed": failed,
+                "shape": command_shape(command_name, command),
+            }, sort_keys=True))
@@ -0,0 +1,116 @@
+import copy
+from typing import Hashable, List, Optional
+from uuid import UUID
+
+from ...core.cache import TTLCache
+from ...domain.content.entity import Content, ContentStatus, ContentSummary, ContentType
+from ...domain.content.repository import ContentRepository
+from ...domain.pagination import PageCursor
+
+
+def content_tag(content_id: UUID) -> str:
+    """Cache tag of a single content item."""
+    return f"content:{content_id}"
+
+
+def content_list_tag(content_type: ContentType) -> str:
+    """Cache tag of every listing of a content type."""
+    return f"contents:{content_type.value}"
+
+
+class CachingContentRepository(ContentRepository):
+    """
+    ContentRepository decorator that keeps content and content listings in a TTL+LRU cache.
+    
+    Single items are tagged content:{id}; admin and public listings are
+    tagged contents:{type}. create and update write through to the wrapped
+    repository and then evict the affected tags. Callers always receive
+    their own copies.
+    """
+    
+    def __init__(self, repository: ContentRepository, cache: TTLCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def create(self, content: Content) -> Content:
+        """Create a new content."""
+        try:
+            return await self.repository.create(content)
+        finally:
+            self.cache.invalidate_tag(content_tag(content.id), content_list_tag(content.content_type))
+    
+    async def update(self, content: Content) -> Content:
+        """Update existing content and evict it and the listings of its type."""
+        try:
+            return await self.repository.update(content)
+        finally:
+            self.cache.invalidate_tag(content_tag(content.id), content_list_tag(content.content_type))
+    
+    async def get_by_id(self, content_id: UUID) -> Optional[Content]:
+        """Get content by ID, from the cache when possible."""
+        key = ("content", content_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        generation = self.cache.generation
+        content = await self.repository.get_by_id(content_id)
+        if content:
+            self.cache.set(key, copy.deepcopy(content), tags=[content_tag(content_id)], generation=generation)
+        return content
+    
+    async def get_by_type_for_admin(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get all content of a type (for admin - includes DRAFT and PUBLISHED), ordered by (created_at, id)."""
+        return await self._get_list(
+            "admin", content_type, limit, after,
+            lambda: self.repository.get_by_type_for_admin(content_type, limit=limit, after=after),
+        )
+    
+    async def get_published_by_type(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get published content of a type (for public access), ordered by (created_at, id)."""
+        return await self._get_list(
+            "published", content_type, limit, after,
+            lambda: self.repository.get_published_by_type(content_type, limit=limit, after=after),
+        )
+    
+    async def get_summaries_by_type(
+        self,
+        content_type: ContentType,
+        status: Optional[ContentStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ContentSummary]:
+        """Get summaries of content of a type, optionally only in one status, ordered by (created_at, id)."""
+        return await self._get_list(
+            ("summaries", status), content_type, limit, after,
+            lambda: self.repository.get_summaries_by_type(
+                content_type, status=status, limit=limit, after=after
+            ),
+        )
+    
+    async def _get_list(self, view: Hashable, content_type: ContentType, limit, after, load) -> list:
+        """Serve a listing page from the cache, loading it on a miss."""
+        key: Hashable = ("contents", view, content_type, limit, after.encode() if after else None)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        generation = self.cache.generation
+        contents = await load()
+        self.cache.set(
+            key,
+            copy.deepcopy(contents),
+            tags=[content_list_tag(content_type)],
+            generation=generation,
+        )
+        return contents
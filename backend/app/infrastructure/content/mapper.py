@@ -1,6 +1,21 @@
-from typing import Dict, Any
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
 
-from ...domain.content.entity import Content, ContentType, ContentStatus
+from ...domain.content.entity import Content, ContentSummary, ContentType, ContentStatus
+from ..identity import document_id
+
+# Enum lookups by value; much cheaper than calling the enum on every document
+TYPE_BY_VALUE = {content_type.value: content_type for content_type in ContentType}
+STATUS_BY_VALUE = {status.value: status for status in ContentStatus}
+
+
+def to_datetime(value: Any) -> datetime:
+    """Read a timestamp stored as a datetime or, in older documents, an ISO string."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if not isinstance(value, datetime):
+        return datetime.now()
+    return value
 
 
 class ContentMapper:
@@ -10,7 +25,7 @@ class ContentMapper:
     def to_document(content: Content) -> Dict[str, Any]:
         """Convert Content entity to MongoDB document."""
         return {
-            "id": str(content.id),
+            "_id": content.id,
             "content_type": content.content_type.value,
             "title": content.title,
             "body": content.body,
@@ -21,35 +36,63 @@ class ContentMapper:
             "updated_at": content.updated_at,
         }
     
+    @staticmethod
+    def summary_projection() -> Dict[str, Any]:
+        """
+        Projection returning the fields of a ContentSummary.
+        The excerpt and body length are computed by MongoDB, so the body
+        itself never leaves the server.
+        """
+        return {
+            "id": 1,  # legacy documents only; _id is included by default
+            "content_type": 1,
+            "title": 1,
+            "status": 1,
+            "metadata": 1,
+            "created_at": 1,
+            "updated_at": 1,
+            "excerpt": {"$substrCP": ["$body", 0, ContentSummary.EXCERPT_LENGTH]},
+            "body_length": {"$strLenCP": "$body"},
+        }
+    
     @staticmethod
     def to_entity(document: Dict[str, Any]) -> Content:
         """Convert MongoDB document to Content entity."""
-        from datetime import datetime
-        
-        # Handle datetime conversion
-        created_at = document.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        elif not isinstance(created_at, datetime):
-            created_at = datetime.now()
-        
-        updated_at = document.get("updated_at")
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-        elif not isinstance(updated_at, datetime):
-            updated_at = datetime.now()
-        
-        from uuid import UUID
-        
-        return Content(
-            id=UUID(document["id"]),
-            content_type=ContentType(document["content_type"]),
+        return Content.hydrate(
+            id=document_id(document),
+            content_type=TYPE_BY_VALUE.get(document["content_type"]) or ContentType(document["content_type"]),
             title=document["title"],
             body=document["body"],
+            metadata=document.get("metadata") or {},
+            status=STATUS_BY_VALUE.get(document["status"]) or ContentStatus(document["status"]),
+            seo_meta=document.get("seo_meta") or {},
+            created_at=to_datetime(document.get("created_at")),
+            updated_at=to_datetime(document.get("updated_at")),
+        )
+    
+    @staticmethod
+    def to_summary(document: Dict[str, Any]) -> ContentSummary:
+        """Convert a document projected with summary_projection() to a ContentSummary."""
+        return ContentSummary(
+            id=document_id(document),
+            content_type=TYPE_BY_VALUE.get(document["content_type"]) or ContentType(document["content_type"]),
+            title=document["title"],
+            excerpt=document.get("excerpt", ""),
+            body_length=document.get("body_length", 0),
+            status=STATUS_BY_VALUE.get(document["status"]) or ContentStatus(document["status"]),
             metadata=document.get("metadata", {}),
-            status=ContentStatus(document["status"]),
-            seo_meta=document.get("seo_meta", {}),
-            created_at=created_at,
-            updated_at=updated_at,
+            created_at=to_datetime(document.get("created_at")),
+            updated_at=to_datetime(document.get("updated_at")),
         )
-
+    
+    @staticmethod
+    def to_entities(documents: Iterable[Dict[str, Any]]) -> List[Content]:
+        """Convert many MongoDB documents to Content entities."""
+        to_entity = ContentMapper.to_entity
+        return [to_entity(document) for document in documents]
+    
+    @staticmethod
+    def to_summaries(documents: Iterable[Dict[str, Any]]) -> List[ContentSummary]:
+        """Convert many documents projected with summary_projection() to ContentSummaries."""
+        to_summary = ContentMapper.to_summary
+        return [to_summary(document) for document in documents]
@@ -3,9 +3,12 @@ from uuid import UUID
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from ...domain.content.entity import Content, ContentType, ContentStatus
+from ...domain.content.entity import Content, ContentSummary, ContentType, ContentStatus
 from ...domain.content.repository import ContentRepository
 from ...domain.content.exceptions import ContentNotFoundError
+from ...domain.pagination import PageCursor
+from ..identity import id_filter
+from ..pagination import find_page
 from .mapper import ContentMapper
 
 
@@ -25,31 +28,73 @@ class MongoDBContentRepository(ContentRepository):
     async def update(self, content: Content) -> Content:
         """Update existing content."""
         document = ContentMapper.to_document(content)
+        
+        # Remove _id from update document (MongoDB doesn't allow updating _id)
+        update_doc = {k: v for k, v in document.items() if k != "_id"}
+        
         await self.collection.update_one(
-            {"id": str(content.id)},
-            {"$set": document}
+            id_filter(content.id),
+            {"$set": update_doc}
         )
         return content
     
     async def get_by_id(self, content_id: UUID) -> Optional[Content]:
         """Get content by ID."""
-        document = await self.collection.find_one({"id": str(content_id)})
+        document = await self.collection.find_one(id_filter(content_id))
         if not document:
             return None
         return ContentMapper.to_entity(document)
     
-    async def get_by_type_for_admin(self, content_type: ContentType) -> List[Content]:
-        """Get all content of a type (for admin - includes DRAFT and PUBLISHED)."""
-        cursor = self.collection.find({"content_type": content_type.value})
-        documents = await cursor.to_list(length=None)
-        return [ContentMapper.to_entity(doc) for doc in documents]
+    async def get_by_type_for_admin(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get all content of a type (for admin - includes DRAFT and PUBLISHED), ordered by (created_at, id)."""
+        documents = await find_page(
+            self.collection, {"content_type": content_type.value}, limit, after
+        )
+        return ContentMapper.to_entities(documents)
     
-    async def get_published_by_type(self, content_type: ContentType) -> List[Content]:
-        """Get published content of a type (for public access)."""
-        cursor = self.collection.find({
-            "content_type": content_type.value,
-            "status": ContentStatus.PUBLISHED.value,
-        })
-        documents = await cursor.to_list(length=None)
-        return [ContentMapper.to_entity(doc) for doc in documents]
-
+    async def get_published_by_type(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get published content of a type (for public access), ordered by (created_at, id)."""
+        documents = await find_page(
+            self.collection,
+            {
+                "content_type": content_type.value,
+                "status": ContentStatus.PUBLISHED.value,
+            },
+            limit,
+            after,
+        )
+        return ContentMapper.to_entities(documents)
+    
+    async def get_summaries_by_type(
+        self,
+        content_type: ContentType,
+        status: Optional[ContentStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ContentSummary]:
+        """
+        Get summaries of content of a type, optionally only in one status,
+        ordered by (created_at, id). Bodies are reduced to an excerpt and a
+        length by a server-side projection.
+        """
+        filter_query = {"content_type": content_type.value}
+        if status is not None:
+            filter_query["status"] = status.value
+        documents = await find_page(
+            self.collection,
+            filter_query,
+            limit,
+            after,
+            projection=ContentMapper.summary_projection(),
+        )
+        return ContentMapper.to_summaries(documents)
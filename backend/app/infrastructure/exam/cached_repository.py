@@ -0,0 +1,93 @@
+import copy
+from typing import Hashable, List, Optional
+from uuid import UUID
+
+from ...core.cache import TTLCache
+from ...domain.exam.entity import Exam
+from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor
+
+# Cache tags; a change to an exam evicts its own entry and every list
+ALL_EXAMS_TAG = "exams:all"
+ACTIVE_EXAMS_TAG = "exams:active"
+
+
+def exam_tag(exam_id: UUID) -> str:
+    """Cache tag of a single exam."""
+    return f"exam:{exam_id}"
+
+
+class CachingExamRepository(ExamRepository):
+    """
+    ExamRepository decorator that keeps exams and exam listings in a TTL+LRU cache.
+    
+    Single exams are tagged exam:{id}; listings are tagged exams:all or
+    exams:active. create and update write through to the wrapped repository
+    and then evict the affected tags, so changes made through this process
+    are visible immediately. Callers always receive their own copies.
+    """
+    
+    def __init__(self, repository: ExamRepository, cache: TTLCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def create(self, exam: Exam) -> Exam:
+        """Create a new exam."""
+        try:
+            return await self.repository.create(exam)
+        finally:
+            self.cache.invalidate_tag(exam_tag(exam.id), ALL_EXAMS_TAG, ACTIVE_EXAMS_TAG)
+    
+    async def get_by_id(self, exam_id: UUID) -> Optional[Exam]:
+        """Get exam by ID, from the cache when possible."""
+        key = ("exam", exam_id)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return copy.copy(cached)
+        
+        generation = self.cache.generation
+        exam = await self.repository.get_by_id(exam_id)
+        if exam:
+            self.cache.set(key, copy.copy(exam), tags=[exam_tag(exam_id)], generation=generation)
+        return exam
+    
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all exams, ordered by (created_at, id), optionally one page at a time."""
+        return await self._get_list(
+            ALL_EXAMS_TAG, limit, after,
+            lambda: self.repository.get_all(limit=limit, after=after),
+        )
+    
+    async def get_active(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all active exams, ordered by (created_at, id), optionally one page at a time."""
+        return await self._get_list(
+            ACTIVE_EXAMS_TAG, limit, after,
+            lambda: self.repository.get_active(limit=limit, after=after),
+        )
+    
+    async def update(self, exam: Exam) -> Exam:
+        """Update an existing exam and evict it and every exam listing."""
+        try:
+            return await self.repository.update(exam)
+        finally:
+            self.cache.invalidate_tag(exam_tag(exam.id), ALL_EXAMS_TAG, ACTIVE_EXAMS_TAG)
+    
+    async def _get_list(self, tag: str, limit, after, load) -> List[Exam]:
+        """Serve a listing page from the cache, loading it on a miss."""
+        key: Hashable = (tag, limit, after.encode() if after else None)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return [copy.copy(exam) for exam in cached]
+        
+        generation = self.cache.generation
+        exams = await load()
+        self.cache.set(key, [copy.copy(exam) for exam in exams], tags=[tag], generation=generation)
+        return exams
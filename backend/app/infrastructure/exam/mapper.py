@@ -1,6 +1,13 @@
-from ...domain.exam.entity import Exam
+from decimal import Decimal
+from typing import Iterable, List
+
+from ...domain.exam.entity import Exam, ExamStatus
+from ..identity import document_id
 from .models import ExamDocument
 
+# Enum lookups by value; much cheaper than calling the enum on every document
+STATUS_BY_VALUE = {status.value: status for status in ExamStatus}
+
 
 class ExamMapper:
     """Mapper between domain entity and MongoDB document."""
@@ -9,8 +16,7 @@ class ExamMapper:
     def to_document(exam: Exam) -> dict:
         """Convert domain entity to MongoDB document."""
         return {
-            "_id": str(exam.id),
-            "id": str(exam.id),
+            "_id": exam.id,
             "title": exam.title,
             "description": exam.description,
             "start_date": exam.start_date,
@@ -18,29 +24,41 @@ class ExamMapper:
             "fee": str(exam.fee),
             "status": exam.status.value,
             "created_at": exam.created_at,
+            "updated_at": exam.updated_at,
         }
     
     @staticmethod
     def to_entity(document: dict) -> Exam:
         """Convert MongoDB document to domain entity."""
-        from decimal import Decimal
-        from uuid import UUID
-        from ...domain.exam.entity import ExamStatus
-        
-        # Handle both string and UUID id
-        exam_id = document.get("id") or document.get("_id")
-        if isinstance(exam_id, str):
-            exam_id = UUID(exam_id)
-        
-        return Exam(
-            id=exam_id,
+        return Exam.hydrate(
+            id=document_id(document),
             title=document["title"],
             description=document.get("description"),
             start_date=document["start_date"],
             end_date=document["end_date"],
             fee=Decimal(str(document.get("fee", "0.00"))),
-            status=ExamStatus(document["status"]),
+            status=STATUS_BY_VALUE.get(document["status"]) or ExamStatus(document["status"]),
             created_at=document["created_at"],
+            # Exams stored before updated_at existed fall back to created_at
+            updated_at=document.get("updated_at"),
         )
-
-
+    
+    @staticmethod
+    def to_entities(documents: Iterable[dict]) -> List[Exam]:
+        """Convert many MongoDB documents to domain entities."""
+        hydrate = Exam.hydrate
+        statuses = STATUS_BY_VALUE
+        return [
+            hydrate(
+                document_id(document),
+                document["title"],
+                document.get("description"),
+                document["start_date"],
+                document["end_date"],
+                Decimal(str(document.get("fee", "0.00"))),
+                statuses.get(document["status"]) or ExamStatus(document["status"]),
+                document["created_at"],
+                document.get("updated_at"),
+            )
+            for document in documents
+        ]
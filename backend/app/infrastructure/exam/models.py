@@ -20,7 +20,8 @@ class ExamDocument(BaseModel):
                 "end_date": "2024-06-01T12:00:00",
                 "fee": "500.00",
                 "status": "ACTIVE",
-                "created_at": "2024-01-01T00:00:00"
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-01-01T00:00:00"
             }
         }
     )
@@ -33,5 +34,6 @@ class ExamDocument(BaseModel):
     fee: Decimal
     status: ExamStatus
     created_at: datetime
+    updated_at: Optional[datetime] = None
 
 
@@ -6,6 +6,9 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from ...domain.exam.entity import Exam, ExamStatus
 from ...domain.exam.exceptions import ExamNotFoundError
 from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor
+from ..identity import id_filter
+from ..pagination import find_page
 from .mapper import ExamMapper
 
 
@@ -24,24 +27,32 @@ class MongoDBExamRepository(ExamRepository):
     
     async def get_by_id(self, exam_id: UUID) -> Optional[Exam]:
         """Get exam by ID."""
-        document = await self.collection.find_one({"id": str(exam_id)})
+        document = await self.collection.find_one(id_filter(exam_id))
         
         if not document:
             return None
         
         return ExamMapper.to_entity(document)
     
-    async def get_all(self) -> List[Exam]:
-        """Get all exams."""
-        cursor = self.collection.find({})
-        documents = await cursor.to_list(length=None)
-        return [ExamMapper.to_entity(doc) for doc in documents]
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all exams, ordered by (created_at, id), optionally one page at a time."""
+        documents = await find_page(self.collection, {}, limit, after)
+        return ExamMapper.to_entities(documents)
     
-    async def get_active(self) -> List[Exam]:
-        """Get all active exams."""
-        cursor = self.collection.find({"status": ExamStatus.ACTIVE.value})
-        documents = await cursor.to_list(length=None)
-        return [ExamMapper.to_entity(doc) for doc in documents]
+    async def get_active(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all active exams, ordered by (created_at, id), optionally one page at a time."""
+        documents = await find_page(
+            self.collection, {"status": ExamStatus.ACTIVE.value}, limit, after
+        )
+        return ExamMapper.to_entities(documents)
     
     async def update(self, exam: Exam) -> Exam:
         """Update an existing exam."""
@@ -51,7 +62,7 @@ class MongoDBExamRepository(ExamRepository):
         update_doc = {k: v for k, v in document.items() if k != "_id"}
         
         result = await self.collection.update_one(
-            {"id": str(exam.id)},
+            id_filter(exam.id),
             {"$set": update_doc}
         )
         
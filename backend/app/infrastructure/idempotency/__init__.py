@@ -0,0 +1,2 @@
+# Idempotency infrastructure module
+
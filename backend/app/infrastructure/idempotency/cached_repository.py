@@ -0,0 +1,41 @@
+import copy
+
+from ...core.cache import TTLCache
+from ...domain.idempotency.entity import IdempotencyRecord
+from ...domain.idempotency.repository import IdempotencyRepository
+
+
+class CachingIdempotencyRepository(IdempotencyRepository):
+    """
+    IdempotencyRepository decorator keeping completed records in a TTL+LRU cache.
+    
+    Completed records never change, so a retry that reaches the process
+    which served the original request is answered without touching the
+    database. Pending records are never cached: claims always go to the
+    wrapped repository, which decides between concurrent requests. Keep the
+    cache TTL below the replay window of the wrapped repository.
+    """
+    
+    def __init__(self, repository: IdempotencyRepository, cache: TTLCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def claim(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        """Return a cached completed record for the key, or claim it in the wrapped repository."""
+        cached = self.cache.get(record.id)
+        if cached is not None:
+            return copy.copy(cached)
+        
+        stored = await self.repository.claim(record)
+        if not stored.pending:
+            self.cache.set(stored.id, copy.copy(stored))
+        return stored
+    
+    async def complete(self, record: IdempotencyRecord) -> None:
+        """Store the response and cache the completed record."""
+        await self.repository.complete(record)
+        self.cache.set(record.id, copy.copy(record))
+    
+    async def release(self, record: IdempotencyRecord) -> None:
+        """Delete a pending record; pending records are never cached."""
+        await self.repository.release(record)
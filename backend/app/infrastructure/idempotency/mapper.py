@@ -0,0 +1,32 @@
+from ...domain.idempotency.entity import IdempotencyRecord
+
+
+class IdempotencyMapper:
+    """Mapper between domain entity and MongoDB document."""
+    
+    @staticmethod
+    def to_document(record: IdempotencyRecord) -> dict:
+        """Convert domain entity to MongoDB document."""
+        return {
+            "_id": record.id,
+            "user_id": record.user_id,
+            "key": record.key,
+            "request": record.request,
+            "claim_id": record.claim_id,
+            "status_code": record.status_code,
+            "body": record.body,
+            "expires_at": record.expires_at,
+        }
+    
+    @staticmethod
+    def to_entity(document: dict) -> IdempotencyRecord:
+        """Convert MongoDB document to domain entity."""
+        return IdempotencyRecord(
+            user_id=document["user_id"],
+            key=document["key"],
+            request=document["request"],
+            claim_id=document["claim_id"],
+            status_code=document.get("status_code"),
+            body=document.get("body"),
+            expires_at=document.get("expires_at"),
+        )
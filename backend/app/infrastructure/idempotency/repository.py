@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from ...domain.idempotency.entity import IdempotencyRecord
+from ...domain.idempotency.repository import IdempotencyRepository
+from .mapper import IdempotencyMapper
+
+
+class MongoDBIdempotencyRepository(IdempotencyRepository):
+    """
+    MongoDB implementation of IdempotencyRepository.
+    
+    A TTL index on expires_at deletes expired records. MongoDB's TTL
+    monitor runs once a minute, so a record can outlive its expiry by up to
+    that long.
+    """
+    
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        ttl_seconds: float = 24 * 60 * 60,
+        pending_ttl_seconds: float = 60,
+    ):
+        self.db = db
+        self.collection = db.idempotency_keys
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.pending_ttl = timedelta(seconds=pending_ttl_seconds)
+    
+    async def claim(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        """
+        Insert a pending record or return the live one holding its key.
+        An expired record the TTL monitor has not deleted yet is replaced,
+        in one findOneAndReplace matching the key only while it is expired.
+        """
+        while True:
+            now = datetime.now(timezone.utc)
+            record.expires_at = now + self.pending_ttl
+            try:
+                document = await self.collection.find_one_and_replace(
+                    {"_id": record.id, "expires_at": {"$lte": now}},
+                    IdempotencyMapper.to_document(record),
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            except DuplicateKeyError:
+                # The key is held by a live record, or a concurrent claim
+                # inserted it first; if it expired or was released since, retry
+                document = await self.collection.find_one(
+                    {"_id": record.id, "expires_at": {"$gt": now}}
+                )
+                if not document:
+                    continue
+            
+            return IdempotencyMapper.to_entity(document)
+    
+    async def complete(self, record: IdempotencyRecord) -> None:
+        """Store the response of a record claimed by this caller."""
+        record.expires_at = datetime.now(timezone.utc) + self.ttl
+        await self.collection.update_one(
+            {"_id": record.id, "claim_id": record.claim_id},
+            {"$set": {
+                "status_code": record.status_code,
+                "body": record.body,
+                "expires_at": record.expires_at,
+            }},
+        )
+    
+    async def release(self, record: IdempotencyRecord) -> None:
+        """Delete a pending record claimed by this caller."""
+        await self.collection.delete_one(
+            {"_id": record.id, "claim_id": record.claim_id, "status_code": None}
+        )
@@ -0,0 +1,77 @@
+import os
+from typing import Any, Dict, Iterable, List, Union
+from uuid import UUID
+
+from bson import Binary, ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# Motor clients must be created with uuidRepresentation=UUID_REPRESENTATION so
+# UUIDs are stored as BSON binary subtype 4 and decoded back to uuid.UUID
+UUID_REPRESENTATION = "standard"
+
+# While collections are being converted by scripts/migrate_uuid_ids.py, lookups
+# also match documents still in the legacy format (string UUIDs, duplicated
+# "id" field). Turn this off once the migration has finished; with it off, the
+# application refuses to start while legacy documents remain.
+LEGACY_ID_READS = os.getenv("MONGO_LEGACY_ID_READS", "false").lower() == "true"
+
+# Documents not yet converted: their _id is a string or an ObjectId
+LEGACY_ID_FILTER = {"_id": {"$not": {"$type": "binData"}}}
+
+
+def to_uuid(value: Union[UUID, Binary, str]) -> UUID:
+    """Read a UUID stored either as BSON binary or as a legacy string."""
+    if isinstance(value, UUID):
+        return value
+    if isinstance(value, Binary):
+        return value.as_uuid()
+    return UUID(value)
+
+
+def document_id(document: Dict[str, Any]) -> UUID:
+    """
+    Get the entity id of a document in either storage format.
+    
+    Current documents keep the id in _id only. Legacy documents repeat it
+    in an "id" string field, and legacy content documents have an ObjectId
+    _id, so "id" is used whenever _id is not a UUID.
+    """
+    value = document.get("_id")
+    if value is None or isinstance(value, ObjectId):
+        value = document["id"]
+    return to_uuid(value)
+
+
+def uuid_match(value: UUID) -> Any:
+    """Filter value matching a UUID field, including legacy strings when enabled."""
+    if LEGACY_ID_READS:
+        return {"$in": [value, str(value)]}
+    return value
+
+
+def id_filter(value: UUID) -> Dict[str, Any]:
+    """Filter matching the document with the given entity id."""
+    if LEGACY_ID_READS:
+        return {"$or": [{"_id": value}, {"id": str(value)}]}
+    return {"_id": value}
+
+
+def ids_filter(values: Iterable[UUID]) -> Dict[str, Any]:
+    """Filter matching the documents with any of the given entity ids."""
+    values: List[UUID] = list(values)
+    if LEGACY_ID_READS:
+        return {
+            "$or": [
+                {"_id": {"$in": values}},
+                {"id": {"$in": [str(value) for value in values]}},
+            ]
+        }
+    return {"_id": {"$in": values}}
+
+
+async def legacy_collections(db: AsyncIOMotorDatabase, names: Iterable[str]) -> List[str]:
+    """Names of the collections that still hold documents in the legacy format."""
+    return [
+        name for name in names
+        if await db[name].find_one(LEGACY_ID_FILTER, projection={"_id": 1}) is not None
+    ]
@@ -0,0 +1,49 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# Collections whose documents may still carry a legacy "id" field
+ID_COLLECTIONS = ("users", "exams", "content", "exam_registrations")
+
+
+async def create_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create the indexes every collection relies on.
+    
+    Entity ids live in _id only, so no separate unique id index is needed.
+    Safe to call repeatedly: existing indexes are left untouched.
+    """
+    await relax_legacy_id_indexes(db)
+    
+    await db.users.create_index("email", unique=True)
+    # Only users whose role has changed; keeps the role version refresh tiny
+    await db.users.create_index(
+        "role_version", partialFilterExpression={"role_version": {"$gt": 0}}
+    )
+    await db.exam_registrations.create_index([("user_id", 1), ("exam_id", 1)], unique=True)
+    await db.exam_registrations.create_index([("exam_id", 1), ("status", 1)])
+    await db.content.create_index("status")
+    # Expired idempotency records are deleted by MongoDB's TTL monitor
+    await db.idempotency_keys.create_index("expires_at", expireAfterSeconds=0)
+    
+    # Keyset pagination indexes: equality fields first, then (created_at, _id)
+    await db.exams.create_index([("created_at", 1), ("_id", 1)])
+    await db.exams.create_index([("status", 1), ("created_at", 1), ("_id", 1)])
+    await db.exam_registrations.create_index([("user_id", 1), ("created_at", 1), ("_id", 1)])
+    await db.exam_registrations.create_index([("exam_id", 1), ("created_at", 1), ("_id", 1)])
+    await db.content.create_index([("content_type", 1), ("created_at", 1), ("_id", 1)])
+    await db.content.create_index([("content_type", 1), ("status", 1), ("created_at", 1), ("_id", 1)])
+
+
+async def relax_legacy_id_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Turn unique "id" indexes left by the legacy format into sparse ones.
+    
+    New documents have no "id" field, so a unique index on it would reject
+    every insert after the first. The sparse index keeps lookups of legacy
+    documents indexed until scripts/migrate_uuid_ids.py drops it.
+    """
+    for name in ID_COLLECTIONS:
+        collection = db[name]
+        index = (await collection.index_information()).get("id_1")
+        if index and index.get("unique"):
+            await collection.drop_index("id_1")
+            await collection.create_index("id", sparse=True)
@@ -0,0 +1,113 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from ..core.metrics import REGISTRY, MetricsRegistry
+from ..core.tracing import current_span, span
+
+# Repository operation ("registrations.get_by_exam_id") being run by the
+# current task; read by the command listener to attribute MongoDB commands
+current_operation: ContextVar[Optional[str]] = ContextVar("current_operation", default=None)
+
+# Returned by anext() once an async generator is exhausted
+_DONE = object()
+
+
+class InstrumentedRepository:
+    """
+    Repository decorator counting the operations performed on the wrapped store.
+    
+    Works for any repository: every coroutine method is wrapped on first
+    access to count calls by repository, operation and outcome ("ok" or
+    "error"), and the wrapper is then stored on the instance so later calls
+    skip the lookup. Async generator methods are counted once per iteration,
+    when it completes or fails. Other attributes pass through unchanged.
+    While an operation runs, current_operation names it, and sampled
+    requests get a span of the same name ("registrations.create").
+    
+    Wrap the database repository, below any caching decorator, so the
+    counters show what actually reaches the store.
+    """
+    
+    def __init__(self, repository: Any, name: str, registry: MetricsRegistry = REGISTRY):
+        self.repository = repository
+        self.name = name
+        self.operations = registry.counter(
+            "repository_operations_total",
+            "Repository operations, by repository, operation and outcome.",
+            ("repository", "operation", "outcome"),
+        )
+    
+    def __getattr__(self, attribute: str) -> Any:
+        if attribute == "repository":
+            # Not set yet (e.g. while copying); avoid recursing into ourselves
+            raise AttributeError(attribute)
+        value = getattr(self.repository, attribute)
+        if inspect.iscoroutinefunction(value):
+            wrapper = self._count_coroutine(attribute, value)
+        elif inspect.isasyncgenfunction(value):
+            wrapper = self._count_async_generator(attribute, value)
+        else:
+            return value
+        setattr(self, attribute, wrapper)
+        return wrapper
+    
+    def _count_coroutine(self, operation: str, method: Callable) -> Callable:
+        """Wrap a coroutine method so each call is counted with its outcome."""
+        ok, error = (self.name, operation, "ok"), (self.name, operation, "error")
+        operations = self.operations
+        qualified_name = f"{self.name}.{operation}"
+        
+        @functools.wraps(method)
+        async def counted(*args, **kwargs):
+            token = current_operation.set(qualified_name)
+            try:
+                if current_span.get() is None:
+                    result = await method(*args, **kwargs)
+                else:
+                    with span(qualified_name):
+                        result = await method(*args, **kwargs)
+            except Exception:
+                operations.inc(error)
+                raise
+            finally:
+                current_operation.reset(token)
+            operations.inc(ok)
+            return result
+        
+        return counted
+    
+    def _count_async_generator(self, operation: str, method: Callable) -> Callable:
+        """Wrap an async generator method so each iteration is counted with its outcome."""
+        ok, error = (self.name, operation, "ok"), (self.name, operation, "error")
+        operations = self.operations
+        qualified_name = f"{self.name}.{operation}"
+        
+        @functools.wraps(method)
+        async def counted(*args, **kwargs):
+            items = method(*args, **kwargs)
+            try:
+                while True:
+                    # Set per step: a context variable set before a yield
+                    # would leak into the consumer's code
+                    token = current_operation.set(qualified_name)
+                    try:
+                        if current_span.get() is None:
+                            item = await anext(items, _DONE)
+                        else:
+                            with span(qualified_name):
+                                item = await anext(items, _DONE)
+                    except Exception:
+                        operations.inc(error)
+                        raise
+                    finally:
+                        current_operation.reset(token)
+                    if item is _DONE:
+                        break
+                    yield item
+            finally:
+                await items.aclose()
+            operations.inc(ok)
+        
+        return counted
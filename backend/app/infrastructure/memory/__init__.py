@@ -0,0 +1,21 @@
+"""
+In-memory repository implementations.
+
+Used by tests and benchmarks in place of MongoDB. They enforce the same
+uniqueness rules as the MongoDB indexes and hand out copies of stored
+entities, so callers cannot change stored state without going through the
+repository.
+"""
+from .content import InMemoryContentRepository
+from .exam import InMemoryExamRepository
+from .idempotency import InMemoryIdempotencyRepository
+from .registration import InMemoryRegistrationRepository
+from .user import InMemoryUserRepository
+
+__all__ = [
+    "InMemoryContentRepository",
+    "InMemoryExamRepository",
+    "InMemoryIdempotencyRepository",
+    "InMemoryRegistrationRepository",
+    "InMemoryUserRepository",
+]
@@ -0,0 +1,72 @@
+import copy
+import threading
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ...domain.content.entity import Content, ContentStatus, ContentType
+from ...domain.content.exceptions import ContentNotFoundError
+from ...domain.content.repository import ContentRepository
+from ...domain.pagination import PageCursor, paginate
+
+
+class InMemoryContentRepository(ContentRepository):
+    """In-memory implementation of ContentRepository. Safe to use from several threads and coroutines."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._contents: Dict[UUID, Content] = {}
+    
+    async def create(self, content: Content) -> Content:
+        """Create a new content."""
+        with self._lock:
+            if content.id in self._contents:
+                raise ValueError(f"Content with id {content.id} already exists")
+            self._contents[content.id] = copy.copy(content)
+        return content
+    
+    async def update(self, content: Content) -> Content:
+        """Update existing content."""
+        with self._lock:
+            if content.id not in self._contents:
+                raise ContentNotFoundError(f"Content {content.id} not found")
+            self._contents[content.id] = copy.copy(content)
+        return content
+    
+    async def get_by_id(self, content_id: UUID) -> Optional[Content]:
+        """Get content by ID."""
+        with self._lock:
+            content = self._contents.get(content_id)
+            return copy.copy(content) if content else None
+    
+    async def get_by_type_for_admin(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get all content of a type (for admin - includes DRAFT and PUBLISHED), ordered by (created_at, id)."""
+        with self._lock:
+            contents = paginate(
+                (c for c in self._contents.values() if c.content_type == content_type),
+                limit,
+                after,
+            )
+            return [copy.copy(content) for content in contents]
+    
+    async def get_published_by_type(
+        self,
+        content_type: ContentType,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Content]:
+        """Get published content of a type (for public access), ordered by (created_at, id)."""
+        with self._lock:
+            contents = paginate(
+                (
+                    c for c in self._contents.values()
+                    if c.content_type == content_type and c.status == ContentStatus.PUBLISHED
+                ),
+                limit,
+                after,
+            )
+            return [copy.copy(content) for content in contents]
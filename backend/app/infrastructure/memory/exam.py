@@ -0,0 +1,63 @@
+import copy
+import threading
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ...domain.exam.entity import Exam, ExamStatus
+from ...domain.exam.exceptions import ExamNotFoundError
+from ...domain.exam.repository import ExamRepository
+from ...domain.pagination import PageCursor, paginate
+
+
+class InMemoryExamRepository(ExamRepository):
+    """In-memory implementation of ExamRepository. Safe to use from several threads and coroutines."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._exams: Dict[UUID, Exam] = {}
+    
+    async def create(self, exam: Exam) -> Exam:
+        """Create a new exam."""
+        with self._lock:
+            if exam.id in self._exams:
+                raise ValueError(f"Exam with id {exam.id} already exists")
+            self._exams[exam.id] = copy.copy(exam)
+        return exam
+    
+    async def get_by_id(self, exam_id: UUID) -> Optional[Exam]:
+        """Get exam by ID."""
+        with self._lock:
+            exam = self._exams.get(exam_id)
+            return copy.copy(exam) if exam else None
+    
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all exams, ordered by (created_at, id), optionally one page at a time."""
+        with self._lock:
+            exams = paginate(self._exams.values(), limit, after)
+            return [copy.copy(exam) for exam in exams]
+    
+    async def get_active(
+        self,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Exam]:
+        """Get all active exams, ordered by (created_at, id), optionally one page at a time."""
+        with self._lock:
+            exams = paginate(
+                (exam for exam in self._exams.values() if exam.status == ExamStatus.ACTIVE),
+                limit,
+                after,
+            )
+            return [copy.copy(exam) for exam in exams]
+    
+    async def update(self, exam: Exam) -> Exam:
+        """Update an existing exam."""
+        with self._lock:
+            if exam.id not in self._exams:
+                raise ExamNotFoundError(f"Exam with id {exam.id} not found")
+            self._exams[exam.id] = copy.copy(exam)
+        return exam
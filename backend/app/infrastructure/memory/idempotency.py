@@ -0,0 +1,49 @@
+import copy
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from ...domain.idempotency.entity import IdempotencyRecord
+from ...domain.idempotency.repository import IdempotencyRepository
+
+
+class InMemoryIdempotencyRepository(IdempotencyRepository):
+    """
+    In-memory implementation of IdempotencyRepository.
+    
+    Expired records are treated as absent, like the TTL index in MongoDB.
+    Safe to use from several threads and coroutines.
+    """
+    
+    def __init__(self, ttl_seconds: float = 24 * 60 * 60, pending_ttl_seconds: float = 60):
+        self._lock = threading.Lock()
+        self._records: Dict[str, IdempotencyRecord] = {}
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.pending_ttl = timedelta(seconds=pending_ttl_seconds)
+    
+    async def claim(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        """Store a pending record unless its key is taken; return the stored record."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            existing = self._records.get(record.id)
+            if existing and existing.expires_at > now:
+                return copy.copy(existing)
+            
+            record.expires_at = now + self.pending_ttl
+            self._records[record.id] = copy.copy(record)
+        return record
+    
+    async def complete(self, record: IdempotencyRecord) -> None:
+        """Store the response of a record claimed by this caller."""
+        with self._lock:
+            existing = self._records.get(record.id)
+            if existing and existing.claim_id == record.claim_id:
+                record.expires_at = datetime.now(timezone.utc) + self.ttl
+                self._records[record.id] = copy.copy(record)
+    
+    async def release(self, record: IdempotencyRecord) -> None:
+        """Delete a pending record claimed by this caller."""
+        with self._lock:
+            existing = self._records.get(record.id)
+            if existing and existing.claim_id == record.claim_id and existing.pending:
+                del self._records[record.id]
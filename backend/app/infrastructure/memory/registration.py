@@ -0,0 +1,179 @@
+import copy
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from ...domain.pagination import PageCursor, paginate
+from ...domain.registration.entity import ExamRegistration, RegistrationStatus
+from ...domain.registration.exceptions import DuplicateRegistrationError, RegistrationNotFoundError
+from ...domain.registration.repository import RegistrationRepository
+from ...domain.registration.transitions import RegistrationTransition
+
+
+class InMemoryRegistrationRepository(RegistrationRepository):
+    """
+    In-memory implementation of RegistrationRepository.
+    
+    A user can register for an exam only once, like the unique
+    (user_id, exam_id) index in MongoDB. Status updates are atomic. Safe to
+    use from several threads and coroutines.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._registrations: Dict[UUID, ExamRegistration] = {}
+        self._ids_by_user_exam: Dict[Tuple[UUID, UUID], UUID] = {}
+    
+    async def create(self, registration: ExamRegistration) -> ExamRegistration:
+        """Create a new registration."""
+        key = (registration.user_id, registration.exam_id)
+        with self._lock:
+            if key in self._ids_by_user_exam or registration.id in self._registrations:
+                raise DuplicateRegistrationError(
+                    f"User {registration.user_id} is already registered for exam {registration.exam_id}"
+                )
+            
+            self._registrations[registration.id] = copy.copy(registration)
+            self._ids_by_user_exam[key] = registration.id
+        return registration
+    
+    async def get_by_id(self, registration_id: UUID) -> Optional[ExamRegistration]:
+        """Get registration by ID."""
+        with self._lock:
+            registration = self._registrations.get(registration_id)
+            return copy.copy(registration) if registration else None
+    
+    async def get_by_user_and_exam(
+        self,
+        user_id: UUID,
+        exam_id: UUID,
+    ) -> Optional[ExamRegistration]:
+        """Get registration by user_id and exam_id."""
+        with self._lock:
+            registration_id = self._ids_by_user_exam.get((user_id, exam_id))
+            return copy.copy(self._registrations[registration_id]) if registration_id else None
+    
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
+        """Get all registrations for a user, ordered by (created_at, id), optionally one page at a time."""
+        with self._lock:
+            registrations = paginate(
+                (r for r in self._registrations.values() if r.user_id == user_id),
+                limit,
+                after,
+            )
+            return [copy.copy(registration) for registration in registrations]
+    
+    async def get_by_exam_id(
+        self,
+        exam_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
+        """Get all registrations for an exam, ordered by (created_at, id), optionally one page at a time."""
+        with self._lock:
+            registrations = paginate(
+                (r for r in self._registrations.values() if r.exam_id == exam_id),
+                limit,
+                after,
+            )
+            return [copy.copy(registration) for registration in registrations]
+    
+    async def update_status(
+        self,
+        registration_id: UUID,
+        new_status: RegistrationStatus,
+        expected_status: Optional[RegistrationStatus] = None,
+        expected_statuses: Optional[Set[RegistrationStatus]] = None,
+    ) -> ExamRegistration:
+        """Update registration status atomically."""
+        with self._lock:
+            registration = self._registrations.get(registration_id)
+            if not registration:
+                raise RegistrationNotFoundError(f"Registration with id {registration_id} not found")
+            
+            current_status = registration.status.value
+            if expected_status and registration.status != expected_status:
+                raise ValueError(
+                    f"Cannot transition from {current_status} to {new_status.value}. "
+                    f"Expected {expected_status.value}"
+                )
+            if expected_statuses and registration.status not in expected_statuses:
+                raise ValueError(
+                    f"Cannot transition from {current_status} to {new_status.value}. "
+                    f"Expected one of: {', '.join(s.value for s in expected_statuses)}"
+                )
+            
+            registration.status = new_status
+            return copy.copy(registration)
+    
+    async def apply_transition(
+        self,
+        registration_id: UUID,
+        transition: RegistrationTransition,
+        user_id: Optional[UUID] = None,
+    ) -> ExamRegistration:
+        """Apply a status transition atomically."""
+        with self._lock:
+            registration = self._registrations.get(registration_id)
+            error = transition.rejection(registration_id, registration, user_id)
+            if error:
+                raise error
+            
+            registration.status = transition.target
+            return copy.copy(registration)
+    
+    async def bulk_update_status(
+        self,
+        registration_ids: Iterable[UUID],
+        new_status: RegistrationStatus,
+        expected_statuses: Optional[Set[RegistrationStatus]] = None,
+    ) -> Tuple[Dict[UUID, ExamRegistration], Set[UUID]]:
+        """Update the status of many registrations, each one atomically."""
+        found: Dict[UUID, ExamRegistration] = {}
+        updated: Set[UUID] = set()
+        with self._lock:
+            for registration_id in dict.fromkeys(registration_ids):
+                registration = self._registrations.get(registration_id)
+                if not registration:
+                    continue
+                
+                if registration.status != new_status and (
+                    not expected_statuses or registration.status in expected_statuses
+                ):
+                    registration.status = new_status
+                    updated.add(registration_id)
+                found[registration_id] = copy.copy(registration)
+        
+        return found, updated
+    
+    async def count_by_exam_id(
+        self,
+        exam_id: UUID,
+        statuses: Optional[Set[RegistrationStatus]] = None,
+    ) -> int:
+        """Count registrations for an exam, optionally only those in statuses."""
+        with self._lock:
+            return sum(
+                1 for r in self._registrations.values()
+                if r.exam_id == exam_id and (not statuses or r.status in statuses)
+            )
+    
+    async def update_status_by_exam_id(
+        self,
+        exam_id: UUID,
+        new_status: RegistrationStatus,
+        expected_statuses: Set[RegistrationStatus],
+    ) -> int:
+        """Update every registration of an exam whose status is in expected_statuses."""
+        updated = 0
+        with self._lock:
+            for registration in self._registrations.values():
+                if registration.exam_id == exam_id and registration.status in expected_statuses:
+                    registration.status = new_status
+                    updated += 1
+        return updated
@@ -0,0 +1,97 @@
+import copy
+import threading
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from ...domain.user.entity import User
+from ...domain.user.exceptions import UserAlreadyExistsError, UserNotFoundError
+from ...domain.user.repository import UserRepository
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    In-memory implementation of UserRepository.
+    
+    Emails are unique, like the unique email index in MongoDB. Safe to use
+    from several threads and coroutines.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users: Dict[UUID, User] = {}
+        self._ids_by_email: Dict[str, UUID] = {}
+    
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        with self._lock:
+            if user.email in self._ids_by_email or user.id in self._users:
+                raise UserAlreadyExistsError(f"User with email {user.email} already exists")
+            
+            self._users[user.id] = copy.copy(user)
+            self._ids_by_email[user.email] = user.id
+        return user
+    
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """Get user by ID."""
+        with self._lock:
+            user = self._users.get(user_id)
+            return copy.copy(user) if user else None
+    
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get users by ID in one call."""
+        with self._lock:
+            return {
+                user_id: copy.copy(self._users[user_id])
+                for user_id in user_ids
+                if user_id in self._users
+            }
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        with self._lock:
+            user_id = self._ids_by_email.get(email.lower())
+            return copy.copy(self._users[user_id]) if user_id else None
+    
+    async def upsert_by_email(self, user: User) -> User:
+        """Get the user with user's email or create user, atomically."""
+        with self._lock:
+            user_id = self._ids_by_email.get(user.email)
+            if user_id:
+                return copy.copy(self._users[user_id])
+            if user.id in self._users:
+                raise UserAlreadyExistsError(f"User with id {user.id} already exists")
+            
+            self._users[user.id] = copy.copy(user)
+            self._ids_by_email[user.email] = user.id
+        return user
+    
+    async def get_role_versions(self) -> Dict[UUID, int]:
+        """Get the role version of every user whose role has changed."""
+        with self._lock:
+            return {user.id: user.role_version for user in self._users.values() if user.role_version}
+    
+    async def update(self, user: User) -> User:
+        """Update an existing user."""
+        with self._lock:
+            existing = self._users.get(user.id)
+            if not existing:
+                raise UserNotFoundError(f"User with id {user.id} not found")
+            
+            if user.email != existing.email:
+                if user.email in self._ids_by_email:
+                    raise UserAlreadyExistsError(f"User with email {user.email} already exists")
+                del self._ids_by_email[existing.email]
+                self._ids_by_email[user.email] = user.id
+            
+            self._users[user.id] = copy.copy(user)
+        return user
+    
+    async def update_mobile(self, user_id: UUID, mobile: str) -> User:
+        """Set a user's mobile number."""
+        with self._lock:
+            existing = self._users.get(user_id)
+            if not existing:
+                raise UserNotFoundError(f"User with id {user_id} not found")
+            
+            existing.mobile = mobile
+            return copy.copy(existing)
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING
+
+from ..domain.pagination import PageCursor
+from .identity import LEGACY_ID_READS, id_filter
+
+# Listing order shared by every paginated query; backed by compound indexes
+# created by indexes.create_indexes
+KEYSET_SORT = [("created_at", ASCENDING), ("_id", ASCENDING)]
+
+# While legacy id reads are on, _ids are strings, UUIDs or ObjectIds. Range
+# operators only match values of their operand's type, so documents whose
+# _id type sorts after the cursor's are matched by type; MongoDB sorts
+# strings before binary data, and binary data before ObjectIds.
+TYPES_SORTING_AFTER = {str: ["binData", "objectId"], UUID: ["objectId"], ObjectId: []}
+
+
+def keyset_filter(
+    filter_query: Dict[str, Any],
+    after: Optional[PageCursor],
+    after_id: Any = None,
+) -> Dict[str, Any]:
+    """
+    Restrict filter_query to documents that sort after the cursor.
+    
+    after_id is the _id the cursor's document is stored with, when it
+    differs from the cursor's id, as for legacy documents.
+    """
+    if after is None:
+        return filter_query
+    
+    stored_id = after.id if after_id is None else after_id
+    ties = [{"created_at": after.created_at, "_id": {"$gt": stored_id}}]
+    later_types = TYPES_SORTING_AFTER.get(type(stored_id)) if LEGACY_ID_READS else None
+    if later_types:
+        ties.append({"created_at": after.created_at, "_id": {"$type": later_types}})
+    return {
+        **filter_query,
+        "$or": [{"created_at": {"$gt": after.created_at}}, *ties],
+    }
+
+
+async def find_page(
+    collection: AsyncIOMotorCollection,
+    filter_query: Dict[str, Any],
+    limit: Optional[int] = None,
+    after: Optional[PageCursor] = None,
+    projection: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch one page of documents in keyset order, optionally projected.
+    
+    While legacy id reads are on, the cursor's document is looked up first
+    so ties on created_at are broken in the type its _id is stored as.
+    """
+    after_id = None
+    if LEGACY_ID_READS and after is not None:
+        anchor = await collection.find_one(id_filter(after.id), {"_id": 1})
+        if anchor is not None:
+            after_id = anchor["_id"]
+    
+    cursor = collection.find(keyset_filter(filter_query, after, after_id), projection).sort(KEYSET_SORT)
+    if limit is not None:
+        cursor = cursor.limit(limit)
+    return await cursor.to_list(length=limit)
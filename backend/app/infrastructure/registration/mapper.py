@@ -1,5 +1,21 @@
+from typing import Iterable, List, Optional
+from uuid import UUID
+
 from ...domain.registration.entity import ExamRegistration
 from ...domain.registration.entity import RegistrationStatus
+from ..identity import document_id, to_uuid
+
+# Enum lookups by value; much cheaper than calling the enum on every document
+STATUS_BY_VALUE = {status.value: status for status in RegistrationStatus}
+
+# Projections for queries that already fix user_id or exam_id: the value is
+# known, so it is neither transferred nor decoded for every document
+WITHOUT_USER_ID = {"user_id": 0}
+WITHOUT_EXAM_ID = {"exam_id": 0}
+
+# Set with the status by bulk updates, to an id of the call, so the call can
+# tell its own writes from concurrent ones; not part of the entity
+STATUS_CHANGE_ID = "status_change_id"
 
 
 class RegistrationMapper:
@@ -9,10 +25,9 @@ class RegistrationMapper:
     def to_document(registration: ExamRegistration) -> dict:
         """Convert domain entity to MongoDB document."""
         return {
-            "_id": str(registration.id),
-            "id": str(registration.id),
-            "user_id": str(registration.user_id),
-            "exam_id": str(registration.exam_id),
+            "_id": registration.id,
+            "user_id": registration.user_id,
+            "exam_id": registration.exam_id,
             "status": registration.status.value,
             "created_at": registration.created_at,
         }
@@ -20,26 +35,36 @@ class RegistrationMapper:
     @staticmethod
     def to_entity(document: dict) -> ExamRegistration:
         """Convert MongoDB document to domain entity."""
-        from uuid import UUID
-        
-        # Handle both string and UUID id
-        reg_id = document.get("id") or document.get("_id")
-        if isinstance(reg_id, str):
-            reg_id = UUID(reg_id)
-        
-        user_id = document.get("user_id")
-        if isinstance(user_id, str):
-            user_id = UUID(user_id)
-        
-        exam_id = document.get("exam_id")
-        if isinstance(exam_id, str):
-            exam_id = UUID(exam_id)
-        
-        return ExamRegistration(
-            id=reg_id,
-            user_id=user_id,
-            exam_id=exam_id,
-            status=RegistrationStatus(document["status"]),
+        # user_id/exam_id are binary UUIDs, or strings in legacy documents
+        return ExamRegistration.hydrate(
+            id=document_id(document),
+            user_id=to_uuid(document["user_id"]),
+            exam_id=to_uuid(document["exam_id"]),
+            status=STATUS_BY_VALUE.get(document["status"]) or RegistrationStatus(document["status"]),
             created_at=document["created_at"],
         )
-
+    
+    @staticmethod
+    def to_entities(
+        documents: Iterable[dict],
+        user_id: Optional[UUID] = None,
+        exam_id: Optional[UUID] = None,
+    ) -> List[ExamRegistration]:
+        """
+        Convert many MongoDB documents to domain entities.
+        
+        Pass user_id or exam_id when the query fixed it; the documents can
+        then be read with WITHOUT_USER_ID or WITHOUT_EXAM_ID.
+        """
+        hydrate = ExamRegistration.hydrate
+        statuses = STATUS_BY_VALUE
+        return [
+            hydrate(
+                document_id(document),
+                user_id or to_uuid(document["user_id"]),
+                exam_id or to_uuid(document["exam_id"]),
+                statuses.get(document["status"]) or RegistrationStatus(document["status"]),
+                document["created_at"],
+            )
+            for document in documents
+        ]
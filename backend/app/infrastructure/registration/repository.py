@@ -1,19 +1,26 @@
-from typing import List, Optional, Set
-from uuid import UUID
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.errors import DuplicateKeyError
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 
 from ...domain.registration.entity import ExamRegistration, RegistrationStatus
 from ...domain.registration.exceptions import DuplicateRegistrationError, RegistrationNotFoundError
 from ...domain.registration.repository import RegistrationRepository
-from .mapper import RegistrationMapper
+from ...domain.registration.transitions import RegistrationTransition
+from ...domain.pagination import PageCursor
+from ..identity import LEGACY_ID_READS, document_id, id_filter, ids_filter, uuid_match
+from ..pagination import find_page
+from .mapper import STATUS_CHANGE_ID, WITHOUT_EXAM_ID, WITHOUT_USER_ID, RegistrationMapper
 
 
 class MongoDBRegistrationRepository(RegistrationRepository):
     """MongoDB implementation of RegistrationRepository."""
     
+    # Maximum number of IDs sent in a single $in query
+    IN_QUERY_CHUNK_SIZE = 1000
+    
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db.exam_registrations
@@ -21,19 +28,27 @@ class MongoDBRegistrationRepository(RegistrationRepository):
     async def create(self, registration: ExamRegistration) -> ExamRegistration:
         """Create a new registration."""
         document = RegistrationMapper.to_document(registration)
+        duplicate = DuplicateRegistrationError(
+            f"User {registration.user_id} is already registered for exam {registration.exam_id}"
+        )
+        
+        # Legacy documents store user_id/exam_id as strings, which the unique
+        # index does not compare with binary UUIDs
+        if LEGACY_ID_READS and await self.exists_for_user_and_exam(
+            registration.user_id, registration.exam_id
+        ):
+            raise duplicate
         
         try:
             await self.collection.insert_one(document)
             return registration
         except DuplicateKeyError:
             # Translate MongoDB duplicate key error to domain exception
-            raise DuplicateRegistrationError(
-                f"User {registration.user_id} is already registered for exam {registration.exam_id}"
-            )
+            raise duplicate
     
     async def get_by_id(self, registration_id: UUID) -> Optional[ExamRegistration]:
         """Get registration by ID."""
-        document = await self.collection.find_one({"id": str(registration_id)})
+        document = await self.collection.find_one(id_filter(registration_id))
         
         if not document:
             return None
@@ -46,27 +61,76 @@ class MongoDBRegistrationRepository(RegistrationRepository):
         exam_id: UUID,
     ) -> Optional[ExamRegistration]:
         """Get registration by user_id and exam_id."""
-        document = await self.collection.find_one({
-            "user_id": str(user_id),
-            "exam_id": str(exam_id),
-        })
+        document = await self.collection.find_one(self._user_and_exam_filter(user_id, exam_id))
         
         if not document:
             return None
         
         return RegistrationMapper.to_entity(document)
     
-    async def get_by_user_id(self, user_id: UUID) -> List[ExamRegistration]:
-        """Get all registrations for a user."""
-        cursor = self.collection.find({"user_id": str(user_id)})
-        documents = await cursor.to_list(length=None)
-        return [RegistrationMapper.to_entity(doc) for doc in documents]
+    async def exists_for_user_and_exam(self, user_id: UUID, exam_id: UUID) -> bool:
+        """Check for a registration using only the (user_id, exam_id) index; no document is read."""
+        document = await self.collection.find_one(
+            self._user_and_exam_filter(user_id, exam_id),
+            {"_id": 0, "user_id": 1},
+        )
+        return document is not None
     
-    async def get_by_exam_id(self, exam_id: UUID) -> List[ExamRegistration]:
-        """Get all registrations for an exam."""
-        cursor = self.collection.find({"exam_id": str(exam_id)})
-        documents = await cursor.to_list(length=None)
-        return [RegistrationMapper.to_entity(doc) for doc in documents]
+    @staticmethod
+    def _user_and_exam_filter(user_id: UUID, exam_id: UUID) -> Dict[str, Any]:
+        """Filter matching the registration of a user for an exam."""
+        return {"user_id": uuid_match(user_id), "exam_id": uuid_match(exam_id)}
+    
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
+        """Get all registrations for a user, ordered by (created_at, id), optionally one page at a time."""
+        documents = await find_page(
+            self.collection, {"user_id": uuid_match(user_id)}, limit, after, projection=WITHOUT_USER_ID
+        )
+        return RegistrationMapper.to_entities(documents, user_id=user_id)
+    
+    async def get_by_exam_id(
+        self,
+        exam_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[ExamRegistration]:
+        """Get all registrations for an exam, ordered by (created_at, id), optionally one page at a time."""
+        documents = await find_page(
+            self.collection, {"exam_id": uuid_match(exam_id)}, limit, after, projection=WITHOUT_EXAM_ID
+        )
+        return RegistrationMapper.to_entities(documents, exam_id=exam_id)
+    
+    async def iter_by_exam_id(
+        self,
+        exam_id: UUID,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[ExamRegistration]]:
+        """
+        Iterate over all registrations for an exam, ordered by (created_at, id), one page at a time.
+        Pages are fetched by keyset so no server-side cursor is held open
+        between pages.
+        """
+        filter_query = {"exam_id": uuid_match(exam_id)}
+        after: Optional[PageCursor] = None
+        
+        while True:
+            documents = await find_page(
+                self.collection, filter_query, batch_size, after, projection=WITHOUT_EXAM_ID
+            )
+            if not documents:
+                return
+            
+            registrations = RegistrationMapper.to_entities(documents, exam_id=exam_id)
+            yield registrations
+            
+            after = PageCursor.after_page(registrations, batch_size)
+            if after is None:
+                return
     
     async def update_status(
         self,
@@ -89,7 +153,7 @@ class MongoDBRegistrationRepository(RegistrationRepository):
         update_query = {"$set": {"status": new_status.value}}
         
         # Build filter with expected status check
-        filter_query = {"id": str(registration_id)}
+        filter_query = id_filter(registration_id)
         if expected_status:
             filter_query["status"] = expected_status.value
         elif expected_statuses:
@@ -104,7 +168,7 @@ class MongoDBRegistrationRepository(RegistrationRepository):
         
         if not result:
             # Check if registration exists but with wrong status
-            existing = await self.collection.find_one({"id": str(registration_id)})
+            existing = await self.collection.find_one(id_filter(registration_id))
             if existing:
                 current_status = existing.get('status')
                 if expected_status:
@@ -124,4 +188,138 @@ class MongoDBRegistrationRepository(RegistrationRepository):
             raise RegistrationNotFoundError(f"Registration with id {registration_id} not found")
         
         return RegistrationMapper.to_entity(result)
-
+    
+    async def apply_transition(
+        self,
+        registration_id: UUID,
+        transition: RegistrationTransition,
+        user_id: Optional[UUID] = None,
+    ) -> ExamRegistration:
+        """
+        Apply a status transition in one conditional findOneAndUpdate.
+        
+        The expected statuses and, for owner-only transitions, the owner are
+        part of the filter. The registration is only read when nothing
+        matched, to raise the transition's error.
+        """
+        transition.require_user(user_id)
+        filter_query = id_filter(registration_id)
+        filter_query["status"] = {"$in": [s.value for s in transition.sources]}
+        if transition.owner_only:
+            filter_query["user_id"] = uuid_match(user_id)
+        
+        result = await self.collection.find_one_and_update(
+            filter_query,
+            {"$set": {"status": transition.target.value}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if result:
+            return RegistrationMapper.to_entity(result)
+        
+        existing = await self.collection.find_one(id_filter(registration_id))
+        registration = RegistrationMapper.to_entity(existing) if existing else None
+        error = transition.rejection(registration_id, registration, user_id)
+        if error is None:
+            # Moved back into a source status between the update and the read
+            error = ValueError(f"Registration {registration_id} changed concurrently, try again")
+        raise error
+    
+    async def count_by_exam_id(
+        self,
+        exam_id: UUID,
+        statuses: Optional[Set[RegistrationStatus]] = None,
+    ) -> int:
+        """Count registrations for an exam, optionally only those in statuses."""
+        filter_query: Dict[str, Any] = {"exam_id": uuid_match(exam_id)}
+        if statuses:
+            filter_query["status"] = {"$in": [s.value for s in statuses]}
+        return await self.collection.count_documents(filter_query)
+    
+    async def update_status_by_exam_id(
+        self,
+        exam_id: UUID,
+        new_status: RegistrationStatus,
+        expected_statuses: Set[RegistrationStatus],
+    ) -> int:
+        """
+        Update every registration of an exam whose status is in expected_statuses.
+        Runs as a single update_many; the status filter keeps each document
+        update atomic against concurrent transitions.
+        """
+        result = await self.collection.update_many(
+            {
+                "exam_id": uuid_match(exam_id),
+                "status": {"$in": [s.value for s in expected_statuses]},
+            },
+            {"$set": {"status": new_status.value}},
+        )
+        return result.modified_count
+    
+    async def bulk_update_status(
+        self,
+        registration_ids: Iterable[UUID],
+        new_status: RegistrationStatus,
+        expected_statuses: Optional[Set[RegistrationStatus]] = None,
+    ) -> Tuple[Dict[UUID, ExamRegistration], Set[UUID]]:
+        """
+        Update the status of many registrations, each one atomically.
+        Reads all registrations with $in queries, then sends one unordered
+        bulk_write of updates, each conditional on the status that was read.
+        Every update also stamps the documents with an id of this call, so
+        if some updates did not apply because of concurrent changes, the
+        re-read tells this call's writes from those of other requests.
+        """
+        ids = list(dict.fromkeys(registration_ids))
+        found = await self._get_by_ids(ids)
+        
+        eligible = [
+            registration for registration in found.values()
+            if registration.status != new_status
+            and (not expected_statuses or registration.status in expected_statuses)
+        ]
+        if not eligible:
+            return found, set()
+        
+        change_id = uuid4()
+        operations = [
+            UpdateOne(
+                {**id_filter(registration.id), "status": registration.status.value},
+                {"$set": {"status": new_status.value, STATUS_CHANGE_ID: change_id}},
+            )
+            for registration in eligible
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        
+        if result.modified_count == len(operations):
+            for registration in eligible:
+                registration.status = new_status
+            return found, {registration.id for registration in eligible}
+        
+        # Some registrations changed in between; re-read them to see which
+        # updates applied and what the others changed to
+        documents = await self._find_by_ids([registration.id for registration in eligible])
+        current = {document_id(document): document for document in documents}
+        updated: Set[UUID] = set()
+        for registration in eligible:
+            document = current.get(registration.id)
+            if document is None:
+                del found[registration.id]
+                continue
+            found[registration.id] = RegistrationMapper.to_entity(document)
+            if document.get(STATUS_CHANGE_ID) == change_id:
+                updated.add(registration.id)
+        return found, updated
+    
+    async def _get_by_ids(self, ids: List[UUID]) -> Dict[UUID, ExamRegistration]:
+        """Get registrations by ID with chunked $in queries."""
+        documents = await self._find_by_ids(ids)
+        return {registration.id: registration for registration in RegistrationMapper.to_entities(documents)}
+    
+    async def _find_by_ids(self, ids: List[UUID]) -> List[Dict[str, Any]]:
+        """Find registration documents by ID with chunked $in queries."""
+        documents: List[Dict[str, Any]] = []
+        for start in range(0, len(ids), self.IN_QUERY_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_QUERY_CHUNK_SIZE]
+            documents += await self.collection.find(ids_filter(chunk)).to_list(length=None)
+        
+        return documents
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...domain.pagination import PageCursor
+from ...domain.registration.queries import RegistrationUserQuery
+from ..identity import uuid_match
+from ..pagination import KEYSET_SORT, keyset_filter
+
+
+class MongoDBRegistrationUserQuery(RegistrationUserQuery):
+    """
+    MongoDB implementation of RegistrationUserQuery using $lookup.
+    
+    $lookup only matches ids stored in the same format, so do not use it
+    while legacy id reads are on.
+    """
+    
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db.exam_registrations
+    
+    async def get_with_users_by_exam_id(
+        self,
+        exam_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[PageCursor] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all registrations for an exam joined with their users.
+        The join runs inside MongoDB as a single aggregation, and only the
+        fields of the admin registration view are returned.
+        """
+        pipeline = [
+            {"$match": keyset_filter({"exam_id": uuid_match(exam_id)}, after)},
+            {"$sort": dict(KEYSET_SORT)},
+            {
+                "$lookup": {
+                    "from": "users",
+                    "localField": "user_id",
+                    "foreignField": "_id",
+                    "as": "user",
+                }
+            },
+            # Drops registrations whose user no longer exists
+            {"$unwind": "$user"},
+        ]
+        if limit is not None:
+            # Limit after the join so pages stay full when users are missing
+            pipeline.append({"$limit": limit})
+        pipeline += [
+            {
+                "$project": {
+                    "_id": 0,
+                    "registration_id": "$_id",
+                    "status": 1,
+                    "registered_at": "$created_at",
+                    "user": {
+                        "id": "$user._id",
+                        "name": "$user.name",
+                        "email": "$user.email",
+                        "mobile": "$user.mobile",
+                    },
+                }
+            },
+        ]
+        cursor = self.collection.aggregate(pipeline)
+        return await cursor.to_list(length=limit)
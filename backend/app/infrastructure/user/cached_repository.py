@@ -0,0 +1,152 @@
+import copy
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+
+from ...core.cache import TTLCache
+from ...domain.user.entity import User, UserAccess, UserContact
+from ...domain.user.repository import UserRepository
+
+
+class CachingUserRepository(UserRepository):
+    """
+    UserRepository decorator that keeps recently read users in a TTL+LRU cache.
+    
+    Reads by ID are served from the cache when possible; create and update
+    write through to the wrapped repository and then refresh the cached copy,
+    so changes made through this process are visible immediately. Changes
+    made elsewhere (e.g. scripts/create_admin.py) show up once the entry
+    expires, so a cached user must not be written back whole: update_mobile
+    writes only the mobile number. Callers always receive their own copy of
+    a cached user.
+    
+    Access read models are cached next to full users. Contact read models
+    are only derived from cached users, never stored: they come from bulk
+    joins that would otherwise flush the cache.
+    """
+    
+    def __init__(self, repository: UserRepository, cache: TTLCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        try:
+            created = await self.repository.create(user)
+        finally:
+            self._forget(user.id)
+        self._remember(created)
+        return created
+    
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """Get user by ID, from the cache when possible."""
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return copy.copy(cached)
+        
+        generation = self.cache.generation
+        user = await self.repository.get_by_id(user_id)
+        if user:
+            self._remember(user, generation)
+        return user
+    
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get many users by ID, fetching only cache misses from storage."""
+        users: Dict[UUID, User] = {}
+        missing = []
+        for user_id in set(user_ids):
+            cached = self.cache.get(user_id)
+            if cached is not None:
+                users[user_id] = copy.copy(cached)
+            else:
+                missing.append(user_id)
+        
+        if missing:
+            generation = self.cache.generation
+            fetched = await self.repository.get_by_ids(missing)
+            for user in fetched.values():
+                self._remember(user, generation)
+            users.update(fetched)
+        
+        return users
+    
+    async def get_access_by_id(self, user_id: UUID) -> Optional[UserAccess]:
+        """Get the access fields of a user, from the cache when possible."""
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return UserAccess.from_user(cached)
+        access = self.cache.get(("access", user_id))
+        if access is not None:
+            return copy.copy(access)
+        
+        generation = self.cache.generation
+        access = await self.repository.get_access_by_id(user_id)
+        if access:
+            self.cache.set(("access", user_id), access, generation=generation)
+        return access
+    
+    async def get_contacts_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, UserContact]:
+        """Get the contact details of many users; cache misses are read projected and not cached."""
+        contacts: Dict[UUID, UserContact] = {}
+        missing = []
+        for user_id in set(user_ids):
+            cached = self.cache.get(user_id)
+            if cached is not None:
+                contacts[user_id] = UserContact.from_user(cached)
+            else:
+                missing.append(user_id)
+        
+        if missing:
+            contacts.update(await self.repository.get_contacts_by_ids(missing))
+        
+        return contacts
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email. The result also warms the by-ID cache."""
+        generation = self.cache.generation
+        user = await self.repository.get_by_email(email)
+        if user:
+            self._remember(user, generation)
+        return user
+    
+    async def upsert_by_email(self, user: User) -> User:
+        """Get the user with user's email or create user. The result also warms the by-ID cache."""
+        generation = self.cache.generation
+        stored = await self.repository.upsert_by_email(user)
+        self._remember(stored, generation)
+        return stored
+    
+    async def get_role_versions(self) -> Dict[UUID, int]:
+        """Get role versions from the wrapped repository; they are never cached here."""
+        return await self.repository.get_role_versions()
+    
+    async def update(self, user: User) -> User:
+        """Update an existing user and refresh its cached copy."""
+        try:
+            updated = await self.repository.update(user)
+        finally:
+            self._forget(user.id)
+        self._remember(updated)
+        return updated
+    
+    async def update_mobile(self, user_id: UUID, mobile: str) -> User:
+        """Set a user's mobile number and cache the user as stored."""
+        try:
+            updated = await self.repository.update_mobile(user_id, mobile)
+        finally:
+            self._forget(user_id)
+        self._remember(updated)
+        return updated
+    
+    def _remember(self, user: User, generation: Optional[int] = None) -> None:
+        """
+        Cache a private copy so callers cannot mutate the cached user.
+        
+        Users loaded from storage pass the cache generation read before
+        loading, so a copy that went stale during the load is not cached.
+        """
+        self.cache.set(user.id, copy.copy(user), generation=generation)
+    
+    def _forget(self, user_id: UUID) -> None:
+        """Drop every cached view of a user."""
+        self.cache.invalidate(user_id)
+        self.cache.invalidate(("access", user_id))
@@ -1,6 +1,20 @@
-from ...domain.user.entity import User
+from typing import Iterable, List
+
+from ...domain.user.entity import User, UserAccess, UserContact, UserRole
+from ..identity import document_id
 from .models import UserDocument
 
+# Enum lookups by value; much cheaper than calling the enum on every document
+ROLE_BY_VALUE = {role.value: role for role in UserRole}
+
+# Projections for the read models; _id is included by default
+ACCESS_PROJECTION = {"role": 1, "mobile": 1}
+CONTACT_PROJECTION = {"name": 1, "email": 1, "mobile": 1}
+
+# Users whose role has changed at least once; see UserRepository.get_role_versions
+ROLE_CHANGED_FILTER = {"role_version": {"$gt": 0}}
+ROLE_VERSION_PROJECTION = {"role_version": 1}
+
 
 class UserMapper:
     """Mapper between domain entity and MongoDB document."""
@@ -9,32 +23,69 @@ class UserMapper:
     def to_document(user: User) -> dict:
         """Convert domain entity to MongoDB document."""
         return {
-            "_id": str(user.id),
-            "id": str(user.id),
+            "_id": user.id,
             "email": user.email,
             "name": user.name,
             "mobile": user.mobile,
             "role": user.role.value,
             "created_at": user.created_at,
+            "role_version": user.role_version,
         }
     
     @staticmethod
     def to_entity(document: dict) -> User:
         """Convert MongoDB document to domain entity."""
-        from uuid import UUID
-        from ...domain.user.entity import UserRole
-        
-        # Handle both string and UUID id
-        user_id = document.get("id") or document.get("_id")
-        if isinstance(user_id, str):
-            user_id = UUID(user_id)
-        
-        return User(
-            id=user_id,
+        return User.hydrate(
+            id=document_id(document),
             email=document["email"],
             name=document["name"],
             mobile=document.get("mobile"),
-            role=UserRole(document["role"]),
+            role=ROLE_BY_VALUE.get(document["role"]) or UserRole(document["role"]),
             created_at=document["created_at"],
+            role_version=document.get("role_version", 0),
         )
-
+    
+    @staticmethod
+    def to_access(document: dict) -> UserAccess:
+        """Convert a document projected with ACCESS_PROJECTION to a UserAccess."""
+        return UserAccess(
+            id=document_id(document),
+            role=ROLE_BY_VALUE.get(document["role"]) or UserRole(document["role"]),
+            mobile=document.get("mobile"),
+        )
+    
+    @staticmethod
+    def to_contact(document: dict) -> UserContact:
+        """Convert a document projected with CONTACT_PROJECTION to a UserContact."""
+        return UserContact(
+            id=document_id(document),
+            name=document["name"],
+            email=document["email"],
+            mobile=document.get("mobile"),
+        )
+    
+    @staticmethod
+    def to_entities(documents: Iterable[dict]) -> List[User]:
+        """Convert many MongoDB documents to domain entities."""
+        hydrate = User.hydrate
+        roles = ROLE_BY_VALUE
+        return [
+            hydrate(
+                document_id(document),
+                document["email"],
+                document["name"],
+                document.get("mobile"),
+                roles.get(document["role"]) or UserRole(document["role"]),
+                document["created_at"],
+                document.get("role_version", 0),
+            )
+            for document in documents
+        ]
+    
+    @staticmethod
+    def to_contacts(documents: Iterable[dict]) -> List[UserContact]:
+        """Convert many documents projected with CONTACT_PROJECTION to UserContacts."""
+        return [
+            UserContact(document_id(document), document["name"], document["email"], document.get("mobile"))
+            for document in documents
+        ]
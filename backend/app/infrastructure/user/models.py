@@ -28,4 +28,5 @@ class UserDocument(BaseModel):
     mobile: Optional[str] = None
     role: UserRole = UserRole.USER
     created_at: datetime
+    role_version: int = 0
 
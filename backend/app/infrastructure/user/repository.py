@@ -1,18 +1,29 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
-from ...domain.user.entity import User
+from ...domain.user.entity import User, UserAccess, UserContact
 from ...domain.user.exceptions import UserAlreadyExistsError, UserNotFoundError
 from ...domain.user.repository import UserRepository
-from .mapper import UserMapper
+from ..identity import document_id, id_filter, ids_filter
+from .mapper import (
+    ACCESS_PROJECTION,
+    CONTACT_PROJECTION,
+    ROLE_CHANGED_FILTER,
+    ROLE_VERSION_PROJECTION,
+    UserMapper,
+)
 
 
 class MongoDBUserRepository(UserRepository):
     """MongoDB implementation of UserRepository."""
     
+    # Maximum number of IDs sent in a single $in query by get_by_ids
+    GET_BY_IDS_CHUNK_SIZE = 1000
+    
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db.users
@@ -29,13 +40,32 @@ class MongoDBUserRepository(UserRepository):
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
-        document = await self.collection.find_one({"id": str(user_id)})
+        document = await self.collection.find_one(id_filter(user_id))
         
         if not document:
             return None
         
         return UserMapper.to_entity(document)
     
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get many users by ID using chunked $in queries."""
+        documents = await self._find_by_ids(user_ids)
+        return {user.id: user for user in UserMapper.to_entities(documents)}
+    
+    async def get_access_by_id(self, user_id: UUID) -> Optional[UserAccess]:
+        """Get the access fields of a user, reading only those fields."""
+        document = await self.collection.find_one(id_filter(user_id), ACCESS_PROJECTION)
+        
+        if not document:
+            return None
+        
+        return UserMapper.to_access(document)
+    
+    async def get_contacts_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, UserContact]:
+        """Get the contact details of many users, reading only those fields."""
+        documents = await self._find_by_ids(user_ids, CONTACT_PROJECTION)
+        return {contact.id: contact for contact in UserMapper.to_contacts(documents)}
+    
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         document = await self.collection.find_one({"email": email.lower()})
@@ -45,6 +75,35 @@ class MongoDBUserRepository(UserRepository):
         
         return UserMapper.to_entity(document)
     
+    async def upsert_by_email(self, user: User) -> User:
+        """
+        Get the user with user's email or insert user, in one round trip.
+        
+        $setOnInsert only writes when no user has the email, so an existing
+        user comes back unchanged, and the unique email index makes two
+        concurrent logins agree on one user.
+        """
+        try:
+            document = await self.collection.find_one_and_update(
+                {"email": user.email},
+                {"$setOnInsert": UserMapper.to_document(user)},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # A concurrent upsert inserted the email first (MongoDB 4.2+
+            # retries this itself for equality filters on a unique index)
+            document = await self.collection.find_one({"email": user.email})
+            if not document:
+                raise UserAlreadyExistsError(f"User with email {user.email} already exists")
+        
+        return UserMapper.to_entity(document)
+    
+    async def get_role_versions(self) -> Dict[UUID, int]:
+        """Get the role version of every user whose role has changed, from a partial index."""
+        cursor = self.collection.find(ROLE_CHANGED_FILTER, ROLE_VERSION_PROJECTION)
+        return {document_id(document): document["role_version"] async for document in cursor}
+    
     async def update(self, user: User) -> User:
         """Update an existing user."""
         document = UserMapper.to_document(user)
@@ -53,7 +112,7 @@ class MongoDBUserRepository(UserRepository):
         update_doc = {k: v for k, v in document.items() if k != "_id"}
         
         result = await self.collection.update_one(
-            {"id": str(user.id)},
+            id_filter(user.id),
             {"$set": update_doc}
         )
         
@@ -61,4 +120,31 @@ class MongoDBUserRepository(UserRepository):
             raise UserNotFoundError(f"User with id {user.id} not found")
         
         return user
-
+    
+    async def update_mobile(self, user_id: UUID, mobile: str) -> User:
+        """Set a user's mobile number with a $set of that field alone."""
+        document = await self.collection.find_one_and_update(
+            id_filter(user_id),
+            {"$set": {"mobile": mobile}},
+            return_document=ReturnDocument.AFTER,
+        )
+        
+        if not document:
+            raise UserNotFoundError(f"User with id {user_id} not found")
+        
+        return UserMapper.to_entity(document)
+    
+    async def _find_by_ids(
+        self,
+        user_ids: Iterable[UUID],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find user documents by ID with chunked $in queries, optionally projected."""
+        ids: List[UUID] = list(set(user_ids))
+        documents: List[Dict[str, Any]] = []
+        
+        for start in range(0, len(ids), self.GET_BY_IDS_CHUNK_SIZE):
+            chunk = ids[start:start + self.GET_BY_IDS_CHUNK_SIZE]
+            documents += await self.collection.find(ids_filter(chunk), projection).to_list(length=None)
+        
+        return documents
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
 
@@ -13,10 +15,34 @@ from .api.auth import router as auth_router
 from .api.exams import router as exams_router
 from .api.payments import router as payments_router
 from .api.content import router as content_router, admin_router as admin_content_router
-from .core.dependencies import set_exam_repository, set_registration_repository, set_user_repository, set_content_repository
+from .api.metrics import MetricsMiddleware, router as metrics_router
+from .api.pagination import NEXT_CURSOR_HEADER
+from .api.tracing import REQUEST_ID_HEADER, RequestContextMiddleware
+from .core.cache import TTLCache
+from .core.metrics import REGISTRY
+from .core.security import role_versions
+from .core.tracing import TRACER, JsonLinesFileExporter
+from .core.dependencies import (
+    set_content_repository,
+    set_exam_repository,
+    set_idempotency_repository,
+    set_registration_repository,
+    set_registration_user_query,
+    set_user_repository,
+)
+from .infrastructure.command_monitoring import CommandMetricsListener
+from .infrastructure.exam.cached_repository import CachingExamRepository
 from .infrastructure.exam.repository import MongoDBExamRepository
+from .infrastructure.idempotency.cached_repository import CachingIdempotencyRepository
+from .infrastructure.idempotency.repository import MongoDBIdempotencyRepository
+from .infrastructure.identity import LEGACY_ID_READS, UUID_REPRESENTATION, legacy_collections
+from .infrastructure.indexes import ID_COLLECTIONS, create_indexes
+from .infrastructure.instrumentation import InstrumentedRepository
 from .infrastructure.registration.repository import MongoDBRegistrationRepository
+from .infrastructure.registration.user_query import MongoDBRegistrationUserQuery
+from .infrastructure.user.cached_repository import CachingUserRepository
 from .infrastructure.user.repository import MongoDBUserRepository
+from .infrastructure.content.cached_repository import CachingContentRepository
 from .infrastructure.content.repository import MongoDBContentRepository
 
 # Load environment variables
@@ -26,9 +52,69 @@ load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "lifeschool_db")
 
+# Authenticated-user cache (USER_CACHE_TTL_SECONDS=0 disables it)
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
+# Exam and content read-through caches (*_CACHE_TTL_SECONDS=0 disables them).
+# Writes through this process are visible immediately; writes from other
+# processes show up once the TTL elapses.
+EXAM_CACHE_MAX_SIZE = int(os.getenv("EXAM_CACHE_MAX_SIZE", "1000"))
+EXAM_CACHE_TTL_SECONDS = float(os.getenv("EXAM_CACHE_TTL_SECONDS", "30"))
+CONTENT_CACHE_MAX_SIZE = int(os.getenv("CONTENT_CACHE_MAX_SIZE", "1000"))
+CONTENT_CACHE_TTL_SECONDS = float(os.getenv("CONTENT_CACHE_TTL_SECONDS", "30"))
+
+# Payment requests sent with an Idempotency-Key: how long their responses are
+# replayed for repeats, and the in-process cache of those responses
+# (IDEMPOTENCY_CACHE_TTL_SECONDS=0 disables it)
+IDEMPOTENCY_KEY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", str(24 * 60 * 60)))
+IDEMPOTENCY_CACHE_MAX_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_MAX_SIZE", "10000"))
+IDEMPOTENCY_CACHE_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_CACHE_TTL_SECONDS", "300"))
+
+# How often role changes (scripts/create_admin.py) are picked up; tokens issued
+# for the previous role are rejected from then on
+ROLE_VERSION_REFRESH_SECONDS = float(os.getenv("ROLE_VERSION_REFRESH_SECONDS", "30"))
+
+# Request, repository and MongoDB command metrics, exposed on /metrics
+# (METRICS_ENABLED=false disables them)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# MongoDB commands taking at least this long are written to the slow command
+# log (app.mongodb.slow_commands); 0 disables the log
+MONGO_SLOW_COMMAND_MS = float(os.getenv("MONGO_SLOW_COMMAND_MS", "100"))
+
+# Request tracing: the fraction of requests traced (0 disables tracing) and
+# the rotating file their spans are written to as OTLP/JSON lines
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+TRACE_FILE = os.getenv("TRACE_FILE", "logs/traces.jsonl")
+TRACE_FILE_MAX_BYTES = int(os.getenv("TRACE_FILE_MAX_BYTES", str(10 * 1024 * 1024)))
+TRACE_FILE_BACKUP_COUNT = int(os.getenv("TRACE_FILE_BACKUP_COUNT", "5"))
+
 client: AsyncIOMotorClient = None
 db = None
 
+logger = logging.getLogger(__name__)
+
+
+def instrumented(repository, name: str):
+    """
+    Count and trace operations on a database repository and attribute its
+    MongoDB commands to them, when any kind of monitoring is enabled.
+    """
+    if METRICS_ENABLED or MONGO_SLOW_COMMAND_MS > 0 or TRACE_SAMPLE_RATE > 0:
+        return InstrumentedRepository(repository, name)
+    return repository
+
+
+async def refresh_role_versions(user_repository) -> None:
+    """Keep role_versions fresh; a failed refresh keeps the previous versions."""
+    while True:
+        await asyncio.sleep(ROLE_VERSION_REFRESH_SECONDS)
+        try:
+            await role_versions.refresh(user_repository)
+        except Exception:
+            logger.exception("Refreshing role versions failed")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,39 +122,100 @@ async def lifespan(app: FastAPI):
     global client, db
     
     # Startup
-    client = AsyncIOMotorClient(DATABASE_URL)
+    if TRACE_SAMPLE_RATE > 0:
+        TRACER.configure(
+            JsonLinesFileExporter(
+                TRACE_FILE,
+                max_bytes=TRACE_FILE_MAX_BYTES,
+                backup_count=TRACE_FILE_BACKUP_COUNT,
+            ),
+            TRACE_SAMPLE_RATE,
+        )
+    
+    event_listeners = []
+    if METRICS_ENABLED or MONGO_SLOW_COMMAND_MS > 0 or TRACE_SAMPLE_RATE > 0:
+        event_listeners.append(CommandMetricsListener(
+            registry=REGISTRY if METRICS_ENABLED else None,
+            slow_threshold_ms=MONGO_SLOW_COMMAND_MS,
+        ))
+    client = AsyncIOMotorClient(
+        DATABASE_URL,
+        uuidRepresentation=UUID_REPRESENTATION,
+        event_listeners=event_listeners,
+    )
     db = client[DATABASE_NAME]
     
-    # Create indexes
-    await db.users.create_index("email", unique=True)
-    await db.users.create_index("id", unique=True)
-    await db.exams.create_index("id", unique=True)
-    await db.exam_registrations.create_index("id", unique=True)
-    await db.exam_registrations.create_index([("user_id", 1), ("exam_id", 1)], unique=True)
-    await db.exam_registrations.create_index("user_id")
-    await db.content.create_index("id", unique=True)
-    await db.content.create_index("content_type")
-    await db.content.create_index("status")
-    await db.content.create_index("created_at")
+    # Without legacy id reads, documents not yet converted to the compact
+    # identity format could not be found; refuse to serve instead
+    if not LEGACY_ID_READS:
+        legacy = await legacy_collections(db, ID_COLLECTIONS)
+        if legacy:
+            client.close()
+            raise RuntimeError(
+                f"Collections {', '.join(legacy)} still hold documents with legacy string ids. "
+                "Run scripts/migrate_uuid_ids.py, or start with MONGO_LEGACY_ID_READS=true "
+                "until it has finished."
+            )
+    
+    await create_indexes(db)
     
     # Set repositories
-    user_repository = MongoDBUserRepository(db)
+    user_repository = instrumented(MongoDBUserRepository(db), "users")
+    if USER_CACHE_TTL_SECONDS > 0:
+        user_repository = CachingUserRepository(
+            user_repository,
+            TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS),
+        )
     set_user_repository(user_repository)
+    await role_versions.refresh(user_repository)
+    role_version_refresh = asyncio.create_task(refresh_role_versions(user_repository))
     
-    exam_repository = MongoDBExamRepository(db)
+    exam_repository = instrumented(MongoDBExamRepository(db), "exams")
+    if EXAM_CACHE_TTL_SECONDS > 0:
+        exam_repository = CachingExamRepository(
+            exam_repository,
+            TTLCache(maxsize=EXAM_CACHE_MAX_SIZE, ttl=EXAM_CACHE_TTL_SECONDS),
+        )
     set_exam_repository(exam_repository)
     
-    registration_repository = MongoDBRegistrationRepository(db)
+    registration_repository = instrumented(MongoDBRegistrationRepository(db), "registrations")
     set_registration_repository(registration_repository)
+    # While legacy id reads are on, a registration and its user may be stored
+    # in different formats, which $lookup cannot match; services then join
+    # with a batched user lookup instead
+    if not LEGACY_ID_READS:
+        set_registration_user_query(instrumented(MongoDBRegistrationUserQuery(db), "registrations"))
+    
+    idempotency_repository = instrumented(
+        MongoDBIdempotencyRepository(db, ttl_seconds=IDEMPOTENCY_KEY_TTL_SECONDS), "idempotency"
+    )
+    if IDEMPOTENCY_CACHE_TTL_SECONDS > 0:
+        idempotency_repository = CachingIdempotencyRepository(
+            idempotency_repository,
+            TTLCache(
+                maxsize=IDEMPOTENCY_CACHE_MAX_SIZE,
+                ttl=min(IDEMPOTENCY_CACHE_TTL_SECONDS, IDEMPOTENCY_KEY_TTL_SECONDS),
+            ),
+        )
+    set_idempotency_repository(idempotency_repository)
     
-    content_repository = MongoDBContentRepository(db)
+    content_repository = instrumented(MongoDBContentRepository(db), "content")
+    if CONTENT_CACHE_TTL_SECONDS > 0:
+        content_repository = CachingContentRepository(
+            content_repository,
+            TTLCache(maxsize=CONTENT_CACHE_MAX_SIZE, ttl=CONTENT_CACHE_TTL_SECONDS),
+        )
     set_content_repository(content_repository)
     
     yield
     
     # Shutdown
+    role_version_refresh.cancel()
     if client:
         client.close()
+    if TRACER.exporter is not None:
+        TRACER.exporter.shutdown()
+        TRACER.configure(None, 0.0)
 
 
 app = FastAPI(
@@ -85,8 +232,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", REQUEST_ID_HEADER],
 )
 
+app.add_middleware(RequestContextMiddleware)
+
+# Added last so it is the outermost middleware and times the whole request
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(exams_router)
@@ -96,6 +250,8 @@ app.include_router(admin_exports_router)
 app.include_router(payments_router)
 app.include_router(content_router)
 app.include_router(admin_content_router)
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
 # Note: Registration endpoints are in exams.py (POST /exams/{exam_id}/register) 
 # and auth.py (GET /auth/me/registrations) to match API requirements
 
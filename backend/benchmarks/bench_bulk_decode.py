@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for bulk reads: BSON decoding and document-to-entity mapping.
+
+N registration documents are encoded to BSON once, then decoded and mapped
+the way a listing does it. Decoding is compared for plain dicts, for
+RawBSONDocument (lazy decoding), and for dicts read with the WITHOUT_EXAM_ID
+projection used when the query already fixes exam_id. Mapping is compared
+for a per-document to_entity() loop and the batch to_entities().
+
+Usage:
+    python benchmarks/bench_bulk_decode.py
+    python benchmarks/bench_bulk_decode.py --count 100000
+"""
+
+import argparse
+import gc
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import bson
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from app.infrastructure.identity import UUID_REPRESENTATION
+from app.infrastructure.registration.mapper import WITHOUT_EXAM_ID, RegistrationMapper
+
+DICT_OPTIONS = CodecOptions(uuid_representation=UuidRepresentation.STANDARD, tz_aware=True)
+RAW_OPTIONS = DICT_OPTIONS.with_options(document_class=RawBSONDocument)
+
+
+def registration_document(exam_id) -> dict:
+    return {
+        "_id": uuid4(),
+        "user_id": uuid4(),
+        "exam_id": exam_id,
+        "status": "PAID",
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def timed(run, repeat: int = 5) -> float:
+    """Best time in seconds of calling run()."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark bulk document decoding and mapping")
+    parser.add_argument("--count", type=int, default=20000, help="Documents per read")
+    
+    args = parser.parse_args()
+    
+    exam_id = uuid4()
+    documents = [registration_document(exam_id) for _ in range(args.count)]
+    full = b"".join(bson.encode(document, codec_options=DICT_OPTIONS) for document in documents)
+    projected = b"".join(
+        bson.encode(
+            {key: value for key, value in document.items() if key not in WITHOUT_EXAM_ID},
+            codec_options=DICT_OPTIONS,
+        )
+        for document in documents
+    )
+    decoded = bson.decode_all(full, DICT_OPTIONS)
+    decoded_projected = bson.decode_all(projected, DICT_OPTIONS)
+    
+    print(f"{args.count} registration documents (uuidRepresentation={UUID_REPRESENTATION})")
+    print(f"   wire size: {len(full):,} B full, {len(projected):,} B without exam_id")
+    print()
+    
+    rows = [
+        ("decode dict", lambda: bson.decode_all(full, DICT_OPTIONS)),
+        ("decode dict without exam_id", lambda: bson.decode_all(projected, DICT_OPTIONS)),
+        ("decode raw", lambda: bson.decode_all(full, RAW_OPTIONS)),
+        (
+            "decode raw + to_entity",
+            lambda: [RegistrationMapper.to_entity(doc) for doc in bson.decode_all(full, RAW_OPTIONS)],
+        ),
+        ("to_entity loop", lambda: [RegistrationMapper.to_entity(doc) for doc in decoded]),
+        ("to_entities", lambda: RegistrationMapper.to_entities(decoded)),
+        (
+            "to_entities without exam_id",
+            lambda: RegistrationMapper.to_entities(decoded_projected, exam_id=exam_id),
+        ),
+    ]
+    for label, run in rows:
+        print(f"{label:<30} {timed(run) * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for loading many domain entities: memory and construction time.
+
+For each entity type N stored documents are mapped to entities. Memory per
+entity is compared with a plain __dict__-backed object holding the same
+attributes (the layout before entities were slotted), and construction time
+of the validating constructor is compared with the trusted hydrate() path
+used by the mappers.
+
+Usage:
+    python benchmarks/bench_entities.py
+    python benchmarks/bench_entities.py --count 200000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.domain.content.entity import Content
+from app.domain.exam.entity import Exam
+from app.domain.registration.entity import ExamRegistration
+from app.domain.user.entity import User
+from app.infrastructure.content.mapper import ContentMapper
+from app.infrastructure.exam.mapper import ExamMapper
+from app.infrastructure.registration.mapper import RegistrationMapper
+from app.infrastructure.user.mapper import UserMapper
+
+
+class DictBacked:
+    """Plain object with a per-instance __dict__, for comparison."""
+
+
+def user_document(i: int) -> dict:
+    return {
+        "_id": uuid4(),
+        "email": f"user{i}@example.com",
+        "name": f"User {i}",
+        "mobile": "9876543210",
+        "role": "USER",
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def exam_document(i: int) -> dict:
+    start = datetime.now(timezone.utc) + timedelta(days=30)
+    return {
+        "_id": uuid4(),
+        "title": f"Exam {i}",
+        "description": "Mock exam",
+        "start_date": start,
+        "end_date": start + timedelta(hours=3),
+        "fee": "500.00",
+        "status": "ACTIVE",
+        "created_at": start,
+        "updated_at": start,
+    }
+
+
+def registration_document(i: int) -> dict:
+    return {
+        "_id": uuid4(),
+        "user_id": uuid4(),
+        "exam_id": uuid4(),
+        "status": "PAID",
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def content_document(i: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": uuid4(),
+        "content_type": "BLOG",
+        "title": f"Post {i}",
+        "body": "Body text",
+        "metadata": {},
+        "status": "PUBLISHED",
+        "seo_meta": {},
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def fields_of(entity) -> dict:
+    return {name: getattr(entity, name) for name in type(entity).__slots__}
+
+
+def construct(entity_type, fields: dict):
+    """Build an entity with the validating constructor."""
+    return entity_type(**fields)
+
+
+def dict_backed(fields: dict):
+    obj = DictBacked()
+    obj.__dict__.update(fields)
+    return obj
+
+
+def allocated(build, items) -> int:
+    """Bytes allocated by the objects build() creates for items (excluding their values)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = [build(item) for item in items]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def timed(build, items, repeat: int = 3) -> float:
+    """Best time in seconds of calling build() on every item."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for item in items:
+            build(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(label: str, entity_type, mapper, make_document, count: int) -> None:
+    documents = [make_document(i) for i in range(count)]
+    fields = [fields_of(mapper.to_entity(document)) for document in documents]
+    
+    # Memory of the entity objects themselves; attribute values are shared
+    slotted = allocated(lambda f: entity_type.hydrate(**f), fields)
+    plain = allocated(dict_backed, fields)
+    
+    init = timed(lambda f: construct(entity_type, f), fields)
+    hydrate = timed(lambda f: entity_type.hydrate(**f), fields)
+    to_entity = timed(mapper.to_entity, documents)
+    
+    print(
+        f"{label:<14} {plain / count:>7.0f} B {slotted / count:>7.0f} B"
+        f" {init * 1e3:>9.1f} ms {hydrate * 1e3:>9.1f} ms {to_entity * 1e3:>9.1f} ms"
+    )
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark domain entity loads")
+    parser.add_argument("--count", type=int, default=100000, help="Entities loaded per type")
+    
+    args = parser.parse_args()
+    
+    print(f"{args.count} entities per type")
+    print(
+        f"{'entity':<14} {'__dict__':>9} {'slotted':>9}"
+        f" {'__init__':>12} {'hydrate':>12} {'to_entity':>12}"
+    )
+    bench("User", User, UserMapper, user_document, args.count)
+    bench("Exam", Exam, ExamMapper, exam_document, args.count)
+    bench("Registration", ExamRegistration, RegistrationMapper, registration_document, args.count)
+    bench("Content", Content, ContentMapper, content_document, args.count)
+
+
+if __name__ == "__main__":
+    main()
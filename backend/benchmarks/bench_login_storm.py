@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Login storm benchmark: many users sign in with Google at once, some of them
+from several tabs, comparing the upsert login against the previous
+look-up-then-create login.
+
+UserService runs against the in-memory user repository behind a wrapper
+that sleeps for a simulated database round trip before every call and
+counts the calls. The previous login (get_by_email, then create) is
+reproduced here for comparison; it makes two round trips for a new user,
+and when two tabs of the same new user race, the later create fails on
+the unique email.
+
+Usage:
+    python benchmarks/bench_login_storm.py
+    python benchmarks/bench_login_storm.py --users 5000 --tabs 3 --returning 0.8 --round-trip-ms 2
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.application.user.dto import GoogleLoginRequest
+from app.application.user.services import UserService
+from app.domain.user.entity import User, UserRole
+from app.domain.user.exceptions import UserAlreadyExistsError
+from app.domain.user.repository import UserRepository
+from app.infrastructure.memory import InMemoryUserRepository
+from benchmarks.bench_registration_surge import percentile
+
+
+class RoundTripUserRepository(UserRepository):
+    """User repository adding a fixed latency to, and counting, every call."""
+    
+    def __init__(self, repository: UserRepository, round_trip: float):
+        self.repository = repository
+        self.round_trip = round_trip
+        self.round_trips = 0
+    
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.round_trip)
+    
+    async def create(self, user):
+        await self._round_trip()
+        return await self.repository.create(user)
+    
+    async def get_by_id(self, user_id):
+        await self._round_trip()
+        return await self.repository.get_by_id(user_id)
+    
+    async def get_by_email(self, email):
+        await self._round_trip()
+        return await self.repository.get_by_email(email)
+    
+    async def update(self, user):
+        await self._round_trip()
+        return await self.repository.update(user)
+    
+    async def update_mobile(self, user_id, mobile):
+        await self._round_trip()
+        return await self.repository.update_mobile(user_id, mobile)
+    
+    async def get_role_versions(self):
+        await self._round_trip()
+        return await self.repository.get_role_versions()
+    
+    async def upsert_by_email(self, user):
+        await self._round_trip()
+        return await self.repository.upsert_by_email(user)
+
+
+class LookupThenCreateService(UserService):
+    """UserService with the login it had before upsert_by_email."""
+    
+    async def login_with_google(self, request: GoogleLoginRequest) -> User:
+        existing_user = await self.user_repository.get_by_email(request.email)
+        if existing_user:
+            return existing_user
+        return await self.user_repository.create(
+            User(email=request.email, name=request.name, role=UserRole.USER)
+        )
+
+
+SERVICES = {
+    "lookup+create": LookupThenCreateService,
+    "upsert": UserService,
+}
+
+
+async def storm(
+    service_class: type,
+    requests: List[GoogleLoginRequest],
+    returning: List[GoogleLoginRequest],
+    concurrency: int,
+    round_trip: float,
+) -> Dict[str, float]:
+    """Run every login concurrently against a fresh repository and summarize."""
+    repository = InMemoryUserRepository()
+    for request in returning:
+        await repository.create(User(email=request.email, name=request.name))
+    timed_repository = RoundTripUserRepository(repository, round_trip)
+    service = service_class(timed_repository)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+    
+    async def login(request: GoogleLoginRequest) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await service.login_with_google(request)
+            except UserAlreadyExistsError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(login(request) for request in requests))
+    elapsed = time.perf_counter() - start
+    
+    ordered = sorted(latencies)
+    return {
+        "rate": len(requests) / elapsed,
+        "p50": percentile(ordered, 50) * 1000,
+        "p99": percentile(ordered, 99) * 1000,
+        "round_trips": timed_repository.round_trips / len(requests),
+        "errors": errors,
+    }
+
+
+async def main_async(users: int, tabs: int, returning: float, concurrency: int, round_trip_ms: float) -> None:
+    """Build the storm and run it with each login implementation."""
+    rng = random.Random(42)
+    accounts = [GoogleLoginRequest(email=f"user{i}@example.com", name=f"User {i}") for i in range(users)]
+    existing = rng.sample(accounts, round(users * returning))
+    requests = [request for request in accounts for _ in range(tabs)]
+    rng.shuffle(requests)
+    
+    print(
+        f"{users} users x {tabs} tabs = {len(requests)} logins, {len(existing)} returning users, "
+        f"concurrency {concurrency}, {round_trip_ms} ms per round trip"
+    )
+    print()
+    print(f"{'login':<15} {'logins/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'trips/login':>12} {'errors':>7}")
+    for name, service_class in SERVICES.items():
+        result = await storm(service_class, requests, existing, concurrency, round_trip_ms / 1000)
+        print(
+            f"{name:<15} {result['rate']:>10,.0f} {result['p50']:>8.2f} {result['p99']:>8.2f} "
+            f"{result['round_trips']:>12.2f} {result['errors']:>7}"
+        )
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent Google logins")
+    parser.add_argument("--users", type=int, default=2000, help="Number of distinct users signing in")
+    parser.add_argument("--tabs", type=int, default=2, help="Concurrent logins per user")
+    parser.add_argument("--returning", type=float, default=0.5, help="Fraction of users that already exist")
+    parser.add_argument("--concurrency", type=int, default=50, help="Maximum logins in flight")
+    parser.add_argument("--round-trip-ms", type=float, default=2.0, help="Simulated database round trip")
+    
+    args = parser.parse_args()
+    asyncio.run(main_async(args.users, args.tabs, args.returning, args.concurrency, args.round_trip_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the overhead of request metrics.
+
+Drives a small FastAPI app directly through ASGI (no sockets, no HTTP
+client) with and without MetricsMiddleware and reports the added time per
+request, then times the raw counter and histogram updates the middleware
+makes for every request.
+
+Usage:
+    python benchmarks/bench_metrics.py
+    python benchmarks/bench_metrics.py --requests 50000
+"""
+
+import argparse
+import asyncio
+import gc
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+
+from app.api.metrics import MetricsMiddleware
+from app.core.metrics import MetricsRegistry
+
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware, registry=MetricsRegistry())
+    
+    @app.get("/exams/{exam_id}")
+    async def get_exam(exam_id: str):
+        return {"id": exam_id}
+    
+    return app
+
+
+async def drive(app: FastAPI, count: int) -> float:
+    """Seconds taken to serve count requests through the ASGI interface."""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        pass
+    
+    def scope(i: int) -> dict:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/exams/{i}",
+            "raw_path": f"/exams/{i}".encode(),
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 1234),
+            "server": ("testserver", 80),
+            "root_path": "",
+        }
+    
+    scopes = [scope(i) for i in range(count)]
+    gc.collect()
+    start = time.perf_counter()
+    for request_scope in scopes:
+        await app(request_scope, receive, send)
+    return time.perf_counter() - start
+
+
+def timed(run, repeat: int = 5) -> float:
+    """Best time in seconds of calling run()."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def bench_requests(count: int, repeat: int) -> None:
+    plain, instrumented = build_app(False), build_app(True)
+    # Warm up: build the middleware stacks and route caches
+    await drive(plain, 100)
+    await drive(instrumented, 100)
+    
+    # Alternate the configurations so drift in machine load affects both
+    without = with_metrics = float("inf")
+    for _ in range(repeat):
+        without = min(without, await drive(plain, count))
+        with_metrics = min(with_metrics, await drive(instrumented, count))
+    
+    print(f"{count} requests through ASGI")
+    print(f"   without metrics: {without / count * 1e6:>7.2f} us/request")
+    print(f"   with metrics:    {with_metrics / count * 1e6:>7.2f} us/request")
+    print(f"   overhead:        {(with_metrics - without) / count * 1e6:>7.2f} us/request"
+          f" ({(with_metrics / without - 1) * 100:.1f}%)")
+
+
+def bench_updates(count: int) -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ("method", "route", "status"))
+    histogram = registry.histogram("latency_seconds", "Latency.", ("method", "route"))
+    labels = ("GET", "/exams/{exam_id}", "200")
+    short_labels = ("GET", "/exams/{exam_id}")
+    
+    def increments():
+        for _ in range(count):
+            counter.inc(labels)
+    
+    def observations():
+        for i in range(count):
+            histogram.observe((i % 1000) / 1000, short_labels)
+    
+    print()
+    print(f"{count} updates")
+    print(f"   counter.inc:       {timed(increments) / count * 1e9:>7.0f} ns")
+    print(f"   histogram.observe: {timed(observations) / count * 1e9:>7.0f} ns")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark request metrics overhead")
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per configuration (best is kept)")
+    
+    args = parser.parse_args()
+    
+    asyncio.run(bench_requests(args.requests, args.repeat))
+    bench_updates(args.requests * 10)
+
+
+if __name__ == "__main__":
+    main()
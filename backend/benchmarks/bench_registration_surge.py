@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Registration surge benchmark: N concurrent users register for an exam,
+pay, confirm payment and are enrolled by an admin.
+
+The FastAPI app is driven in-process through httpx's ASGI transport with
+in-memory repositories, so the numbers measure the application itself
+(routing, validation, auth, services) without network or database time.
+
+Usage:
+    python benchmarks/bench_registration_surge.py
+    python benchmarks/bench_registration_surge.py --users 2000 --concurrency 200 --enroll bulk
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from app.core.dependencies import (
+    set_content_repository,
+    set_exam_repository,
+    set_registration_repository,
+    set_user_repository,
+)
+from app.core.security import create_access_token
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import RegistrationStatus
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import (
+    InMemoryContentRepository,
+    InMemoryExamRepository,
+    InMemoryRegistrationRepository,
+    InMemoryUserRepository,
+)
+from app.main import app
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(p / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+class PhaseResult:
+    """Latencies and outcome counts of one benchmark phase."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.errors: Dict[int, int] = {}
+        self.elapsed = 0.0
+        self.responses: List[Optional[httpx.Response]] = []
+    
+    def report(self) -> str:
+        ordered = sorted(self.latencies)
+        rate = len(ordered) / self.elapsed if self.elapsed else 0.0
+        errors = ", ".join(f"{code}x{count}" for code, count in sorted(self.errors.items())) or "-"
+        return (
+            f"{self.name:<28} {len(ordered):>7} {rate:>10,.0f} "
+            f"{percentile(ordered, 50) * 1000:>8.2f} "
+            f"{percentile(ordered, 95) * 1000:>8.2f} "
+            f"{percentile(ordered, 99) * 1000:>8.2f}  {errors}"
+        )
+
+
+async def run_phase(
+    name: str,
+    requests: List[Callable[[], Awaitable[httpx.Response]]],
+    concurrency: int,
+) -> PhaseResult:
+    """Send requests with at most concurrency in flight, timing each one."""
+    result = PhaseResult(name)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def timed(send: Callable[[], Awaitable[httpx.Response]]) -> Optional[httpx.Response]:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await send()
+            result.latencies.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            result.errors[response.status_code] = result.errors.get(response.status_code, 0) + 1
+            return None
+        return response
+    
+    start = time.perf_counter()
+    result.responses = await asyncio.gather(*(timed(send) for send in requests))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def main_async(users: int, concurrency: int, enroll: str) -> None:
+    """Seed in-memory repositories and run the surge phases."""
+    user_repo = InMemoryUserRepository()
+    exam_repo = InMemoryExamRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    set_user_repository(user_repo)
+    set_exam_repository(exam_repo)
+    set_registration_repository(reg_repo)
+    set_content_repository(InMemoryContentRepository())
+    
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    exam = Exam(
+        title="Surge Exam",
+        start_date=start_date,
+        end_date=start_date + timedelta(hours=3),
+        status=ExamStatus.ACTIVE,
+    )
+    await exam_repo.create(exam)
+    
+    admin = User(email="admin@example.com", name="Admin", role=UserRole.ADMIN)
+    await user_repo.create(admin)
+    admin_headers = {"Authorization": f"Bearer {create_access_token(admin.id, admin.email, admin.role)}"}
+    
+    user_headers = []
+    for i in range(users):
+        user = User(email=f"user{i}@example.com", name=f"User {i}", mobile=f"9{i:09d}")
+        await user_repo.create(user)
+        user_headers.append({"Authorization": f"Bearer {create_access_token(user.id, user.email, user.role)}"})
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        results = []
+        
+        register = await run_phase(
+            "POST /exams/{id}/register",
+            [lambda h=h: client.post(f"/exams/{exam.id}/register", headers=h) for h in user_headers],
+            concurrency,
+        )
+        results.append(register)
+        registered = [
+            (headers, response.json()["id"])
+            for headers, response in zip(user_headers, register.responses)
+            if response is not None
+        ]
+        
+        pay = await run_phase(
+            "POST /payments/.../pay",
+            [
+                lambda h=h, r=r: client.post(f"/payments/registrations/{r}/pay", headers=h)
+                for h, r in registered
+            ],
+            concurrency,
+        )
+        results.append(pay)
+        
+        confirm = await run_phase(
+            "POST /payments/{id}/confirm",
+            [lambda h=h, r=r: client.post(f"/payments/{r}/confirm", headers=h) for h, r in registered],
+            concurrency,
+        )
+        results.append(confirm)
+        
+        registration_ids = [r for _, r in registered]
+        if enroll == "single":
+            results.append(await run_phase(
+                "POST .../{id}/enroll",
+                [
+                    lambda r=r: client.post(f"/admin/registrations/{r}/enroll", headers=admin_headers)
+                    for r in registration_ids
+                ],
+                concurrency,
+            ))
+        elif enroll == "bulk":
+            results.append(await run_phase(
+                "POST .../enroll/bulk",
+                [lambda: client.post(
+                    "/admin/registrations/enroll/bulk",
+                    json={"registration_ids": registration_ids},
+                    headers=admin_headers,
+                )],
+                1,
+            ))
+        else:
+            results.append(await run_phase(
+                "POST .../enroll/exam/{id}",
+                [lambda: client.post(f"/admin/registrations/enroll/exam/{exam.id}", headers=admin_headers)],
+                1,
+            ))
+    
+    enrolled = await reg_repo.count_by_exam_id(exam.id, statuses={RegistrationStatus.ENROLLED})
+    print(f"{users} users, concurrency {concurrency}, enroll mode {enroll}")
+    print()
+    print(f"{'endpoint':<28} {'count':>7} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  errors")
+    for result in results:
+        print(result.report())
+    print()
+    print(f"enrolled: {enrolled}/{users}")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the registration/payment/enrollment flow")
+    parser.add_argument("--users", type=int, default=500, help="Number of users registering")
+    parser.add_argument("--concurrency", type=int, default=50, help="Maximum requests in flight")
+    parser.add_argument(
+        "--enroll",
+        choices=["single", "bulk", "exam"],
+        default="single",
+        help="Enroll one request per registration, with one bulk request, or by exam",
+    )
+    
+    args = parser.parse_args()
+    asyncio.run(main_async(args.users, args.concurrency, args.enroll))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for list responses: DTO + response_model vs. pre-serialized JSON.
+
+The DTO path is what the list endpoints did before: build a DTO per entity
+and let FastAPI validate the list against the route's response_model before
+encoding it. The fast path encodes the entities directly with the endpoint's
+ListSerializer.
+
+Usage:
+    python benchmarks/bench_serialization.py
+    python benchmarks/bench_serialization.py --items 1000 --rounds 50
+"""
+
+import argparse
+import asyncio
+import functools
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.routing import APIRoute, serialize_response
+
+from app.api.auth import registration_list_serializer, router as auth_router
+from app.api.content import content_list_serializer, router as content_router, summary_list_serializer
+from app.api.exams import exam_list_serializer, router as exams_router
+from app.application.content.dto import ContentSummaryResponse
+from app.application.content.services import ContentService
+from app.application.exam.services import ExamService
+from app.application.registration.services import RegistrationService
+from app.domain.content.entity import Content, ContentStatus, ContentSummary, ContentType
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+
+
+def route_field(router, path: str):
+    """Get the response_model field of the router's GET route at path."""
+    for route in router.routes:
+        if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods:
+            return route.response_field
+    raise LookupError(path)
+
+
+def make_exams(n: int):
+    start = datetime.now(timezone.utc) + timedelta(days=30)
+    return [
+        Exam(
+            title=f"Exam {i}",
+            description="Mock exam with a short description",
+            start_date=start,
+            end_date=start + timedelta(hours=3),
+            fee=Decimal("500.00"),
+            status=ExamStatus.ACTIVE,
+        )
+        for i in range(n)
+    ]
+
+
+def make_contents(n: int):
+    body = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40
+    return [
+        Content(
+            content_type=ContentType.BLOG,
+            title=f"Post {i}",
+            body=body,
+            metadata={"author": "Editor", "tags": ["exam", "tips"]},
+            status=ContentStatus.PUBLISHED,
+            seo_meta={"description": "Exam preparation tips"},
+        )
+        for i in range(n)
+    ]
+
+
+def make_registrations(n: int):
+    exam_id = uuid4()
+    return [
+        ExamRegistration(user_id=uuid4(), exam_id=exam_id, status=RegistrationStatus.PAID)
+        for _ in range(n)
+    ]
+
+
+async def time_per_item(render, items, rounds: int) -> float:
+    """Return the mean cost of render(items) in microseconds per item."""
+    await render(items)  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await render(items)
+    return (time.perf_counter() - start) / (rounds * len(items)) * 1e6
+
+
+async def bench(label: str, items, to_dto, field, serializer, rounds: int) -> None:
+    """Compare both paths for one endpoint and print the per-item cost."""
+    async def dto_path(entities):
+        return await serialize_response(
+            field=field, response_content=[to_dto(e) for e in entities], dump_json=True
+        )
+    
+    async def fast_path(entities):
+        return serializer.dump_json(entities)
+    
+    assert await dto_path(items) == await fast_path(items), f"{label}: outputs differ"
+    
+    dto = await time_per_item(dto_path, items, rounds)
+    fast = await time_per_item(fast_path, items, rounds)
+    print(f"{label:<16} {dto:>9.2f} us/item {fast:>9.2f} us/item {dto / fast:>7.1f}x")
+
+
+async def run(items: int, rounds: int) -> None:
+    content_service = ContentService(None)
+    contents = make_contents(items)
+    
+    print(f"{items} items per list, {rounds} rounds")
+    print(f"{'endpoint':<16} {'dto path':>17} {'fast path':>17} {'speedup':>8}")
+    await bench(
+        "GET /exams", make_exams(items), ExamService.to_dto,
+        route_field(exams_router, "/exams"), exam_list_serializer, rounds,
+    )
+    await bench(
+        "GET /content", contents, content_service.to_dto,
+        route_field(content_router, "/content"), content_list_serializer, rounds,
+    )
+    await bench(
+        "  summary=true", [ContentSummary.from_content(c) for c in contents],
+        functools.partial(ContentSummaryResponse.model_validate, from_attributes=True),
+        route_field(content_router, "/content"), summary_list_serializer, rounds,
+    )
+    await bench(
+        "GET /auth/me/reg", make_registrations(items), RegistrationService.to_dto,
+        route_field(auth_router, "/auth/me/registrations"), registration_list_serializer, rounds,
+    )
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--items", type=int, default=500, help="Entities per list")
+    parser.add_argument("--rounds", type=int, default=20, help="Serializations per path")
+    
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
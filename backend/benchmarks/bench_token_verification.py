@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for JWT verification: cached verify_token vs. full decode.
+
+Usage:
+    python benchmarks/bench_token_verification.py
+    python benchmarks/bench_token_verification.py --iterations 100000 --tokens 100
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import security
+from app.domain.user.entity import UserRole
+
+
+def run(label: str, verify, tokens, iterations: int) -> float:
+    """Verify tokens round-robin and print throughput."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        assert verify(tokens[i % len(tokens)]) is not None
+    elapsed = time.perf_counter() - start
+    
+    rate = iterations / elapsed
+    print(f"{label:<10} {iterations:>9} verifications in {elapsed:7.3f}s  ({rate:>12,.0f}/s)")
+    return rate
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark JWT verification")
+    parser.add_argument("--iterations", type=int, default=50000, help="Verifications per run")
+    parser.add_argument("--tokens", type=int, default=50, help="Distinct tokens presented")
+    
+    args = parser.parse_args()
+    
+    tokens = [
+        security.create_access_token(uuid4(), f"user{i}@example.com", UserRole.USER)
+        for i in range(args.tokens)
+    ]
+    
+    security.clear_token_cache()
+    uncached = run("uncached", security.decode_token, tokens, args.iterations)
+    cached = run("cached", security.verify_token, tokens, args.iterations)
+    
+    print()
+    print(f"speedup    {cached / uncached:.1f}x")
+    print(f"cache      {security.token_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
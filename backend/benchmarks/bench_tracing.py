@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the overhead of request tracing at different sample rates.
+
+Drives a small FastAPI app through ASGI (see bench_metrics.py). Each request
+goes through a traced service method and an instrumented in-memory
+repository, the layers real endpoints have. Sampled traces are written by
+the JSON lines file exporter to a temporary directory, so their encoding
+cost is included. Whole-app timings vary by several microseconds between
+runs, so the middleware is also timed alone, around a bare ASGI app.
+
+Usage:
+    python benchmarks/bench_tracing.py
+    python benchmarks/bench_tracing.py --requests 50000 --rates 0 0.01 0.1 1
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+
+from app.api.tracing import RequestContextMiddleware
+from app.core.tracing import JsonLinesFileExporter, Tracer, trace_methods
+from app.infrastructure.instrumentation import InstrumentedRepository
+from app.infrastructure.memory import InMemoryExamRepository
+from benchmarks.bench_metrics import drive
+
+
+@trace_methods
+class LookupService:
+    def __init__(self, repository):
+        self.repository = repository
+    
+    async def find_exam(self, exam_id: str):
+        return await self.repository.get_by_id(exam_id)
+
+
+def build_app(tracer: Tracer = None) -> FastAPI:
+    app = FastAPI()
+    if tracer is not None:
+        app.add_middleware(RequestContextMiddleware, tracer=tracer)
+    service = LookupService(InstrumentedRepository(InMemoryExamRepository(), "exams"))
+    
+    @app.get("/exams/{exam_id}")
+    async def get_exam(exam_id: str):
+        await service.find_exam(exam_id)
+        return {"id": exam_id}
+    
+    return app
+
+
+async def bench(count: int, repeat: int, rates) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        exporters = []
+        apps = [("no middleware", build_app())]
+        for rate in rates:
+            exporter = JsonLinesFileExporter(f"{directory}/traces-{rate}.jsonl")
+            exporters.append(exporter)
+            apps.append((f"sample rate {rate:g}", build_app(Tracer(exporter, sample_rate=rate))))
+        
+        for _, app in apps:
+            await drive(app, 100)
+        
+        # Alternate the configurations so drift in machine load affects all alike
+        best = {label: float("inf") for label, _ in apps}
+        for _ in range(repeat):
+            for label, app in apps:
+                best[label] = min(best[label], await drive(app, count))
+        
+        for exporter in exporters:
+            exporter.shutdown()
+    
+    baseline = best["no middleware"]
+    print(f"{count} requests through ASGI")
+    for label, elapsed in best.items():
+        print(f"   {label:<18} {elapsed / count * 1e6:>7.2f} us/request"
+              f"  {(elapsed - baseline) / count * 1e6:>+7.2f} us")
+
+
+async def bench_middleware_alone(count: int) -> None:
+    async def bare(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        pass
+    
+    scope = {"type": "http", "method": "GET", "path": "/exams/1", "headers": []}
+    
+    async def run(app) -> float:
+        start = time.perf_counter()
+        for _ in range(count):
+            await app(dict(scope), receive, send)
+        return (time.perf_counter() - start) / count
+    
+    baseline = min([await run(bare) for _ in range(3)])
+    wrapped = min([await run(RequestContextMiddleware(bare, Tracer())) for _ in range(3)])
+    print()
+    print(f"middleware alone, not sampled: {(wrapped - baseline) * 1e6:.2f} us/request")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark request tracing overhead")
+    parser.add_argument("--requests", type=int, default=10000, help="Requests per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per configuration (best is kept)")
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.0, 0.01, 1.0], help="Sample rates to compare")
+    
+    args = parser.parse_args()
+    
+    asyncio.run(bench(args.requests, args.repeat, args.rates))
+    asyncio.run(bench_middleware_alone(args.requests * 10))
+
+
+if __name__ == "__main__":
+    main()
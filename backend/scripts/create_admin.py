@@ -3,9 +3,14 @@
 Script to create an admin user in the database.
 Radhe Radhe! 🙏
 
+Role changes bump the user's role version: access tokens issued for the
+previous role are rejected once running servers refresh their role versions
+(ROLE_VERSION_REFRESH_SECONDS), and the user has to sign in again.
+
 Usage:
     python scripts/create_admin.py
     python scripts/create_admin.py --email admin@example.com --name "Admin User"
+    python scripts/create_admin.py --email admin@example.com --role USER  # demote
 """
 
 import asyncio
@@ -18,12 +23,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.domain.user.entity import User, UserRole
+from app.infrastructure.identity import UUID_REPRESENTATION
 from app.infrastructure.user.repository import MongoDBUserRepository
 from app.infrastructure.user.mapper import UserMapper
 
 
-async def create_admin_user(email: str = None, name: str = None, mobile: str = None):
-    """Create an admin user in the database."""
+async def create_admin_user(
+    email: str = None,
+    name: str = None,
+    mobile: str = None,
+    role: UserRole = UserRole.ADMIN,
+):
+    """Create an admin user in the database, or change an existing user's role."""
     # Load environment variables
     from dotenv import load_dotenv
     load_dotenv()
@@ -32,7 +43,7 @@ async def create_admin_user(email: str = None, name: str = None, mobile: str = N
     DATABASE_NAME = os.getenv("DATABASE_NAME", "lifeschool_db")
     
     # Connect to MongoDB
-    client = AsyncIOMotorClient(DATABASE_URL)
+    client = AsyncIOMotorClient(DATABASE_URL, uuidRepresentation=UUID_REPRESENTATION)
     db = client[DATABASE_NAME]
     
     try:
@@ -42,9 +53,9 @@ async def create_admin_user(email: str = None, name: str = None, mobile: str = N
         # Get user input if not provided
         if not email:
             email = input("Enter admin email: ").strip()
-        if not name:
+        if not name and role == UserRole.ADMIN:
             name = input("Enter admin name: ").strip()
-        if not mobile:
+        if not mobile and role == UserRole.ADMIN:
             mobile_input = input("Enter admin mobile (10 digits, optional): ").strip()
             mobile = mobile_input if mobile_input else None
         
@@ -66,23 +77,28 @@ async def create_admin_user(email: str = None, name: str = None, mobile: str = N
         if existing_user:
             print(f"⚠️  User with email {email} already exists!")
             
-            # Update to admin if not already admin
-            if existing_user.role != UserRole.ADMIN:
-                update_choice = input(f"  Current role: {existing_user.role.value}. Update to ADMIN? (y/n): ").strip().lower()
+            # Change the role if it differs
+            if existing_user.role != role:
+                update_choice = input(f"  Current role: {existing_user.role.value}. Update to {role.value}? (y/n): ").strip().lower()
                 if update_choice == 'y':
-                    existing_user.role = UserRole.ADMIN
+                    existing_user.change_role(role)
                     if mobile and not existing_user.mobile:
                         existing_user.update_mobile(mobile)
                     await user_repository.update(existing_user)
-                    print(f"✅ User {email} updated to ADMIN role")
+                    print(f"✅ User {email} updated to {role.value} role")
+                    print("   Tokens issued for the previous role stop working; the user must sign in again.")
                     return True
                 else:
                     print("❌ Operation cancelled")
                     return False
             else:
-                print(f"✅ User {email} is already an ADMIN")
+                print(f"✅ User {email} is already an {role.value}")
                 return True
         
+        if role != UserRole.ADMIN:
+            print(f"❌ No user with email {email}; only existing users can be demoted")
+            return False
+        
         # Create new admin user
         admin_user = User(
             email=email,
@@ -102,7 +118,7 @@ async def create_admin_user(email: str = None, name: str = None, mobile: str = N
         print(f"\n📝 You can now login with this email to access admin features.")
         
         return True
-        
+    
     except ValueError as e:
         print(f"❌ Validation error: {e}")
         return False
@@ -121,6 +137,12 @@ def main():
     parser.add_argument("--email", help="Admin email address")
     parser.add_argument("--name", help="Admin name")
     parser.add_argument("--mobile", help="Admin mobile number (10 digits)")
+    parser.add_argument(
+        "--role",
+        choices=[role.value for role in UserRole],
+        default=UserRole.ADMIN.value,
+        help="Role to give the user (USER demotes an existing admin)",
+    )
     
     args = parser.parse_args()
     
@@ -133,7 +155,8 @@ def main():
     result = asyncio.run(create_admin_user(
         email=args.email,
         name=args.name,
-        mobile=args.mobile
+        mobile=args.mobile,
+        role=UserRole(args.role),
     ))
     
     sys.exit(0 if result else 1)
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Convert stored documents to the compact identity format.
+
+Legacy documents repeat the entity id in "_id" and "id" as 36-character
+strings (content documents have an ObjectId _id and a string "id"), and
+registrations store user_id/exam_id as strings. The compact format keeps the
+id in _id only and stores every UUID as BSON binary subtype 4.
+
+The conversion is online: it works through each collection in small batches
+while the application keeps serving requests. Run the application with
+MONGO_LEGACY_ID_READS=true until the migration has finished. Since _id cannot
+be updated in place, each batch reads and deletes the legacy documents and
+inserts the converted ones inside one transaction (requires a replica set; see
+--no-transactions). The script is idempotent and can be re-run after an
+interruption. Once no legacy documents remain, indexes on the old "id" field
+are dropped.
+
+Usage:
+    python scripts/migrate_uuid_ids.py --dry-run
+    python scripts/migrate_uuid_ids.py
+    python scripts/migrate_uuid_ids.py --batch-size 200 --pause 0.1
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorClientSession,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from app.infrastructure.identity import LEGACY_ID_FILTER, UUID_REPRESENTATION, document_id, to_uuid
+from app.infrastructure.indexes import create_indexes
+
+# Collections to convert, in order, with their UUID-valued reference fields.
+# Until every collection is converted, registrations and users can be stored
+# in different formats; with MONGO_LEGACY_ID_READS on, the admin registration
+# view joins them in the application instead of with $lookup.
+COLLECTIONS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("users", ()),
+    ("exams", ()),
+    ("content", ()),
+    ("exam_registrations", ("user_id", "exam_id")),
+]
+
+
+def convert(document: Dict[str, Any], uuid_fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Convert a legacy document to the compact identity format."""
+    converted = {key: value for key, value in document.items() if key != "id"}
+    converted["_id"] = document_id(document)
+    for field in uuid_fields:
+        if converted.get(field) is not None:
+            converted[field] = to_uuid(converted[field])
+    return converted
+
+
+async def supports_transactions(client: AsyncIOMotorClient) -> bool:
+    """Transactions need a replica set or a sharded cluster."""
+    hello = await client.admin.command("hello")
+    return "setName" in hello or hello.get("msg") == "isdbgrid"
+
+
+async def index_size(db: AsyncIOMotorDatabase, name: str) -> int:
+    """Total size of a collection's indexes in bytes."""
+    stats = await db.command("collStats", name)
+    return stats.get("totalIndexSize", 0)
+
+
+async def convert_batch(
+    collection: AsyncIOMotorCollection,
+    uuid_fields: Tuple[str, ...],
+    batch_size: int,
+    session: Optional[AsyncIOMotorClientSession] = None,
+) -> int:
+    """Replace one batch of legacy documents with converted ones."""
+    documents = await collection.find(LEGACY_ID_FILTER, session=session).to_list(length=batch_size)
+    if not documents:
+        return 0
+    
+    legacy_ids = [document["_id"] for document in documents]
+    replacements = [convert(document, uuid_fields) for document in documents]
+    
+    # Delete before inserting: the converted documents would otherwise
+    # collide with the legacy ones on unique indexes such as users.email
+    await collection.delete_many({"_id": {"$in": legacy_ids}}, session=session)
+    await collection.insert_many(replacements, session=session)
+    return len(replacements)
+
+
+async def migrate_collection(
+    client: AsyncIOMotorClient,
+    collection: AsyncIOMotorCollection,
+    uuid_fields: Tuple[str, ...],
+    batch_size: int,
+    pause: float,
+    use_transactions: bool,
+) -> int:
+    """
+    Convert every legacy document of a collection, one batch at a time.
+    
+    With transactions the batch is read, deleted and re-inserted atomically;
+    a concurrent write by the application aborts the transaction, which is
+    then retried, so no update is lost.
+    """
+    converted = 0
+    while True:
+        if use_transactions:
+            async with await client.start_session() as session:
+                count = await session.with_transaction(
+                    lambda s: convert_batch(collection, uuid_fields, batch_size, s)
+                )
+        else:
+            count = await convert_batch(collection, uuid_fields, batch_size)
+        
+        if not count:
+            return converted
+        
+        converted += count
+        print(f"   {collection.name}: {converted} converted")
+        if pause:
+            await asyncio.sleep(pause)
+
+
+async def drop_legacy_indexes(collection: AsyncIOMotorCollection) -> List[str]:
+    """Drop indexes that include the legacy "id" field."""
+    dropped = []
+    for name, info in (await collection.index_information()).items():
+        if any(field == "id" for field, _ in info["key"]):
+            await collection.drop_index(name)
+            dropped.append(name)
+    return dropped
+
+
+async def migrate(batch_size: int, pause: float, dry_run: bool, use_transactions: bool) -> bool:
+    """Migrate all collections and report index sizes before and after."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    DATABASE_URL = os.getenv("DATABASE_URL", "mongodb://localhost:27017")
+    DATABASE_NAME = os.getenv("DATABASE_NAME", "lifeschool_db")
+    
+    client = AsyncIOMotorClient(DATABASE_URL, uuidRepresentation=UUID_REPRESENTATION)
+    db = client[DATABASE_NAME]
+    
+    try:
+        if dry_run:
+            for name, _ in COLLECTIONS:
+                count = await db[name].count_documents(LEGACY_ID_FILTER)
+                print(f"   {name}: {count} legacy documents")
+            return True
+        
+        if use_transactions and not await supports_transactions(client):
+            print("❌ This deployment does not support transactions. "
+                  "Re-run with --no-transactions to convert without them.")
+            return False
+        
+        sizes_before = {name: await index_size(db, name) for name, _ in COLLECTIONS}
+        
+        # New documents have no "id" field; make sure a unique index on it
+        # does not reject them while the conversion runs
+        await create_indexes(db)
+        
+        for name, uuid_fields in COLLECTIONS:
+            print(f"🔄 Converting {name}...")
+            count = await migrate_collection(
+                client, db[name], uuid_fields, batch_size, pause, use_transactions
+            )
+            print(f"✅ {name}: {count} documents converted")
+        
+        for name, _ in COLLECTIONS:
+            dropped = await drop_legacy_indexes(db[name])
+            if dropped:
+                print(f"🗑️  {name}: dropped {', '.join(dropped)}")
+        
+        print()
+        for name, _ in COLLECTIONS:
+            after = await index_size(db, name)
+            print(f"   {name}: index size {sizes_before[name]:,} -> {after:,} bytes")
+        print("\n📝 Unset MONGO_LEGACY_ID_READS and restart the application.")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        print("   The script can be re-run; converted documents are skipped.")
+        return False
+    finally:
+        client.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Convert documents to binary UUID _id storage")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents converted per batch")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    parser.add_argument("--dry-run", action="store_true", help="Only count legacy documents")
+    parser.add_argument(
+        "--no-transactions",
+        action="store_true",
+        help="Convert without transactions (standalone servers); a crash mid-batch can lose that batch",
+    )
+    
+    args = parser.parse_args()
+    
+    result = asyncio.run(migrate(
+        batch_size=args.batch_size,
+        pause=args.pause,
+        dry_run=args.dry_run,
+        use_transactions=not args.no_transactions,
+    ))
+    
+    sys.exit(0 if result else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.application.registration.admin_query_service import AdminRegistrationQueryService
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryExamRepository, InMemoryRegistrationRepository, InMemoryUserRepository
+from app.domain.registration.queries import RegistrationUserQuery
+from app.infrastructure.registration.user_query import MongoDBRegistrationUserQuery
+
+
+class InMemoryRegistrationUserQuery(RegistrationUserQuery):
+    """Registration/user join over in-memory repositories, as a storage-side join would return it."""
+    
+    def __init__(self, reg_repo: InMemoryRegistrationRepository, user_repo: InMemoryUserRepository):
+        self._reg_repo = reg_repo
+        self._user_repo = user_repo
+        self.join_calls = 0
+    
+    async def get_with_users_by_exam_id(self, exam_id, limit=None, after=None) -> list[dict]:
+        self.join_calls += 1
+        rows = []
+        for reg in await self._reg_repo.get_by_exam_id(exam_id, limit, after):
+            user = self._user_repo._users.get(reg.user_id)
+            if not user:
+                continue
+            # Rows come back as raw storage values, e.g. string ids
+            rows.append({
+                "registration_id": str(reg.id),
+                "status": reg.status.value,
+                "registered_at": reg.created_at,
+                "user": {
+                    "id": str(user.id),
+                    "name": user.name,
+                    "email": user.email,
+                    "mobile": user.mobile,
+                },
+            })
+        return rows
+
+
+class NoPerRowLookupUserRepository(InMemoryUserRepository):
+    """In-memory user repository that fails on per-row lookups."""
+    
+    async def get_by_id(self, user_id) -> User:
+        raise AssertionError("get_by_id must not be called per registration")
+
+
+async def _create_exam(exam_repo: InMemoryExamRepository) -> Exam:
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    end_date = start_date + timedelta(hours=3)
+    exam = Exam(
+        title="Test Exam",
+        start_date=start_date,
+        end_date=end_date,
+        status=ExamStatus.ACTIVE,
+    )
+    return await exam_repo.create(exam)
+
+
+@pytest.mark.asyncio
+async def test_registrations_are_joined_by_the_join_query():
+    """Test that the service uses the storage-side join query when there is one."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = NoPerRowLookupUserRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    join_query = InMemoryRegistrationUserQuery(reg_repo, user_repo)
+    service = AdminRegistrationQueryService(reg_repo, exam_repo, user_repo, join_query)
+    exam = await _create_exam(exam_repo)
+    
+    user = User(email="user1@example.com", name="User One", mobile="1234567890")
+    await user_repo.create(user)
+    reg = ExamRegistration(user_id=user.id, exam_id=exam.id, status=RegistrationStatus.PAID)
+    await reg_repo.create(reg)
+    await reg_repo.create(ExamRegistration(user_id=uuid4(), exam_id=exam.id))
+    
+    registrations = await service.get_exam_registrations(exam.id, UserRole.ADMIN)
+    
+    assert join_query.join_calls == 1
+    assert len(registrations) == 1
+    assert registrations[0].registration_id == reg.id
+    assert registrations[0].user.id == user.id
+    assert registrations[0].user.mobile == user.mobile
+    assert registrations[0].status == RegistrationStatus.PAID
+    assert registrations[0].registered_at == reg.created_at
+
+
+@pytest.mark.asyncio
+async def test_default_join_batches_user_lookups():
+    """Test that without a join query the service fetches users in one batch."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = NoPerRowLookupUserRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    service = AdminRegistrationQueryService(reg_repo, exam_repo, user_repo)
+    exam = await _create_exam(exam_repo)
+    
+    async def get_by_ids(user_ids):
+        return {
+            user.id: user
+            for user in (user_repo._users.get(uid) for uid in user_ids)
+            if user
+        }
+    user_repo.get_by_ids = get_by_ids
+    
+    user = User(email="user1@example.com", name="User One", mobile="1234567890")
+    await user_repo.create(user)
+    reg = ExamRegistration(user_id=user.id, exam_id=exam.id)
+    await reg_repo.create(reg)
+    await reg_repo.create(ExamRegistration(user_id=uuid4(), exam_id=exam.id))
+    
+    registrations = await service.get_exam_registrations(exam.id, UserRole.ADMIN)
+    
+    assert [r.registration_id for r in registrations] == [reg.id]
+
+
+@pytest.mark.asyncio
+async def test_mongo_join_is_one_aggregation():
+    """Test that the MongoDB join query reads a page with a single $lookup aggregation."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=[])
+    collection = MagicMock()
+    collection.aggregate.return_value = cursor
+    query = MongoDBRegistrationUserQuery(SimpleNamespace(exam_registrations=collection))
+    
+    assert await query.get_with_users_by_exam_id(uuid4(), limit=10) == []
+    
+    (pipeline,), _ = collection.aggregate.call_args
+    stages = [next(iter(stage)) for stage in pipeline]
+    assert stages == ["$match", "$sort", "$lookup", "$unwind", "$limit", "$project"]
+    cursor.to_list.assert_awaited_once_with(length=10)
@@ -1,42 +1,18 @@
+import asyncio
 import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
+from pymongo import ReturnDocument
+
 from app.application.user.dto import GoogleLoginRequest
 from app.application.user.services import UserService
 from app.domain.user.entity import User, UserRole
 from app.domain.user.repository import UserRepository
-
-
-class InMemoryUserRepository(UserRepository):
-    """In-memory implementation for testing."""
-    
-    def __init__(self):
-        self._users = {}
-        self._users_by_email = {}
-    
-    async def create(self, user: User) -> User:
-        if user.email in self._users_by_email:
-            from app.domain.user.exceptions import UserAlreadyExistsError
-            raise UserAlreadyExistsError(f"User with email {user.email} already exists")
-        
-        self._users[str(user.id)] = user
-        self._users_by_email[user.email] = user
-        return user
-    
-    async def get_by_id(self, user_id) -> User:
-        return self._users.get(str(user_id))
-    
-    async def get_by_email(self, email: str) -> User:
-        return self._users_by_email.get(email.lower())
-    
-    async def update(self, user: User) -> User:
-        if str(user.id) not in self._users:
-            from app.domain.user.exceptions import UserNotFoundError
-            raise UserNotFoundError(f"User with id {user.id} not found")
-        
-        self._users[str(user.id)] = user
-        self._users_by_email[user.email] = user
-        return user
+from app.infrastructure.memory import InMemoryUserRepository
+from app.infrastructure.user.mapper import UserMapper
+from app.infrastructure.user.repository import MongoDBUserRepository
 
 
 @pytest.mark.asyncio
@@ -77,6 +53,20 @@ async def test_existing_user_is_returned_on_subsequent_login():
     assert user2.name == "Test User"
 
 
+@pytest.mark.asyncio
+async def test_blank_google_name_falls_back_to_the_email_local_part():
+    """Test that a whitespace-only name logs in as the email's local part instead of failing."""
+    repository = InMemoryUserRepository()
+    service = UserService(repository)
+    
+    user = await service.login_with_google(GoogleLoginRequest(email="test@example.com", name="   "))
+    again = await service.login_with_google(GoogleLoginRequest(email="test@example.com", name=" "))
+    
+    assert user.name == "test"
+    assert again.id == user.id
+    assert GoogleLoginRequest(email="test@example.com", name="  Test User ").name == "Test User"
+
+
 @pytest.mark.asyncio
 async def test_jwt_token_is_issued_after_login():
     """Test that JWT token is issued after login."""
@@ -101,3 +91,62 @@ async def test_jwt_token_is_issued_after_login():
     assert token_data.email == user.email
     assert token_data.role == user.role
 
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_logins_get_the_same_user():
+    """Test that simultaneous first logins with one email create a single user."""
+    repository = InMemoryUserRepository()
+    service = UserService(repository)
+    
+    request = GoogleLoginRequest(email="Test@Example.com", name="Test User")
+    users = await asyncio.gather(*(service.login_with_google(request) for _ in range(5)))
+    
+    assert len({user.id for user in users}) == 1
+    assert (await repository.get_by_email("test@example.com")).id == users[0].id
+
+
+@pytest.mark.asyncio
+async def test_default_upsert_reads_back_a_user_created_concurrently():
+    """Test that the fallback upsert returns the winner when its create loses a race."""
+    class RacingRepository(InMemoryUserRepository):
+        """Repository whose first email lookup misses a user created just after it."""
+        
+        upsert_by_email = UserRepository.upsert_by_email
+        
+        def __init__(self, winner):
+            super().__init__()
+            self.winner = winner
+        
+        async def get_by_email(self, email):
+            if self.winner:
+                winner, self.winner = self.winner, None
+                await self.create(winner)
+                return None
+            return await super().get_by_email(email)
+    
+    winner = User(email="test@example.com", name="First Tab")
+    repository = RacingRepository(winner)
+    
+    user = await repository.upsert_by_email(User(email="test@example.com", name="Second Tab"))
+    
+    assert user.id == winner.id
+    assert user.name == "First Tab"
+
+
+@pytest.mark.asyncio
+async def test_mongodb_upsert_is_one_find_one_and_update():
+    """Test that the MongoDB upsert inserts only on a miss, in a single call."""
+    user = User(email="test@example.com", name="Test User")
+    collection = AsyncMock()
+    collection.find_one_and_update.return_value = UserMapper.to_document(user)
+    repository = MongoDBUserRepository(SimpleNamespace(users=collection))
+    
+    stored = await repository.upsert_by_email(user)
+    
+    assert stored.id == user.id
+    (query, update), options = collection.find_one_and_update.call_args
+    assert query == {"email": "test@example.com"}
+    assert update == {"$setOnInsert": UserMapper.to_document(user)}
+    assert options == {"upsert": True, "return_document": ReturnDocument.AFTER}
+    collection.find_one.assert_not_called()
@@ -4,39 +4,7 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.core.dependencies import set_user_repository
 from app.domain.user.entity import User, UserRole
-from app.domain.user.repository import UserRepository
-
-
-class InMemoryUserRepository(UserRepository):
-    """In-memory implementation for testing."""
-    
-    def __init__(self):
-        self._users = {}
-        self._users_by_email = {}
-    
-    async def create(self, user: User) -> User:
-        if user.email in self._users_by_email:
-            from app.domain.user.exceptions import UserAlreadyExistsError
-            raise UserAlreadyExistsError(f"User with email {user.email} already exists")
-        
-        self._users[str(user.id)] = user
-        self._users_by_email[user.email] = user
-        return user
-    
-    async def get_by_id(self, user_id) -> User:
-        return self._users.get(str(user_id))
-    
-    async def get_by_email(self, email: str) -> User:
-        return self._users_by_email.get(email.lower())
-    
-    async def update(self, user: User) -> User:
-        if str(user.id) not in self._users:
-            from app.domain.user.exceptions import UserNotFoundError
-            raise UserNotFoundError(f"User with id {user.id} not found")
-        
-        self._users[str(user.id)] = user
-        self._users_by_email[user.email] = user
-        return user
+from app.infrastructure.memory import InMemoryUserRepository
 
 
 @pytest.fixture
@@ -0,0 +1,70 @@
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.main import app
+from app.core.dependencies import set_content_repository, set_user_repository
+from app.core.security import ALGORITHM, SECRET_KEY, create_access_token, decode_token, role_versions
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryContentRepository, InMemoryUserRepository
+
+
+@pytest.fixture(autouse=True)
+def reset_role_versions():
+    yield
+    role_versions.replace({})
+
+
+def get_admin_content(token):
+    return TestClient(app).get(
+        "/admin/content?type=BLOG", headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_role_change_rejects_tokens_issued_before_it():
+    """Test that a token for an older role version gets 401 and a re-issued one works."""
+    repo = InMemoryUserRepository()
+    set_user_repository(repo)
+    set_content_repository(InMemoryContentRepository())
+    admin = await repo.create(User(email="admin@test.com", name="Admin", role=UserRole.ADMIN))
+    stale_token = create_access_token(admin.id, admin.email, admin.role)
+    
+    assert get_admin_content(stale_token).status_code == 200
+    
+    role_versions.replace({admin.id: 1})
+    response = get_admin_content(stale_token)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Role has changed, please sign in again"
+    
+    fresh_token = create_access_token(admin.id, admin.email, admin.role, role_version=1)
+    assert get_admin_content(fresh_token).status_code == 200
+
+
+def test_token_without_role_version_claim_is_version_zero():
+    """Test that tokens issued before role versions existed decode as version 0."""
+    user = User(email="user@test.com", name="User")
+    payload = jwt.decode(create_access_token(user.id, user.email, user.role), SECRET_KEY, algorithms=[ALGORITHM])
+    del payload["rv"]
+    
+    token_data, _ = decode_token(jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM))
+    
+    assert token_data.role_version == 0
+    assert role_versions.is_current(token_data)
+
+
+@pytest.mark.asyncio
+async def test_refresh_loads_only_users_whose_role_changed():
+    """Test that change_role bumps the version and refresh picks up only changed users."""
+    repo = InMemoryUserRepository()
+    demoted = await repo.create(User(email="admin@test.com", name="Admin", role=UserRole.ADMIN))
+    await repo.create(User(email="user@test.com", name="User"))
+    
+    demoted.change_role(UserRole.USER)
+    demoted.change_role(UserRole.USER)
+    await repo.update(demoted)
+    await role_versions.refresh(repo)
+    
+    assert demoted.role_version == 1
+    assert len(role_versions) == 1
+    assert await repo.get_role_versions() == {demoted.id: 1}
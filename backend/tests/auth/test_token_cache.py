@@ -0,0 +1,89 @@
+import time
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+from app.core import security
+from app.core.security import (
+    ALGORITHM,
+    SECRET_KEY,
+    clear_token_cache,
+    create_access_token,
+    token_cache_stats,
+    verify_token,
+)
+from app.domain.user.entity import UserRole
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    """Start every test with an empty token cache."""
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+def count_decodes(monkeypatch):
+    """Count full JWT decodes performed by verify_token."""
+    calls = {"count": 0}
+    original = security.decode_token
+    
+    def counting_decode(token):
+        calls["count"] += 1
+        return original(token)
+    
+    monkeypatch.setattr(security, "decode_token", counting_decode)
+    return calls
+
+
+def test_repeated_token_is_decoded_once(monkeypatch):
+    """Test that a token presented again is served from the cache."""
+    calls = count_decodes(monkeypatch)
+    user_id = uuid4()
+    token = create_access_token(user_id, "cached@example.com", UserRole.ADMIN)
+    
+    first = verify_token(token)
+    second = verify_token(token)
+    
+    assert calls["count"] == 1
+    assert second is first
+    assert second.user_id == user_id
+    assert second.email == "cached@example.com"
+    assert second.role == UserRole.ADMIN
+    
+    stats = token_cache_stats()
+    assert stats["enabled"] is True
+    assert stats["hits"] >= 1
+    assert stats["size"] == 1
+
+
+def test_cached_token_rejected_after_expiry(monkeypatch):
+    """Test that a cached token stops verifying once its exp has passed."""
+    now = int(time.time())
+    token = jwt.encode(
+        {"sub": str(uuid4()), "email": "exp@example.com", "role": "USER", "exp": now + 5},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    
+    assert verify_token(token) is not None
+    
+    # Still valid at exactly exp, like jose
+    monkeypatch.setattr(security.time, "time", lambda: now + 5)
+    assert verify_token(token) is not None
+    
+    monkeypatch.setattr(security.time, "time", lambda: now + 6)
+    assert verify_token(token) is None
+    assert token_cache_stats()["size"] == 0
+
+
+def test_invalid_token_not_cached(monkeypatch):
+    """Test that tokens failing verification are never cached."""
+    calls = count_decodes(monkeypatch)
+    token = create_access_token(uuid4(), "bad@example.com", UserRole.USER) + "x"
+    
+    assert verify_token(token) is None
+    assert verify_token(token) is None
+    assert calls["count"] == 2
+    assert token_cache_stats()["size"] == 0
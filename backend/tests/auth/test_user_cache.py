@@ -0,0 +1,144 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.application.user.dto import MobileUpdateRequest
+from app.application.user.services import UserService
+from app.core.cache import TTLCache
+from app.core.dependencies import set_user_repository
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryUserRepository
+from app.infrastructure.user.cached_repository import CachingUserRepository
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    """In-memory user repository that counts reads by ID."""
+    
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+    
+    async def get_by_id(self, user_id) -> User:
+        self.get_by_id_calls += 1
+        return await super().get_by_id(user_id)
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_entries_expire_after_ttl():
+    """Test that entries are served until their ttl elapses."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=30, clock=clock)
+    cache.set("a", 1)
+    
+    clock.now = 29.9
+    assert cache.get("a") == 1
+    
+    clock.now = 30.0
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that a full cache evicts the least recently used entry."""
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_skip_the_repository():
+    """Test that repeated reads by ID hit the cache, not the repository."""
+    inner = CountingUserRepository()
+    repository = CachingUserRepository(inner, TTLCache(maxsize=10, ttl=60))
+    user = await repository.create(User(email="test@example.com", name="Test User"))
+    
+    for _ in range(3):
+        fetched = await repository.get_by_id(user.id)
+        assert fetched == user
+    
+    assert inner.get_by_id_calls == 0
+    assert repository.cache.hits == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_users_are_isolated_copies():
+    """Test that mutating a returned user does not change the cached one."""
+    inner = CountingUserRepository()
+    repository = CachingUserRepository(inner, TTLCache(maxsize=10, ttl=60))
+    user = await repository.create(User(email="test@example.com", name="Test User"))
+    
+    fetched = await repository.get_by_id(user.id)
+    fetched.update_mobile("1234567890")
+    
+    assert (await repository.get_by_id(user.id)).mobile is None
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_cached_user():
+    """Test that update makes the new state visible through the cache."""
+    inner = CountingUserRepository()
+    repository = CachingUserRepository(inner, TTLCache(maxsize=10, ttl=60))
+    user = await repository.create(User(email="test@example.com", name="Test User"))
+    
+    promoted = await repository.get_by_id(user.id)
+    promoted.role = UserRole.ADMIN
+    await repository.update(promoted)
+    
+    assert (await repository.get_by_id(user.id)).role == UserRole.ADMIN
+    assert inner.get_by_id_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_mobile_update_keeps_a_role_changed_behind_the_cache():
+    """Test that updating the mobile of a stale cached user does not write back its old role."""
+    inner = CountingUserRepository()
+    repository = CachingUserRepository(inner, TTLCache(maxsize=10, ttl=60))
+    service = UserService(repository)
+    user = await repository.create(User(email="test@example.com", name="Test User"))
+    
+    # Another process (scripts/create_admin.py) promotes the user
+    promoted = await inner.get_by_id(user.id)
+    promoted.change_role(UserRole.ADMIN)
+    await inner.update(promoted)
+    assert (await repository.get_by_id(user.id)).role == UserRole.USER
+    
+    updated = await service.update_mobile(user.id, MobileUpdateRequest(mobile="1234567890"))
+    
+    stored = await inner.get_by_id(user.id)
+    assert stored.role == UserRole.ADMIN
+    assert stored.role_version == 1
+    assert stored.mobile == "1234567890"
+    assert updated.role == UserRole.ADMIN
+    assert (await repository.get_by_id(user.id)).role == UserRole.ADMIN
+
+
+def test_mobile_update_is_visible_to_next_request():
+    """Test that /auth/me reflects /auth/mobile through the user cache."""
+    inner = CountingUserRepository()
+    set_user_repository(CachingUserRepository(inner, TTLCache(maxsize=10, ttl=60)))
+    client = TestClient(app)
+    
+    login = client.post("/auth/google", json={"email": "test@example.com", "name": "Test User"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    
+    assert client.get("/auth/me", headers=headers).json()["mobile"] is None
+    assert client.post("/auth/mobile", json={"mobile": "1234567890"}, headers=headers).status_code == 200
+    assert client.get("/auth/me", headers=headers).json()["mobile"] == "1234567890"
+    assert inner.get_by_id_calls == 0
@@ -0,0 +1,122 @@
+import pytest
+from uuid import uuid4
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.cache import TTLCache
+from app.core.dependencies import set_content_repository, set_user_repository
+from app.core.security import create_access_token
+from app.domain.registration.entity import ExamRegistration
+from app.domain.user.entity import User, UserAccess, UserContact, UserRole
+from app.infrastructure.memory import (
+    InMemoryContentRepository,
+    InMemoryRegistrationRepository,
+    InMemoryUserRepository,
+)
+from app.infrastructure.user.cached_repository import CachingUserRepository
+from app.infrastructure.user.mapper import ACCESS_PROJECTION, CONTACT_PROJECTION, UserMapper
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    """In-memory user repository that counts full and projected reads."""
+    
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+        self.get_access_calls = 0
+        self.contact_ids = []
+    
+    async def get_by_id(self, user_id):
+        self.get_by_id_calls += 1
+        return await super().get_by_id(user_id)
+    
+    async def get_access_by_id(self, user_id):
+        self.get_access_calls += 1
+        user = await super().get_by_id(user_id)
+        return UserAccess.from_user(user) if user else None
+    
+    async def get_contacts_by_ids(self, user_ids):
+        user_ids = list(user_ids)
+        self.contact_ids += user_ids
+        users = await super().get_by_ids(user_ids)
+        return {user_id: UserContact.from_user(user) for user_id, user in users.items()}
+
+
+def test_projected_documents_map_to_read_models():
+    """Test that projected user documents map to access and contact read models."""
+    user = User(email="user@test.com", name="User", mobile="9876543210", role=UserRole.ADMIN)
+    document = UserMapper.to_document(user)
+    
+    access = UserMapper.to_access({"_id": user.id, **{k: document[k] for k in ACCESS_PROJECTION}})
+    contact = UserMapper.to_contact({"_id": user.id, **{k: document[k] for k in CONTACT_PROJECTION}})
+    
+    assert (access.id, access.role, access.is_profile_complete) == (user.id, UserRole.ADMIN, True)
+    assert (contact.id, contact.name, contact.email, contact.mobile) == (
+        user.id, user.name, user.email, user.mobile
+    )
+
+
+@pytest.mark.asyncio
+async def test_role_gated_endpoint_reads_no_user_fields():
+    """Test that an admin-only listing authorizes from the token, without reading the user."""
+    repo = CountingUserRepository()
+    set_user_repository(repo)
+    set_content_repository(InMemoryContentRepository())
+    admin = await repo.create(User(email="admin@test.com", name="Admin", role=UserRole.ADMIN))
+    token = create_access_token(admin.id, admin.email, admin.role)
+    
+    response = TestClient(app).get(
+        "/admin/content?type=BLOG", headers={"Authorization": f"Bearer {token}"}
+    )
+    
+    assert response.status_code == 200
+    assert repo.get_access_calls == 0
+    assert repo.get_by_id_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_access_reuses_cached_user_and_is_invalidated_on_update():
+    """Test that access is derived from a cached user, cached itself, and dropped on update."""
+    repo = CountingUserRepository()
+    cached = CachingUserRepository(repo, TTLCache(maxsize=10, ttl=60))
+    user = await cached.create(User(email="user@test.com", name="User"))
+    
+    assert (await cached.get_access_by_id(user.id)).role == UserRole.USER
+    assert repo.get_access_calls == 0
+    
+    cached.cache.clear()
+    await cached.get_access_by_id(user.id)
+    await cached.get_access_by_id(user.id)
+    assert repo.get_access_calls == 1
+    
+    user.role = UserRole.ADMIN
+    await cached.update(user)
+    cached.cache.invalidate(user.id)
+    
+    assert (await cached.get_access_by_id(user.id)).role == UserRole.ADMIN
+    assert repo.get_access_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_contacts_fetch_misses_without_filling_the_cache():
+    """Test that bulk contact reads only fetch uncached users and do not cache them."""
+    repo = CountingUserRepository()
+    cached = CachingUserRepository(repo, TTLCache(maxsize=10, ttl=60))
+    warm = await cached.create(User(email="warm@test.com", name="Warm"))
+    cold = await repo.create(User(email="cold@test.com", name="Cold"))
+    
+    contacts = await cached.get_contacts_by_ids([warm.id, cold.id, uuid4()])
+    
+    assert {contacts[warm.id].email, contacts[cold.id].email} == {"warm@test.com", "cold@test.com"}
+    assert warm.id not in repo.contact_ids
+    assert len(cached.cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_registration_existence_check():
+    """Test that exists_for_user_and_exam reports whether a registration exists."""
+    repo = InMemoryRegistrationRepository()
+    registration = await repo.create(ExamRegistration(user_id=uuid4(), exam_id=uuid4()))
+    
+    assert await repo.exists_for_user_and_exam(registration.user_id, registration.exam_id)
+    assert not await repo.exists_for_user_and_exam(registration.user_id, uuid4())
@@ -3,38 +3,9 @@ from datetime import datetime, timezone
 
 from app.application.content.services import ContentService
 from app.domain.content.entity import Content, ContentStatus, ContentType
-from app.domain.content.repository import ContentRepository
 from app.domain.user.entity import UserRole
-from app.domain.content.exceptions import ContentNotFoundError, InvalidContentTypeError
-
-
-class InMemoryContentRepository(ContentRepository):
-    """In-memory implementation for testing."""
-    
-    def __init__(self):
-        self._contents = {}
-    
-    async def create(self, content: Content) -> Content:
-        self._contents[str(content.id)] = content
-        return content
-    
-    async def update(self, content: Content) -> Content:
-        if str(content.id) not in self._contents:
-            raise ContentNotFoundError(f"Content {content.id} not found")
-        self._contents[str(content.id)] = content
-        return content
-    
-    async def get_by_id(self, content_id):
-        return self._contents.get(str(content_id))
-    
-    async def get_by_type_for_admin(self, content_type: ContentType):
-        return [c for c in self._contents.values() if c.content_type == content_type]
-    
-    async def get_published_by_type(self, content_type: ContentType):
-        return [
-            c for c in self._contents.values()
-            if c.content_type == content_type and c.status == ContentStatus.PUBLISHED
-        ]
+from app.domain.content.exceptions import InvalidContentTypeError
+from app.infrastructure.memory import InMemoryContentRepository
 
 
 @pytest.mark.asyncio
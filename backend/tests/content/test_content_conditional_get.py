@@ -0,0 +1,70 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.application.content.services import ContentService
+from app.core.dependencies import set_content_repository
+from app.domain.user.entity import UserRole
+from app.infrastructure.memory import InMemoryContentRepository
+
+
+async def _publish_blog(service: ContentService, title: str):
+    content = await service.create_content(
+        title=title,
+        body="Body",
+        content_type="BLOG",
+        metadata={},
+        seo_meta={},
+        user_role=UserRole.ADMIN,
+    )
+    return await service.publish_content(content.id, UserRole.ADMIN)
+
+
+@pytest.fixture
+def content_service():
+    repo = InMemoryContentRepository()
+    set_content_repository(repo)
+    yield ContentService(repo)
+    set_content_repository(None)
+
+
+@pytest.mark.asyncio
+async def test_content_list_answers_matching_etag_with_304(content_service):
+    """Test that the public list returns validators and honours If-None-Match."""
+    await _publish_blog(content_service, "First")
+    client = TestClient(app)
+    
+    first = client.get("/content?type=BLOG")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('"')
+    assert first.headers["Cache-Control"] == "public, no-cache"
+    assert "Last-Modified" in first.headers
+    
+    cached = client.get("/content?type=BLOG", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    
+    # A newly published item changes the tag
+    await _publish_blog(content_service, "Second")
+    changed = client.get("/content?type=BLOG", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_content_item_etag_changes_when_updated(content_service):
+    """Test that a single item's ETag follows its updated_at."""
+    content = await _publish_blog(content_service, "Post")
+    client = TestClient(app)
+    
+    first = client.get(f"/content/{content.id}")
+    etag = first.headers["ETag"]
+    assert client.get(f"/content/{content.id}", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get(f"/content/{content.id}", headers={"If-None-Match": '"other", ' + etag}).status_code == 304
+    
+    # Re-publishing bumps updated_at
+    await content_service.publish_content(content.id, UserRole.ADMIN)
+    assert client.get(f"/content/{content.id}", headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,107 @@
+import pytest
+from datetime import datetime, timezone
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.application.content.services import ContentService
+from app.core.dependencies import set_content_repository
+from app.domain.content.entity import ContentSummary
+from app.domain.user.entity import UserRole
+from app.infrastructure.content.mapper import ContentMapper
+from app.infrastructure.memory import InMemoryContentRepository
+
+LONG_BODY = "Lorem ipsum dolor sit amet. " * 50
+
+
+async def _create(service: ContentService, title: str, body: str, publish: bool = True):
+    content = await service.create_content(
+        title=title,
+        body=body,
+        content_type="BLOG",
+        metadata={"cover": f"{title}.jpg"},
+        seo_meta={"description": "SEO"},
+        user_role=UserRole.ADMIN,
+    )
+    if publish:
+        content = await service.publish_content(content.id, UserRole.ADMIN)
+    return content
+
+
+@pytest.mark.asyncio
+async def test_public_summaries_carry_excerpt_instead_of_body():
+    """Test that summaries of published content hold an excerpt and the body length."""
+    service = ContentService(InMemoryContentRepository())
+    await _create(service, "Long", LONG_BODY)
+    await _create(service, "Short", "Short body")
+    await _create(service, "Draft", "Draft body", publish=False)
+    
+    summaries = await service.find_content_public("BLOG", summary=True)
+    
+    assert [s.title for s in summaries] == ["Long", "Short"]
+    long, short = summaries
+    assert long.excerpt == LONG_BODY.strip()[:ContentSummary.EXCERPT_LENGTH]
+    assert long.body_length == len(LONG_BODY.strip())
+    assert long.truncated is True
+    assert long.metadata == {"cover": "Long.jpg"}
+    assert short.excerpt == "Short body"
+    assert short.truncated is False
+    
+    admin_summaries = await service.find_content_admin("BLOG", UserRole.ADMIN, summary=True)
+    assert len(admin_summaries) == 3
+    with pytest.raises(PermissionError):
+        await service.find_content_admin("BLOG", UserRole.USER, summary=True)
+
+
+def test_summary_document_maps_to_read_model():
+    """Test that a document projected by MongoDB maps to a ContentSummary."""
+    projection = ContentMapper.summary_projection()
+    assert "body" not in projection and "seo_meta" not in projection
+    
+    summary = ContentMapper.to_summary({
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "content_type": "COURSE",
+        "title": "Course",
+        "status": "PUBLISHED",
+        "metadata": {},
+        "excerpt": "Intro",
+        "body_length": 5000,
+    })
+    
+    assert summary.excerpt == "Intro"
+    assert summary.truncated is True
+
+
+def test_summary_reads_string_timestamps_of_older_documents():
+    """Test that summaries parse ISO string timestamps like full content does."""
+    summary = ContentMapper.to_summary({
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "content_type": "COURSE",
+        "title": "Course",
+        "status": "PUBLISHED",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+    })
+    
+    assert summary.created_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert summary.updated_at == datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_content_list_endpoint_summary_view():
+    """Test that GET /content?summary=true omits body and seo_meta."""
+    repo = InMemoryContentRepository()
+    set_content_repository(repo)
+    await _create(ContentService(repo), "Long", LONG_BODY)
+    client = TestClient(app)
+    
+    full = client.get("/content?type=BLOG")
+    summary = client.get("/content?type=BLOG&summary=true")
+    
+    assert full.status_code == 200 and summary.status_code == 200
+    assert "body" in full.json()[0]
+    item = summary.json()[0]
+    assert "body" not in item and "seo_meta" not in item
+    assert item["truncated"] is True
+    assert summary.headers["ETag"] != full.headers["ETag"]
+    
+    set_content_repository(None)
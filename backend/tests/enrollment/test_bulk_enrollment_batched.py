@@ -0,0 +1,173 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.application.enrollment.services import EnrollmentService
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.registration.repository import RegistrationRepository
+from app.domain.user.entity import UserRole
+from app.infrastructure.memory import InMemoryRegistrationRepository
+from app.infrastructure.registration.mapper import STATUS_CHANGE_ID, RegistrationMapper
+from app.infrastructure.registration.repository import MongoDBRegistrationRepository
+
+
+class CountingRegistrationRepository(InMemoryRegistrationRepository):
+    """In-memory registration repository that counts reads by ID and uses the default bulk update."""
+    
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+    
+    async def get_by_id(self, registration_id) -> ExamRegistration:
+        self.get_by_id_calls += 1
+        return await super().get_by_id(registration_id)
+    
+    async def bulk_update_status(self, registration_ids, new_status, expected_statuses=None):
+        return await RegistrationRepository.bulk_update_status(
+            self, registration_ids, new_status, expected_statuses
+        )
+
+
+class BatchingRegistrationRepository(CountingRegistrationRepository):
+    """In-memory registration repository that updates all registrations in one call."""
+    
+    def __init__(self):
+        super().__init__()
+        self.bulk_calls = 0
+    
+    async def bulk_update_status(self, registration_ids, new_status, expected_statuses=None):
+        self.bulk_calls += 1
+        return await InMemoryRegistrationRepository.bulk_update_status(
+            self, registration_ids, new_status, expected_statuses
+        )
+
+
+async def create_registrations(reg_repo, *statuses):
+    """Create one registration per status for the same exam."""
+    exam_id = uuid4()
+    registrations = []
+    for status in statuses:
+        registration = ExamRegistration(user_id=uuid4(), exam_id=exam_id, status=status)
+        await reg_repo.create(registration)
+        registrations.append(registration)
+    return registrations
+
+
+@pytest.mark.asyncio
+async def test_bulk_enrollment_uses_single_bulk_update():
+    """Test that bulk enrollment makes one bulk call instead of one read per ID."""
+    reg_repo = BatchingRegistrationRepository()
+    service = EnrollmentService(reg_repo)
+    paid, registered, enrolled = await create_registrations(
+        reg_repo,
+        RegistrationStatus.PAID,
+        RegistrationStatus.REGISTERED,
+        RegistrationStatus.ENROLLED,
+    )
+    fake_id = uuid4()
+    
+    result = await service.bulk_enroll_registrations(
+        [paid.id, fake_id, registered.id, enrolled.id], uuid4(), UserRole.ADMIN
+    )
+    
+    assert reg_repo.bulk_calls == 1
+    assert reg_repo.get_by_id_calls == 0
+    assert result.success == [paid.id, registered.id]
+    assert [item.registration_id for item in result.failed] == [fake_id, enrolled.id]
+    assert result.failed[0].reason == f"Registration not found: Registration {fake_id} not found"
+    assert result.failed[1].reason == f"Registration {enrolled.id} is already ENROLLED"
+    assert (await reg_repo.get_by_id(paid.id)).status == RegistrationStatus.ENROLLED
+    assert (await reg_repo.get_by_id(registered.id)).status == RegistrationStatus.ENROLLED
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("repo_class", [CountingRegistrationRepository, BatchingRegistrationRepository])
+async def test_bulk_enrollment_reports_repeated_id_as_already_enrolled(repo_class):
+    """Test that a repeated ID succeeds once, as when enrolling one at a time."""
+    reg_repo = repo_class()
+    service = EnrollmentService(reg_repo)
+    (paid,) = await create_registrations(reg_repo, RegistrationStatus.PAID)
+    
+    result = await service.bulk_enroll_registrations([paid.id, paid.id], uuid4(), UserRole.ADMIN)
+    
+    assert result.success == [paid.id]
+    assert len(result.failed) == 1
+    assert result.failed[0].registration_id == paid.id
+    assert "already ENROLLED" in result.failed[0].reason
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("repo_class", [CountingRegistrationRepository, BatchingRegistrationRepository])
+async def test_bulk_update_does_not_report_registrations_already_in_target_status(repo_class):
+    """Test that a registration already in the new status is not reported as updated by the call."""
+    reg_repo = repo_class()
+    paid, enrolled = await create_registrations(
+        reg_repo, RegistrationStatus.PAID, RegistrationStatus.ENROLLED
+    )
+    
+    found, updated = await reg_repo.bulk_update_status([paid.id, enrolled.id], RegistrationStatus.ENROLLED)
+    
+    assert updated == {paid.id}
+    assert found[enrolled.id].status == RegistrationStatus.ENROLLED
+
+
+def mongo_repository(documents_by_read, modified_count):
+    """MongoDB repository over a mocked collection returning each read's documents in turn."""
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(side_effect=documents_by_read)
+    collection = MagicMock()
+    collection.find.return_value = cursor
+    collection.bulk_write = AsyncMock(return_value=SimpleNamespace(modified_count=modified_count))
+    return MongoDBRegistrationRepository(SimpleNamespace(exam_registrations=collection)), collection
+
+
+def documents(*registrations, status=None):
+    """Documents of registrations, optionally all in status."""
+    return [
+        {**RegistrationMapper.to_document(registration), **({"status": status.value} if status else {})}
+        for registration in registrations
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mongodb_bulk_update_skips_registrations_already_in_target_status():
+    """Test that MongoDB sends no update for, and does not report, registrations already in the new status."""
+    paid = ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAID)
+    enrolled = ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.ENROLLED)
+    repository, collection = mongo_repository([documents(paid, enrolled)], modified_count=1)
+    
+    _, updated = await repository.bulk_update_status([paid.id, enrolled.id], RegistrationStatus.ENROLLED)
+    
+    assert updated == {paid.id}
+    (operations,), _ = collection.bulk_write.call_args
+    assert [operation._filter["status"] for operation in operations] == ["PAID"]
+
+
+@pytest.mark.asyncio
+async def test_mongodb_bulk_update_attributes_writes_when_others_race():
+    """Test that only this call's writes are reported, even when a concurrent request made the same change."""
+    mine = ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAID)
+    theirs = ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAID)
+    
+    repository, collection = mongo_repository([], modified_count=1)
+    
+    async def read(length):
+        if not collection.bulk_write.await_count:
+            return documents(mine, theirs)
+        # Only the update of mine applied; another request enrolled theirs in between
+        (operations,), _ = collection.bulk_write.call_args
+        stamp = operations[0]._doc["$set"]
+        return [
+            {**RegistrationMapper.to_document(mine), **stamp},
+            {**RegistrationMapper.to_document(theirs), "status": "ENROLLED", STATUS_CHANGE_ID: uuid4()},
+        ]
+    
+    collection.find.return_value.to_list.side_effect = read
+    
+    found, updated = await repository.bulk_update_status(
+        [mine.id, theirs.id], RegistrationStatus.ENROLLED, {RegistrationStatus.PAID}
+    )
+    
+    assert updated == {mine.id}
+    assert found[theirs.id].status == RegistrationStatus.ENROLLED
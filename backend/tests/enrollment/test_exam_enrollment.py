@@ -0,0 +1,105 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from uuid import uuid4
+
+from app.application.enrollment.services import EnrollmentService
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import UserRole
+from app.domain.exam.exceptions import ExamNotFoundError
+from app.infrastructure.memory import InMemoryExamRepository, InMemoryRegistrationRepository
+
+
+async def create_exam_with_registrations(exam_repo, reg_repo, *statuses):
+    """Create an exam with one registration per status."""
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    exam = Exam(
+        title="Test Exam",
+        start_date=start_date,
+        end_date=start_date + timedelta(hours=3),
+        status=ExamStatus.ACTIVE,
+    )
+    await exam_repo.create(exam)
+    
+    registrations = []
+    for status in statuses:
+        registration = ExamRegistration(user_id=uuid4(), exam_id=exam.id, status=status)
+        await reg_repo.create(registration)
+        registrations.append(registration)
+    return exam, registrations
+
+
+@pytest.mark.asyncio
+async def test_admin_can_enroll_all_registrations_of_exam():
+    """Test that enrolling by exam enrolls every enrollable registration of that exam only."""
+    exam_repo = InMemoryExamRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    service = EnrollmentService(reg_repo, exam_repo)
+    exam, registrations = await create_exam_with_registrations(
+        exam_repo,
+        reg_repo,
+        RegistrationStatus.PAID,
+        RegistrationStatus.REGISTERED,
+        RegistrationStatus.ENROLLED,
+    )
+    _, (other_exam_reg,) = await create_exam_with_registrations(
+        exam_repo, reg_repo, RegistrationStatus.PAID
+    )
+    
+    result = await service.enroll_exam_registrations(exam.id, uuid4(), UserRole.ADMIN)
+    
+    assert result.exam_id == exam.id
+    assert result.matched == 2
+    assert result.enrolled == 2
+    assert result.dry_run is False
+    for reg in registrations:
+        assert (await reg_repo.get_by_id(reg.id)).status == RegistrationStatus.ENROLLED
+    assert (await reg_repo.get_by_id(other_exam_reg.id)).status == RegistrationStatus.PAID
+
+
+@pytest.mark.asyncio
+async def test_enroll_by_exam_dry_run_only_counts():
+    """Test that a dry run reports the count without changing any registration."""
+    exam_repo = InMemoryExamRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    service = EnrollmentService(reg_repo, exam_repo)
+    exam, registrations = await create_exam_with_registrations(
+        exam_repo,
+        reg_repo,
+        RegistrationStatus.PAID,
+        RegistrationStatus.PAID,
+        RegistrationStatus.REGISTERED,
+    )
+    
+    result = await service.enroll_exam_registrations(
+        exam.id, uuid4(), UserRole.ADMIN, statuses={RegistrationStatus.PAID}, dry_run=True
+    )
+    
+    assert result.matched == 2
+    assert result.enrolled == 0
+    assert result.dry_run is True
+    assert [(await reg_repo.get_by_id(reg.id)).status for reg in registrations] == [
+        RegistrationStatus.PAID,
+        RegistrationStatus.PAID,
+        RegistrationStatus.REGISTERED,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_enroll_by_exam_rejects_invalid_requests():
+    """Test that enrolling by exam rejects non-admins, unknown exams and non-enrollable statuses."""
+    exam_repo = InMemoryExamRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    service = EnrollmentService(reg_repo, exam_repo)
+    exam, _ = await create_exam_with_registrations(exam_repo, reg_repo, RegistrationStatus.PAID)
+    
+    with pytest.raises(PermissionError):
+        await service.enroll_exam_registrations(exam.id, uuid4(), UserRole.USER)
+    
+    with pytest.raises(ExamNotFoundError):
+        await service.enroll_exam_registrations(uuid4(), uuid4(), UserRole.ADMIN)
+    
+    with pytest.raises(ValueError, match="ENROLLED"):
+        await service.enroll_exam_registrations(
+            exam.id, uuid4(), UserRole.ADMIN, statuses={RegistrationStatus.ENROLLED}
+        )
@@ -0,0 +1,101 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from app.core.cache import TTLCache
+from app.domain.exam.entity import Exam, ExamStatus
+from app.infrastructure.exam.cached_repository import CachingExamRepository
+from app.infrastructure.memory import InMemoryExamRepository
+
+
+class CountingExamRepository(InMemoryExamRepository):
+    """In-memory exam repository that counts reads."""
+    
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+    
+    async def get_by_id(self, exam_id):
+        self.reads += 1
+        return await super().get_by_id(exam_id)
+    
+    async def get_active(self, limit=None, after=None):
+        self.reads += 1
+        return await super().get_active(limit=limit, after=after)
+
+
+def _exam(status=ExamStatus.ACTIVE) -> Exam:
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    return Exam(
+        title="Cached Exam",
+        start_date=start_date,
+        end_date=start_date + timedelta(hours=3),
+        status=status,
+    )
+
+
+def test_invalidate_tag_evicts_all_tagged_entries():
+    """Test that invalidating a tag evicts every entry carrying it, and only those."""
+    cache = TTLCache(maxsize=10, ttl=30)
+    cache.set("a", 1, tags=["x"])
+    cache.set("b", 2, tags=["x", "y"])
+    cache.set("c", 3, tags=["y"])
+    
+    cache.invalidate_tag("x")
+    
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_set_skips_values_loaded_before_an_invalidation():
+    """Test that a value read before an invalidation is not cached."""
+    cache = TTLCache(maxsize=10, ttl=30)
+    generation = cache.generation
+    cache.invalidate_tag("x")
+    
+    cache.set("a", 1, tags=["x"], generation=generation)
+    
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_exam_reads_are_served_from_cache():
+    """Test that repeated exam and active-list reads hit storage once."""
+    inner = CountingExamRepository()
+    repo = CachingExamRepository(inner, TTLCache(maxsize=100, ttl=60))
+    exam = await repo.create(_exam())
+    
+    for _ in range(3):
+        assert (await repo.get_by_id(exam.id)).title == "Cached Exam"
+        assert [e.id for e in await repo.get_active()] == [exam.id]
+    
+    assert inner.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_exam_update_evicts_exam_and_active_list():
+    """Test that updating an exam evicts exam:{id} and exams:active."""
+    inner = CountingExamRepository()
+    repo = CachingExamRepository(inner, TTLCache(maxsize=100, ttl=60))
+    exam = await repo.create(_exam())
+    await repo.get_by_id(exam.id)
+    await repo.get_active()
+    
+    exam.status = ExamStatus.DRAFT
+    exam.title = "Renamed"
+    await repo.update(exam)
+    
+    assert (await repo.get_by_id(exam.id)).title == "Renamed"
+    assert await repo.get_active() == []
+
+
+@pytest.mark.asyncio
+async def test_cached_exams_are_isolated_copies():
+    """Test that mutating a returned exam does not change the cached one."""
+    repo = CachingExamRepository(InMemoryExamRepository(), TTLCache(maxsize=100, ttl=60))
+    exam = await repo.create(_exam())
+    
+    fetched = await repo.get_by_id(exam.id)
+    fetched.title = "Mutated"
+    
+    assert (await repo.get_by_id(exam.id)).title == "Cached Exam"
@@ -5,35 +5,8 @@ from datetime import datetime, timezone, timedelta
 from app.application.exam.dto import ExamCreateRequest
 from app.application.exam.services import ExamService
 from app.domain.exam.entity import Exam, ExamStatus
-from app.domain.exam.repository import ExamRepository
 from app.domain.user.entity import UserRole
-
-
-class InMemoryExamRepository(ExamRepository):
-    """In-memory implementation for testing."""
-    
-    def __init__(self):
-        self._exams = {}
-    
-    async def create(self, exam: Exam) -> Exam:
-        self._exams[str(exam.id)] = exam
-        return exam
-    
-    async def get_by_id(self, exam_id) -> Exam:
-        return self._exams.get(str(exam_id))
-    
-    async def get_all(self) -> list[Exam]:
-        return list(self._exams.values())
-    
-    async def get_active(self) -> list[Exam]:
-        return [exam for exam in self._exams.values() if exam.status == ExamStatus.ACTIVE]
-    
-    async def update(self, exam: Exam) -> Exam:
-        if str(exam.id) not in self._exams:
-            from app.domain.exam.exceptions import ExamNotFoundError
-            raise ExamNotFoundError(f"Exam with id {exam.id} not found")
-        self._exams[str(exam.id)] = exam
-        return exam
+from app.infrastructure.memory import InMemoryExamRepository
 
 
 @pytest.mark.asyncio
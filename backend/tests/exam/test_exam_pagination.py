@@ -0,0 +1,131 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.application.exam.services import ExamService
+from app.core.dependencies import set_exam_repository, set_user_repository
+from app.core.security import create_access_token
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.pagination import InvalidCursorError, PageCursor
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryExamRepository, InMemoryUserRepository
+
+
+async def _create_exams(repository: InMemoryExamRepository, count: int) -> list[Exam]:
+    base = datetime.now(timezone.utc)
+    start_date = base + timedelta(days=30)
+    exams = []
+    for i in range(count):
+        exam = Exam(
+            title=f"Exam {i}",
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=3),
+            status=ExamStatus.ACTIVE,
+            created_at=base + timedelta(seconds=i),
+        )
+        exams.append(await repository.create(exam))
+    return exams
+
+
+def test_cursor_round_trips_through_token():
+    """Test that a cursor survives encoding to an opaque token."""
+    cursor = PageCursor(created_at=datetime.now(timezone.utc), id=uuid4())
+    
+    assert PageCursor.decode(cursor.encode()) == cursor
+
+
+def test_invalid_cursor_token_is_rejected():
+    """Test that a malformed cursor token raises InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        PageCursor.decode("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_list_exams_walks_pages_in_creation_order():
+    """Test that following cursors visits every exam exactly once, in order."""
+    repository = InMemoryExamRepository()
+    service = ExamService(repository)
+    exams = await _create_exams(repository, 5)
+    
+    seen = []
+    after = None
+    while True:
+        page = await service.list_exams(UserRole.USER, limit=2, after=after)
+        seen.extend(exam.id for exam in page)
+        after = PageCursor.after_page(page, 2)
+        if after is None:
+            break
+    
+    assert seen == [exam.id for exam in exams]
+
+
+@pytest.mark.asyncio
+async def test_list_exams_without_limit_returns_everything():
+    """Test that omitting limit keeps returning the full listing."""
+    repository = InMemoryExamRepository()
+    service = ExamService(repository)
+    await _create_exams(repository, 3)
+    
+    exams = await service.list_exams(UserRole.ADMIN)
+    
+    assert len(exams) == 3
+
+
+@pytest.mark.asyncio
+async def test_exam_list_endpoint_returns_next_cursor_header():
+    """Test that /exams pages with limit/after and the X-Next-Cursor header."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = InMemoryUserRepository()
+    set_exam_repository(exam_repo)
+    set_user_repository(user_repo)
+    exams = await _create_exams(exam_repo, 3)
+    user = await user_repo.create(User(email="user@test.com", name="User"))
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.email, user.role)}"}
+    client = TestClient(app)
+    
+    first = client.get("/exams?limit=2", headers=headers)
+    assert first.status_code == 200
+    assert [e["id"] for e in first.json()] == [str(exams[0].id), str(exams[1].id)]
+    
+    second = client.get(
+        f"/exams?limit=2&after={first.headers['X-Next-Cursor']}", headers=headers
+    )
+    assert second.status_code == 200
+    assert [e["id"] for e in second.json()] == [str(exams[2].id)]
+    assert "X-Next-Cursor" not in second.headers
+    
+    invalid = client.get("/exams?limit=2&after=garbage", headers=headers)
+    assert invalid.status_code == 400
+    
+    set_exam_repository(None)
+
+
+@pytest.mark.asyncio
+async def test_exam_list_etag_depends_on_role_and_updates():
+    """Test that /exams answers a matching If-None-Match with 304, per role."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = InMemoryUserRepository()
+    set_exam_repository(exam_repo)
+    set_user_repository(user_repo)
+    exams = await _create_exams(exam_repo, 2)
+    user = await user_repo.create(User(email="user@test.com", name="User"))
+    admin = await user_repo.create(User(email="admin@test.com", name="Admin", role=UserRole.ADMIN))
+    user_headers = {"Authorization": f"Bearer {create_access_token(user.id, user.email, user.role)}"}
+    admin_headers = {"Authorization": f"Bearer {create_access_token(admin.id, admin.email, admin.role)}"}
+    client = TestClient(app)
+    
+    first = client.get("/exams", headers=user_headers)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert client.get("/exams", headers={**user_headers, "If-None-Match": etag}).status_code == 304
+    assert client.get("/exams", headers={**admin_headers, "If-None-Match": etag}).status_code == 200
+    
+    # Updating an exam bumps updated_at and so the tag
+    response = client.put(f"/exams/{exams[0].id}", json={"title": "Renamed"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert client.get("/exams", headers={**user_headers, "If-None-Match": etag}).status_code == 200
+    
+    set_exam_repository(None)
@@ -0,0 +1,128 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.main import app
+from app.api.auth import registration_list_serializer
+from app.api.content import content_list_serializer, summary_list_serializer
+from app.api.exams import exam_list_serializer
+from app.application.content.dto import ContentResponse, ContentSummaryResponse
+from app.application.content.services import ContentService
+from app.application.exam.dto import ExamResponse
+from app.application.exam.services import ExamService
+from app.application.registration.dto import RegistrationResponse
+from app.application.registration.services import RegistrationService
+from app.core.dependencies import set_exam_repository, set_user_repository
+from app.core.security import create_access_token
+from app.domain.content.entity import Content, ContentStatus, ContentSummary, ContentType
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryExamRepository, InMemoryUserRepository
+
+
+def _dto_json(model, dtos) -> bytes:
+    return TypeAdapter(List[model]).dump_json(dtos)
+
+
+def test_exam_list_matches_dto_serialization():
+    """Test that exams serialize to the same bytes as their DTOs."""
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    exams = [
+        Exam(
+            title="Ünïcode exam",
+            description=None,
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=3),
+            fee=Decimal("500.00"),
+            status=ExamStatus.ACTIVE,
+        ),
+        Exam(
+            title="Draft exam",
+            description="Not yet open",
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=1),
+        ),
+    ]
+    
+    expected = _dto_json(ExamResponse, [ExamService.to_dto(exam) for exam in exams])
+    
+    assert exam_list_serializer.dump_json(exams) == expected
+
+
+def test_content_lists_match_dto_serialization():
+    """Test that content and content summaries serialize to the same bytes as their DTOs."""
+    content_service = ContentService(None)
+    contents = [
+        Content(
+            content_type=ContentType.BLOG,
+            title="Post",
+            body="x" * 500,
+            metadata={"tags": ["exam", "tips"], "views": 3},
+            status=ContentStatus.PUBLISHED,
+            seo_meta={"description": "Tips"},
+        ),
+    ]
+    summaries = [ContentSummary.from_content(content) for content in contents]
+    
+    assert content_list_serializer.dump_json(contents) == _dto_json(
+        ContentResponse, [content_service.to_dto(content) for content in contents]
+    )
+    assert summary_list_serializer.dump_json(summaries) == _dto_json(
+        ContentSummaryResponse, [ContentSummaryResponse.model_validate(summary, from_attributes=True) for summary in summaries]
+    )
+
+
+def test_registration_list_matches_dto_serialization():
+    """Test that registrations serialize to the same bytes as their DTOs."""
+    registrations = [
+        ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=status)
+        for status in RegistrationStatus
+    ]
+    
+    expected = _dto_json(
+        RegistrationResponse, [RegistrationService.to_dto(reg) for reg in registrations]
+    )
+    
+    assert registration_list_serializer.dump_json(registrations) == expected
+
+
+def test_empty_list_serializes_to_empty_array():
+    """Test that an empty page is an empty JSON array."""
+    assert exam_list_serializer.dump_json([]) == b"[]"
+
+
+@pytest.mark.asyncio
+async def test_exam_list_endpoint_keeps_headers_on_fast_path():
+    """Test that the pre-serialized /exams response keeps cursor and validator headers."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = InMemoryUserRepository()
+    set_exam_repository(exam_repo)
+    set_user_repository(user_repo)
+    
+    user = await user_repo.create(User(email="user@test.com", name="User"))
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    for i in range(3):
+        await exam_repo.create(Exam(
+            title=f"Exam {i}",
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=3),
+            status=ExamStatus.ACTIVE,
+        ))
+    
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.email, user.role)}"}
+    response = client.get("/exams?limit=2", headers=headers)
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert len(response.json()) == 2
+    assert "X-Next-Cursor" in response.headers
+    assert "ETag" in response.headers
+    assert "Authorization" in response.headers["Vary"]
+    assert int(response.headers["content-length"]) == len(response.content)
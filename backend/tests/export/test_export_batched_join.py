@@ -0,0 +1,99 @@
+import pytest
+import csv
+import io
+from datetime import datetime, timezone, timedelta
+from uuid import uuid4
+
+from app.application.export.service import ExportService
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import ExamRegistration
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryExamRepository, InMemoryRegistrationRepository, InMemoryUserRepository
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    """In-memory user repository that records how it is queried."""
+    
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+        self.get_by_ids_calls = 0
+    
+    async def get_by_id(self, user_id) -> User:
+        self.get_by_id_calls += 1
+        return await super().get_by_id(user_id)
+    
+    async def get_by_ids(self, user_ids) -> dict:
+        self.get_by_ids_calls += 1
+        return await super().get_by_ids(user_ids)
+
+
+async def _create_exam(exam_repo: InMemoryExamRepository) -> Exam:
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    end_date = start_date + timedelta(hours=3)
+    exam = Exam(
+        title="Test Exam",
+        start_date=start_date,
+        end_date=end_date,
+        status=ExamStatus.ACTIVE,
+    )
+    return await exam_repo.create(exam)
+
+
+@pytest.mark.asyncio
+async def test_export_joins_users_in_batches():
+    """Test that export fetches users with one get_by_ids call per batch."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = CountingUserRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    service = ExportService(reg_repo, exam_repo, user_repo)
+    service.USER_BATCH_SIZE = 2
+    
+    exam = await _create_exam(exam_repo)
+    
+    for i in range(5):
+        user = User(email=f"user{i}@test.com", name=f"User {i}", mobile=f"123456789{i}")
+        await user_repo.create(user)
+        await reg_repo.create(ExamRegistration(user_id=user.id, exam_id=exam.id))
+    
+    csv_content = await service.export_exam_registrations_to_csv(exam.id)
+    rows = list(csv.DictReader(io.StringIO(csv_content)))
+    
+    assert len(rows) == 5
+    assert user_repo.get_by_ids_calls == 3
+    assert user_repo.get_by_id_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_export_skips_registrations_with_missing_user():
+    """Test that registrations whose user no longer exists are skipped."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = CountingUserRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    service = ExportService(reg_repo, exam_repo, user_repo)
+    
+    exam = await _create_exam(exam_repo)
+    
+    user = User(email="user1@test.com", name="User One", mobile="1234567890")
+    await user_repo.create(user)
+    kept = ExamRegistration(user_id=user.id, exam_id=exam.id)
+    orphan = ExamRegistration(user_id=uuid4(), exam_id=exam.id)
+    await reg_repo.create(kept)
+    await reg_repo.create(orphan)
+    
+    csv_content = await service.export_exam_registrations_to_csv(exam.id)
+    rows = list(csv.DictReader(io.StringIO(csv_content)))
+    
+    assert [row["registration_id"] for row in rows] == [str(kept.id)]
+
+
+@pytest.mark.asyncio
+async def test_default_get_by_ids_omits_unknown_ids():
+    """Test that the repository fallback get_by_ids returns only existing users."""
+    user_repo = InMemoryUserRepository()
+    user = User(email="user1@test.com", name="User One")
+    await user_repo.create(user)
+    
+    users = await user_repo.get_by_ids([user.id, uuid4(), user.id])
+    
+    assert users == {user.id: user}
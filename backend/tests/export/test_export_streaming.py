@@ -0,0 +1,157 @@
+import pytest
+import csv
+import io
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.dependencies import set_exam_repository, set_registration_repository, set_user_repository
+from app.core.security import create_access_token
+
+from app.application.export.service import ExportService
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.memory import InMemoryExamRepository, InMemoryRegistrationRepository, InMemoryUserRepository
+from app.infrastructure.pagination import KEYSET_SORT, keyset_filter
+from app.infrastructure.registration.mapper import RegistrationMapper
+from app.infrastructure.registration.repository import MongoDBRegistrationRepository
+from app.domain.pagination import PageCursor
+
+
+@pytest.fixture
+def repos():
+    """Create in-memory repositories wired into the app."""
+    exam_repo = InMemoryExamRepository()
+    user_repo = InMemoryUserRepository()
+    reg_repo = InMemoryRegistrationRepository()
+    set_exam_repository(exam_repo)
+    set_user_repository(user_repo)
+    set_registration_repository(reg_repo)
+    yield exam_repo, user_repo, reg_repo
+    set_exam_repository(None)
+    set_registration_repository(None)
+
+
+async def _seed(exam_repo, user_repo, reg_repo, count: int) -> Exam:
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    end_date = start_date + timedelta(hours=3)
+    exam = Exam(
+        title="Test Exam",
+        start_date=start_date,
+        end_date=end_date,
+        status=ExamStatus.ACTIVE,
+    )
+    await exam_repo.create(exam)
+    
+    for i in range(count):
+        user = User(email=f"user{i}@test.com", name=f"User {i}", mobile=f"12345678{i:02d}")
+        await user_repo.create(user)
+        await reg_repo.create(
+            ExamRegistration(user_id=user.id, exam_id=exam.id, status=RegistrationStatus.PAID)
+        )
+    
+    return exam
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_header_then_one_chunk_per_page(repos):
+    """Test that the CSV stream emits the header first and then one chunk per page."""
+    exam_repo, user_repo, reg_repo = repos
+    service = ExportService(reg_repo, exam_repo, user_repo)
+    service.USER_BATCH_SIZE = 2
+    exam = await _seed(exam_repo, user_repo, reg_repo, 5)
+    
+    chunks = [chunk async for chunk in await service.stream_exam_registrations_csv(exam.id)]
+    
+    assert len(chunks) == 4
+    assert chunks[0].startswith("registration_id,user_id,user_name")
+    assert len(list(csv.DictReader(io.StringIO("".join(chunks))))) == 5
+
+
+@pytest.mark.asyncio
+async def test_stream_matches_buffered_export(repos):
+    """Test that streamed and buffered exports produce identical CSV."""
+    exam_repo, user_repo, reg_repo = repos
+    service = ExportService(reg_repo, exam_repo, user_repo)
+    service.USER_BATCH_SIZE = 3
+    exam = await _seed(exam_repo, user_repo, reg_repo, 7)
+    
+    streamed = "".join([chunk async for chunk in await service.stream_exam_registrations_csv(exam.id)])
+    buffered = await service.export_exam_registrations_to_csv(exam.id)
+    
+    assert streamed == buffered
+
+
+@pytest.mark.asyncio
+async def test_stream_for_nonexistent_exam_fails_before_output(repos):
+    """Test that a missing exam is reported before the stream is created."""
+    from app.domain.exam.exceptions import ExamNotFoundError
+    
+    exam_repo, user_repo, reg_repo = repos
+    service = ExportService(reg_repo, exam_repo, user_repo)
+    
+    with pytest.raises(ExamNotFoundError):
+        await service.stream_exam_registrations_csv(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_streaming_endpoint_returns_csv(repos):
+    """Test that the export endpoint streams CSV when stream=true."""
+    exam_repo, user_repo, reg_repo = repos
+    exam = await _seed(exam_repo, user_repo, reg_repo, 3)
+    admin = User(email="admin@test.com", name="Admin", role=UserRole.ADMIN)
+    await user_repo.create(admin)
+    token = create_access_token(admin.id, admin.email, admin.role)
+    client = TestClient(app)
+    
+    response = client.get(
+        f"/admin/exams/{exam.id}/registrations/export?stream=true",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+    assert len(list(csv.DictReader(io.StringIO(response.text)))) == 3
+    
+    missing = client.get(
+        f"/admin/exams/{uuid4()}/registrations/export?stream=true",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_mongodb_pages_follow_listing_order():
+    """Test that MongoDB export pages are read in (created_at, id) order, like get_by_exam_id."""
+    exam_id = uuid4()
+    registrations = [ExamRegistration(user_id=uuid4(), exam_id=exam_id) for _ in range(3)]
+    pages = [
+        [RegistrationMapper.to_document(registration) for registration in registrations[:2]],
+        [RegistrationMapper.to_document(registrations[2])],
+    ]
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(side_effect=pages)
+    collection = MagicMock()
+    collection.find.return_value = cursor
+    repository = MongoDBRegistrationRepository(SimpleNamespace(exam_registrations=collection))
+    
+    batches = [batch async for batch in repository.iter_by_exam_id(exam_id, batch_size=2)]
+    
+    assert [[registration.id for registration in batch] for batch in batches] == [
+        [registration.id for registration in registrations[:2]],
+        [registrations[2].id],
+    ]
+    cursor.sort.assert_called_with(KEYSET_SORT)
+    (first_query, _), (second_query, _) = [call.args for call in collection.find.call_args_list]
+    assert first_query == {"exam_id": exam_id}
+    assert second_query == keyset_filter(
+        {"exam_id": exam_id}, PageCursor(registrations[1].created_at, registrations[1].id)
+    )
@@ -0,0 +1,94 @@
+import asyncio
+import itertools
+import json
+import logging
+import pytest
+from datetime import timedelta
+from uuid import uuid4
+from pymongo import monitoring
+
+from app.core.metrics import MetricsRegistry
+from app.infrastructure.command_monitoring import UNATTRIBUTED, CommandMetricsListener, query_shape
+from app.infrastructure.instrumentation import InstrumentedRepository
+
+ADDRESS = ("localhost", 27017)
+_request_ids = itertools.count(1)
+
+
+def run_command(listener, command: dict, duration_ms: float, failed: bool = False) -> None:
+    """Feed the listener the events pymongo emits for one command."""
+    request_id = next(_request_ids)
+    listener.started(monitoring.CommandStartedEvent(command, "lifeschool_db", request_id, ADDRESS, None))
+    command_name = next(iter(command))
+    if failed:
+        listener.failed(monitoring.CommandFailedEvent(
+            timedelta(milliseconds=duration_ms), {"ok": 0}, command_name, request_id, ADDRESS, None,
+            database_name="lifeschool_db",
+        ))
+    else:
+        listener.succeeded(monitoring.CommandSucceededEvent(
+            timedelta(milliseconds=duration_ms), {"ok": 1}, command_name, request_id, ADDRESS, None,
+            database_name="lifeschool_db",
+        ))
+
+
+class FakeRegistrationRepository:
+    """Repository whose 'database' runs commands on a worker thread, as Motor does."""
+    
+    def __init__(self, listener):
+        self.listener = listener
+    
+    async def get_by_exam_id(self, exam_id):
+        command = {"find": "exam_registrations", "filter": {"exam_id": exam_id, "status": {"$in": ["PAID"]}}}
+        await asyncio.to_thread(run_command, self.listener, command, 250)
+        return []
+
+
+def test_query_shape_keeps_fields_and_operators_only():
+    """Test that filter shapes drop every value but keep structure."""
+    user_id = uuid4()
+    shape = query_shape({
+        "$or": [{"_id": user_id}, {"id": str(user_id)}],
+        "status": {"$in": ["PAID", "ENROLLED"]},
+        "email": "someone@test.com",
+    })
+    
+    assert shape == {"$or": [{"_id": "?"}, {"id": "?"}], "status": {"$in": "?"}, "email": "?"}
+
+
+@pytest.mark.asyncio
+async def test_commands_are_attributed_to_the_repository_operation(caplog):
+    """Test that commands run on a worker thread are timed under the operation that issued them."""
+    registry = MetricsRegistry()
+    listener = CommandMetricsListener(registry=registry, slow_threshold_ms=100)
+    repository = InstrumentedRepository(FakeRegistrationRepository(listener), "registrations", registry=registry)
+    
+    with caplog.at_level(logging.WARNING, logger="app.mongodb.slow_commands"):
+        await repository.get_by_exam_id(uuid4())
+    
+    labels = ("exam_registrations", "find", "registrations.get_by_exam_id")
+    assert registry.get("mongodb_command_duration_seconds").count(labels) == 1
+    
+    [record] = caplog.records
+    logged = json.loads(record.getMessage())
+    assert logged["operation"] == "registrations.get_by_exam_id"
+    assert logged["collection"] == "exam_registrations"
+    assert logged["duration_ms"] == 250
+    assert logged["shape"] == {"exam_id": "?", "status": {"$in": "?"}}
+
+
+def test_fast_and_housekeeping_commands_are_not_logged(caplog):
+    """Test that only commands over the threshold are logged and handshakes are ignored."""
+    registry = MetricsRegistry()
+    listener = CommandMetricsListener(registry=registry, slow_threshold_ms=100)
+    
+    with caplog.at_level(logging.WARNING, logger="app.mongodb.slow_commands"):
+        run_command(listener, {"find": "users", "filter": {"email": "a@test.com"}}, 5)
+        run_command(listener, {"hello": 1}, 500)
+        run_command(listener, {"update": "exams", "updates": [{"q": {"_id": 1}}]}, 5, failed=True)
+    
+    assert caplog.records == []
+    durations = registry.get("mongodb_command_duration_seconds")
+    assert durations.count(("users", "find", UNATTRIBUTED)) == 1
+    assert durations.count(("admin", "hello", UNATTRIBUTED)) == 0
+    assert registry.get("mongodb_command_failures_total").get(("exams", "update", UNATTRIBUTED)) == 1
@@ -0,0 +1,134 @@
+import pytest
+from uuid import uuid4
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+from app.core.security import create_access_token
+from app.core.metrics import MetricsRegistry
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.instrumentation import InstrumentedRepository
+from app.infrastructure.memory import InMemoryUserRepository
+from app.main import app
+
+
+def _client(registry: MetricsRegistry) -> TestClient:
+    """Client for a small app instrumented with its own registry."""
+    test_app = FastAPI()
+    test_app.add_middleware(MetricsMiddleware, registry=registry)
+    
+    @test_app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        if item_id == "missing":
+            raise HTTPException(status_code=404, detail="Not found")
+        return {"id": item_id}
+    
+    return TestClient(test_app)
+
+
+def test_requests_are_labelled_by_route_template():
+    """Test that requests are counted per route template and status, not per raw path."""
+    registry = MetricsRegistry()
+    client = _client(registry)
+    
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/items/missing")
+    client.get("/no/such/path")
+    
+    requests = registry.get("http_requests_total")
+    assert requests.get(("GET", "/items/{item_id}", "200")) == 2
+    assert requests.get(("GET", "/items/{item_id}", "404")) == 1
+    assert requests.get(("GET", UNMATCHED_ROUTE, "404")) == 1
+    assert registry.get("http_request_duration_seconds").count(("GET", "/items/{item_id}")) == 3
+    assert registry.get("http_requests_in_progress").get(("GET",)) == 0
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test that histogram buckets are rendered cumulatively with count and sum."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, ("/a",))
+    
+    lines = registry.render().splitlines()
+    
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{route="/a"} 4' in lines
+    assert 'latency_seconds_sum{route="/a"} 3.65' in lines
+
+
+def test_samples_are_a_snapshot_of_the_series():
+    """Test that series added while samples are being rendered do not break the iteration."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1,))
+    failures = registry.counter("failures_total", "Failures.", ("route",))
+    latency.observe(0.05, ("/a",))
+    failures.inc(("/a",))
+    
+    histogram_samples, counter_samples = latency.samples(), failures.samples()
+    next(histogram_samples), next(counter_samples)
+    # What a command listener thread does while /metrics is rendered
+    latency.observe(0.05, ("/b",))
+    failures.inc(("/b",))
+    
+    assert len(list(histogram_samples)) == 3
+    assert list(counter_samples) == []
+    assert 'failures_total{route="/b"} 1' in registry.render().splitlines()
+
+
+def test_registry_rejects_a_name_reused_with_another_type():
+    """Test that a metric name cannot be registered as two different types."""
+    registry = MetricsRegistry()
+    assert registry.counter("events_total", "Events.") is registry.counter("events_total", "Events.")
+    
+    with pytest.raises(ValueError):
+        registry.gauge("events_total", "Events.")
+
+
+@pytest.mark.asyncio
+async def test_instrumented_repository_counts_operations_and_errors():
+    """Test that repository operations are counted by outcome and results pass through."""
+    registry = MetricsRegistry()
+    repository = InstrumentedRepository(InMemoryUserRepository(), "users", registry=registry)
+    user = User(email="metrics@test.com", name="Metrics", role=UserRole.USER)
+    
+    await repository.create(user)
+    assert (await repository.get_by_id(user.id)).email == "metrics@test.com"
+    assert await repository.get_by_id(uuid4()) is None
+    with pytest.raises(Exception):
+        await repository.create(user)
+    
+    operations = registry.get("repository_operations_total")
+    assert operations.get(("users", "get_by_id", "ok")) == 2
+    assert operations.get(("users", "create", "ok")) == 1
+    assert operations.get(("users", "create", "error")) == 1
+
+
+def _bearer(role: UserRole) -> dict:
+    """Authorization header for a token with role."""
+    return {"Authorization": f"Bearer {create_access_token(uuid4(), 'ops@example.com', role)}"}
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    """Test that /metrics serves the application registry in the text format."""
+    client = TestClient(app)
+    client.get("/health")
+    
+    response = client.get("/metrics", headers=_bearer(UserRole.ADMIN))
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in response.text
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+
+
+def test_metrics_endpoint_requires_an_admin():
+    """Test that /metrics is refused to anonymous callers and non-admin users."""
+    client = TestClient(app)
+    
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers=_bearer(UserRole.USER)).status_code == 403
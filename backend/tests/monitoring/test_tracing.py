@@ -0,0 +1,129 @@
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.tracing import REQUEST_ID_HEADER, RequestContextMiddleware
+from app.core.tracing import JsonLinesFileExporter, SpanExporter, Tracer, span, trace_methods
+from app.infrastructure.instrumentation import InstrumentedRepository
+from app.infrastructure.memory import InMemoryExamRepository
+
+
+class CollectingExporter(SpanExporter):
+    """Exporter keeping finished traces in memory."""
+    
+    def __init__(self):
+        self.traces = []
+    
+    def export(self, trace):
+        self.traces.append(trace)
+
+
+@trace_methods
+class LookupService:
+    """Service calling a repository, as the application services do."""
+    
+    def __init__(self, repository):
+        self.repository = repository
+    
+    async def find_exam(self, exam_id: str):
+        with span("auth.verify_token"):
+            pass
+        return await self.repository.get_by_id(exam_id)
+
+
+def _client(tracer: Tracer) -> TestClient:
+    """Client for a small app with the request context middleware."""
+    test_app = FastAPI()
+    test_app.add_middleware(RequestContextMiddleware, tracer=tracer)
+    service = LookupService(InstrumentedRepository(InMemoryExamRepository(), "exams"))
+    
+    @test_app.get("/exams/{exam_id}")
+    async def get_exam(exam_id: str):
+        await service.find_exam(exam_id)
+        return {"id": exam_id}
+    
+    return TestClient(test_app)
+
+
+def test_request_id_is_generated_or_propagated():
+    """Test that responses carry the caller's request id, or a generated one."""
+    client = _client(Tracer())
+    
+    generated = client.get("/exams/1").headers[REQUEST_ID_HEADER]
+    propagated = client.get("/exams/1", headers={REQUEST_ID_HEADER: "lb-1234"}).headers[REQUEST_ID_HEADER]
+    replaced = client.get("/exams/1", headers={REQUEST_ID_HEADER: "bad id\x7f"}).headers[REQUEST_ID_HEADER]
+    
+    assert len(generated) == 32
+    assert propagated == "lb-1234"
+    assert replaced != "bad id\x7f" and len(replaced) == 32
+
+
+def test_sampled_request_records_nested_spans():
+    """Test that service, dependency and repository spans nest under the request span."""
+    exporter = CollectingExporter()
+    client = _client(Tracer(exporter, sample_rate=1.0))
+    
+    response = client.get("/exams/1")
+    
+    [trace] = exporter.traces
+    spans = {s.name: s for s in trace.spans}
+    root = spans["GET /exams/{exam_id}"]
+    assert trace.trace_id == response.headers[REQUEST_ID_HEADER]
+    assert root.parent_span_id is None
+    assert root.attributes["http.response.status_code"] == 200
+    assert spans["LookupService.find_exam"].parent_span_id == root.span_id
+    assert spans["auth.verify_token"].parent_span_id == spans["LookupService.find_exam"].span_id
+    assert spans["exams.get_by_id"].parent_span_id == spans["LookupService.find_exam"].span_id
+
+
+def test_client_request_id_is_not_used_as_trace_id():
+    """Test that a client-supplied request id, even one shaped like a trace id, is only a span attribute."""
+    exporter = CollectingExporter()
+    client = _client(Tracer(exporter, sample_rate=1.0))
+    client_id = "0123456789abcdef0123456789abcdef"
+    
+    client.get("/exams/1", headers={REQUEST_ID_HEADER: client_id})
+    client.get("/exams/1", headers={REQUEST_ID_HEADER: client_id})
+    
+    first, second = exporter.traces
+    assert client_id not in (first.trace_id, second.trace_id)
+    assert first.trace_id != second.trace_id
+    [root] = [s for s in first.spans if s.parent_span_id is None]
+    assert root.attributes["request.id"] == client_id
+
+
+def test_unsampled_requests_record_nothing():
+    """Test that requests outside the sample are not traced."""
+    exporter = CollectingExporter()
+    client = _client(Tracer(exporter, sample_rate=0.5, sampler=lambda: 0.9))
+    
+    client.get("/exams/1")
+    
+    assert exporter.traces == []
+
+
+def test_file_exporter_writes_otlp_json_lines(tmp_path):
+    """Test that every trace becomes one OTLP/JSON line in the trace file."""
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonLinesFileExporter(str(path))
+    client = _client(Tracer(exporter, sample_rate=1.0))
+    
+    client.get("/exams/1")
+    client.get("/exams/2")
+    exporter.shutdown()
+    
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    request = json.loads(lines[0])
+    [resource_spans] = request["resourceSpans"]
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    assert {s["name"] for s in spans} >= {"GET /exams/{exam_id}", "exams.get_by_id"}
+    assert all(len(s["traceId"]) == 32 and len(s["spanId"]) == 16 for s in spans)
+    assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
+
+
+def test_sample_rate_is_validated():
+    """Test that sample rates outside [0, 1] are rejected."""
+    with pytest.raises(ValueError):
+        Tracer(CollectingExporter(), sample_rate=1.5)
@@ -0,0 +1,217 @@
+import asyncio
+import pytest
+from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
+from pymongo.errors import DuplicateKeyError
+from fastapi.testclient import TestClient
+from uuid import uuid4
+
+from app.main import app
+from app.api.idempotency import IDEMPOTENCY_KEY_HEADER, IDEMPOTENT_REPLAYED_HEADER, Idempotency
+from app.api.payments import payment_id_for
+from app.core.cache import TTLCache
+from app.core.dependencies import (
+    set_exam_repository,
+    set_idempotency_repository,
+    set_registration_repository,
+    set_user_repository,
+)
+from app.core.security import create_access_token
+from app.domain.exam.entity import Exam, ExamStatus
+from app.domain.idempotency.entity import IdempotencyRecord
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User
+from app.infrastructure.idempotency.cached_repository import CachingIdempotencyRepository
+from app.infrastructure.idempotency.repository import MongoDBIdempotencyRepository
+from app.infrastructure.memory import (
+    InMemoryExamRepository,
+    InMemoryIdempotencyRepository,
+    InMemoryRegistrationRepository,
+    InMemoryUserRepository,
+)
+
+
+class CountingRegistrationRepository(InMemoryRegistrationRepository):
+    """In-memory registration repository counting applied transitions."""
+    
+    def __init__(self):
+        super().__init__()
+        self.transitions = 0
+    
+    async def apply_transition(self, registration_id, transition, user_id=None):
+        self.transitions += 1
+        return await super().apply_transition(registration_id, transition, user_id)
+
+
+class UpsertingCollection:
+    """Collection of documents keyed by _id with MongoDB's upsert semantics for the filters of claims."""
+    
+    def __init__(self):
+        self.documents = {}
+    
+    def _matches(self, document, filter):
+        if document is None:
+            return False
+        expires_at = filter.get("expires_at", {})
+        if "$lte" in expires_at and not document["expires_at"] <= expires_at["$lte"]:
+            return False
+        return not ("$gt" in expires_at and not document["expires_at"] > expires_at["$gt"])
+    
+    async def find_one_and_replace(self, filter, replacement, upsert, return_document):
+        if filter["_id"] in self.documents and not self._matches(self.documents[filter["_id"]], filter):
+            # The upsert inserts, colliding with the unmatched document
+            raise DuplicateKeyError("E11000 duplicate key error")
+        self.documents[filter["_id"]] = dict(replacement)
+        return dict(replacement)
+    
+    async def find_one(self, filter):
+        document = self.documents.get(filter["_id"])
+        return dict(document) if self._matches(document, filter) else None
+
+
+async def setup_registration(status=RegistrationStatus.REGISTERED):
+    """Wire in-memory repositories and return (registration repository, idempotency repository, registration, headers)."""
+    user_repo = InMemoryUserRepository()
+    exam_repo = InMemoryExamRepository()
+    reg_repo = CountingRegistrationRepository()
+    idempotency_repo = InMemoryIdempotencyRepository()
+    set_user_repository(user_repo)
+    set_exam_repository(exam_repo)
+    set_registration_repository(reg_repo)
+    set_idempotency_repository(idempotency_repo)
+    
+    user = await user_repo.create(User(email="test@example.com", name="Test User", mobile="1234567890"))
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    exam = await exam_repo.create(Exam(
+        title="Test Exam",
+        start_date=start_date,
+        end_date=start_date + timedelta(hours=3),
+        status=ExamStatus.ACTIVE,
+    ))
+    registration = await reg_repo.create(ExamRegistration(user_id=user.id, exam_id=exam.id, status=status))
+    headers = {"Authorization": f"Bearer {create_access_token(user.id, user.email, user.role)}"}
+    return reg_repo, idempotency_repo, registration, headers
+
+
+@pytest.mark.asyncio
+async def test_retry_with_same_key_replays_the_first_response():
+    """Test that a retried payment gets the first response without running again."""
+    reg_repo, _, registration, headers = await setup_registration()
+    headers[IDEMPOTENCY_KEY_HEADER] = "pay-1"
+    client = TestClient(app)
+    
+    first = client.post(f"/payments/registrations/{registration.id}/pay", headers=headers)
+    retry = client.post(f"/payments/registrations/{registration.id}/pay", headers=headers)
+    
+    assert first.status_code == retry.status_code == 200
+    assert retry.content == first.content
+    assert retry.headers[IDEMPOTENT_REPLAYED_HEADER] == "true"
+    assert IDEMPOTENT_REPLAYED_HEADER not in first.headers
+    assert first.json()["payment_id"] == str(payment_id_for(registration.id))
+    assert reg_repo.transitions == 1
+
+
+@pytest.mark.asyncio
+async def test_payment_id_is_stable_without_keys():
+    """Test that initiation and confirmation report the same payment id."""
+    _, _, registration, headers = await setup_registration()
+    client = TestClient(app)
+    
+    initiated = client.post(f"/payments/registrations/{registration.id}/pay", headers=headers)
+    confirmed = client.post(f"/payments/{registration.id}/confirm", headers=headers)
+    
+    assert initiated.json()["payment_id"] == confirmed.json()["payment_id"]
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_its_key():
+    """Test that an error response is not stored, so the key can be retried."""
+    reg_repo, _, registration, headers = await setup_registration(RegistrationStatus.PAYMENT_PENDING)
+    headers[IDEMPOTENCY_KEY_HEADER] = "pay-1"
+    client = TestClient(app)
+    
+    assert client.post(f"/payments/registrations/{registration.id}/pay", headers=headers).status_code == 400
+    
+    await reg_repo.update_status(registration.id, RegistrationStatus.REGISTERED)
+    retry = client.post(f"/payments/registrations/{registration.id}/pay", headers=headers)
+    assert retry.status_code == 200
+    assert IDEMPOTENT_REPLAYED_HEADER not in retry.headers
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_releases_its_key():
+    """Test that a request cancelled mid-run (client disconnect) frees its key for the retry."""
+    _, idempotency_repo, registration, _ = await setup_registration()
+    path = f"/payments/registrations/{registration.id}/pay"
+    idempotency = Idempotency(SimpleNamespace(method="POST", url=SimpleNamespace(path=path)), "pay-1")
+    
+    async def cancelled():
+        raise asyncio.CancelledError()
+    
+    with pytest.raises(asyncio.CancelledError):
+        await idempotency.run(registration.user_id, cancelled)
+    
+    record = IdempotencyRecord(registration.user_id, "pay-1", idempotency.request)
+    assert (await idempotency_repo.claim(record)).claim_id == record.claim_id
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_another_request_or_in_flight_is_rejected():
+    """Test that a key bound to another request gets 422 and one still running gets 409."""
+    _, idempotency_repo, registration, headers = await setup_registration()
+    client = TestClient(app)
+    
+    headers[IDEMPOTENCY_KEY_HEADER] = "pay-1"
+    assert client.post(f"/payments/registrations/{registration.id}/pay", headers=headers).status_code == 200
+    assert client.post(f"/payments/{registration.id}/confirm", headers=headers).status_code == 422
+    
+    headers[IDEMPOTENCY_KEY_HEADER] = "confirm-1"
+    await idempotency_repo.claim(IdempotencyRecord(
+        registration.user_id, "confirm-1", f"POST /payments/{registration.id}/confirm"
+    ))
+    in_flight = client.post(f"/payments/{registration.id}/confirm", headers=headers)
+    assert in_flight.status_code == 409
+    assert in_flight.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_caching_repository_replays_completed_records_from_memory():
+    """Test that completed records are served from the front cache and pending ones are not cached."""
+    class CountingIdempotencyRepository(InMemoryIdempotencyRepository):
+        claims = 0
+        
+        async def claim(self, record):
+            self.claims += 1
+            return await super().claim(record)
+    
+    store = CountingIdempotencyRepository()
+    cached = CachingIdempotencyRepository(store, TTLCache(maxsize=10, ttl=60))
+    user_id = uuid4()
+    first = IdempotencyRecord(user_id, "key", "POST /x")
+    
+    assert await cached.claim(first) is first
+    assert (await cached.claim(IdempotencyRecord(user_id, "key", "POST /x"))).pending
+    
+    first.complete(200, b"{}")
+    await cached.complete(first)
+    for _ in range(3):
+        replay = await cached.claim(IdempotencyRecord(user_id, "key", "POST /x"))
+        assert (replay.claim_id, replay.body) == (first.claim_id, b"{}")
+    assert store.claims == 2
+
+
+@pytest.mark.asyncio
+async def test_mongodb_claim_treats_expired_records_as_absent():
+    """Test that MongoDB claims return live records but take over expired ones the TTL monitor has not deleted."""
+    collection = UpsertingCollection()
+    repository = MongoDBIdempotencyRepository(SimpleNamespace(idempotency_keys=collection))
+    user_id = uuid4()
+    first = IdempotencyRecord(user_id, "key", "POST /x")
+    
+    assert (await repository.claim(first)).claim_id == first.claim_id
+    assert (await repository.claim(IdempotencyRecord(user_id, "key", "POST /x"))).claim_id == first.claim_id
+    
+    collection.documents[first.id]["expires_at"] = datetime.now(timezone.utc) - timedelta(seconds=1)
+    retry = IdempotencyRecord(user_id, "key", "POST /x")
+    assert (await repository.claim(retry)).claim_id == retry.claim_id
+    assert collection.documents[first.id]["claim_id"] == retry.claim_id
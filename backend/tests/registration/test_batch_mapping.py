@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.domain.exam.entity import Exam
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.exam.mapper import ExamMapper
+from app.infrastructure.registration.mapper import (
+    WITHOUT_EXAM_ID,
+    WITHOUT_USER_ID,
+    RegistrationMapper,
+)
+from app.infrastructure.user.mapper import UserMapper
+
+
+def project(document: dict, projection: dict) -> dict:
+    """Apply an exclusion projection the way the database would."""
+    return {key: value for key, value in document.items() if key not in projection}
+
+
+def fields_of(entity) -> dict:
+    return {name: getattr(entity, name) for name in type(entity).__slots__}
+
+
+def test_to_entities_matches_to_entity():
+    """Test that batch mapping builds the same entities as per-document mapping."""
+    start = datetime.now(timezone.utc) + timedelta(days=7)
+    cases = [
+        (UserMapper, [User(email=f"u{i}@test.com", name="User", role=UserRole.USER) for i in range(3)]),
+        (ExamMapper, [
+            Exam(title="Exam", start_date=start, end_date=start + timedelta(hours=2), fee=Decimal("100"))
+            for _ in range(3)
+        ]),
+        (RegistrationMapper, [ExamRegistration(user_id=uuid4(), exam_id=uuid4()) for _ in range(3)]),
+    ]
+    
+    for mapper, entities in cases:
+        documents = [mapper.to_document(entity) for entity in entities]
+        expected = [fields_of(mapper.to_entity(document)) for document in documents]
+        assert [fields_of(entity) for entity in mapper.to_entities(documents)] == expected
+
+
+def test_projected_registrations_take_the_known_id_from_the_query():
+    """Test that ids omitted by the projection are filled in from the query."""
+    user_id, exam_id = uuid4(), uuid4()
+    registrations = [
+        ExamRegistration(user_id=user_id, exam_id=exam_id, status=RegistrationStatus.PAID)
+        for _ in range(2)
+    ]
+    documents = [RegistrationMapper.to_document(registration) for registration in registrations]
+    
+    by_user = RegistrationMapper.to_entities(
+        [project(document, WITHOUT_USER_ID) for document in documents], user_id=user_id
+    )
+    by_exam = RegistrationMapper.to_entities(
+        [project(document, WITHOUT_EXAM_ID) for document in documents], exam_id=exam_id
+    )
+    
+    for mapped in (by_user, by_exam):
+        assert [fields_of(registration) for registration in mapped] == [
+            fields_of(registration) for registration in registrations
+        ]
@@ -0,0 +1,62 @@
+import copy
+from datetime import datetime, timezone
+
+import pytest
+from uuid import uuid4
+
+from app.domain.content.entity import Content, ContentStatus, ContentSummary, ContentType
+from app.domain.exam.entity import Exam
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User, UserRole
+from app.infrastructure.registration.mapper import RegistrationMapper
+from app.infrastructure.user.mapper import UserMapper
+
+
+@pytest.mark.parametrize("entity_type", [User, Exam, ExamRegistration, Content, ContentSummary])
+def test_entities_are_slotted(entity_type):
+    """Test that entities carry no per-instance __dict__."""
+    assert "__dict__" not in dir(entity_type)
+    assert not hasattr(entity_type.__new__(entity_type), "__dict__")
+
+
+def test_hydrate_keeps_stored_values_as_given():
+    """Test that hydrate() trusts stored data instead of normalizing it again."""
+    created_at = datetime.now(timezone.utc)
+    user = User.hydrate(
+        id=uuid4(),
+        email="user@test.com",
+        name=" Stored Name ",
+        mobile=None,
+        role=UserRole.USER,
+        created_at=created_at,
+    )
+    
+    assert user.name == " Stored Name "
+    assert user.created_at is created_at
+
+
+def test_mapper_hydrates_the_same_entity_as_the_constructor():
+    """Test that mapped entities match those built with the validating constructor."""
+    user = User(email="User@Test.com", name="User", mobile="9876543210", role=UserRole.ADMIN)
+    registration = ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAID)
+    
+    mapped_user = UserMapper.to_entity(UserMapper.to_document(user))
+    mapped_registration = RegistrationMapper.to_entity(RegistrationMapper.to_document(registration))
+    
+    for original, mapped in ((user, mapped_user), (registration, mapped_registration)):
+        assert type(mapped) is type(original)
+        for name in type(original).__slots__:
+            assert getattr(mapped, name) == getattr(original, name)
+
+
+def test_slotted_entities_copy_independently():
+    """Test that copies of slotted entities, as handed out by in-memory repositories, are independent."""
+    content = Content(content_type=ContentType.BLOG, title="Post", body="Body", metadata={"a": 1})
+    
+    shallow = copy.copy(content)
+    deep = copy.deepcopy(content)
+    shallow.status = ContentStatus.PUBLISHED
+    deep.metadata["a"] = 2
+    
+    assert content.status == ContentStatus.DRAFT
+    assert content.metadata == {"a": 1}
@@ -0,0 +1,142 @@
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+import bson
+from bson import Binary, ObjectId
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+
+from app.domain.content.entity import Content, ContentType
+from app.domain.exam.entity import Exam
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.user.entity import User
+from app.domain.pagination import PageCursor
+from app.infrastructure import identity, pagination
+from app.infrastructure.content.mapper import ContentMapper
+from app.infrastructure.exam.mapper import ExamMapper
+from app.infrastructure.registration.mapper import RegistrationMapper
+from app.infrastructure.user.mapper import UserMapper
+
+CODEC_OPTIONS = CodecOptions(tz_aware=True, uuid_representation=UuidRepresentation.STANDARD)
+
+
+def _round_trip(document: dict) -> dict:
+    """Encode and decode a document the way the driver does."""
+    return bson.decode(bson.encode(document, codec_options=CODEC_OPTIONS), codec_options=CODEC_OPTIONS)
+
+
+def test_registration_ids_are_stored_once_as_binary_uuids():
+    """Test that a registration document keys on _id only and stores UUIDs as subtype 4."""
+    registration = ExamRegistration(user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAID)
+    
+    document = RegistrationMapper.to_document(registration)
+    raw = bson.decode(bson.encode(document, codec_options=CODEC_OPTIONS))
+    
+    assert "id" not in document
+    assert document["_id"] == registration.id
+    for field in ("_id", "user_id", "exam_id"):
+        assert isinstance(raw[field], Binary) and raw[field].subtype == 4
+    
+    restored = RegistrationMapper.to_entity(_round_trip(document))
+    assert (restored.id, restored.user_id, restored.exam_id) == (
+        registration.id, registration.user_id, registration.exam_id
+    )
+
+
+def test_mappers_round_trip_through_bson():
+    """Test that every mapper reads back the documents it writes."""
+    start_date = datetime.now(timezone.utc) + timedelta(days=30)
+    exam = Exam(title="Exam", start_date=start_date, end_date=start_date + timedelta(hours=2), fee=Decimal("10.00"))
+    user = User(email="user@test.com", name="User")
+    content = Content(content_type=ContentType.BLOG, title="Post", body="Body")
+    
+    assert ExamMapper.to_entity(_round_trip(ExamMapper.to_document(exam))).id == exam.id
+    assert UserMapper.to_entity(_round_trip(UserMapper.to_document(user))).id == user.id
+    assert ContentMapper.to_entity(_round_trip(ContentMapper.to_document(content))).id == content.id
+
+
+def test_mappers_read_legacy_string_documents():
+    """Test that documents written in the legacy string format still map to entities."""
+    registration_id, user_id, exam_id = uuid4(), uuid4(), uuid4()
+    now = datetime.now(timezone.utc)
+    
+    registration = RegistrationMapper.to_entity({
+        "_id": str(registration_id),
+        "id": str(registration_id),
+        "user_id": str(user_id),
+        "exam_id": str(exam_id),
+        "status": "REGISTERED",
+        "created_at": now,
+    })
+    content = ContentMapper.to_entity({
+        "_id": ObjectId(),
+        "id": str(registration_id),
+        "content_type": "BLOG",
+        "title": "Post",
+        "body": "Body",
+        "status": "DRAFT",
+        "created_at": now,
+        "updated_at": now,
+    })
+    
+    assert (registration.id, registration.user_id, registration.exam_id) == (registration_id, user_id, exam_id)
+    assert content.id == registration_id
+
+
+def test_to_uuid_accepts_every_stored_representation():
+    """Test that UUIDs are read from UUID, binary and string values."""
+    value = uuid4()
+    
+    assert identity.to_uuid(value) == value
+    assert identity.to_uuid(Binary.from_uuid(value)) == value
+    assert identity.to_uuid(str(value)) == value
+
+
+def test_filters_match_legacy_documents_only_when_enabled(monkeypatch):
+    """Test that lookups include legacy string ids only while MONGO_LEGACY_ID_READS is on."""
+    value = uuid4()
+    
+    assert identity.id_filter(value) == {"_id": value}
+    assert identity.uuid_match(value) == value
+    
+    monkeypatch.setattr(identity, "LEGACY_ID_READS", True)
+    assert identity.id_filter(value) == {"$or": [{"_id": value}, {"id": str(value)}]}
+    assert identity.uuid_match(value) == {"$in": [value, str(value)]}
+
+
+@pytest.mark.asyncio
+async def test_legacy_pages_break_ties_in_the_stored_id_type(monkeypatch):
+    """Test that with legacy reads on, the next page compares _ids in the type the cursor's document is stored with."""
+    monkeypatch.setattr(identity, "LEGACY_ID_READS", True)
+    monkeypatch.setattr(pagination, "LEGACY_ID_READS", True)
+    after = PageCursor(datetime(2024, 1, 1, tzinfo=timezone.utc), uuid4())
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value={"_id": str(after.id)})
+    collection.find.return_value.sort.return_value.limit.return_value.to_list = AsyncMock(return_value=[])
+    
+    await pagination.find_page(collection, {}, limit=10, after=after)
+    
+    collection.find_one.assert_awaited_once_with(identity.id_filter(after.id), {"_id": 1})
+    (filter_query, _), _ = collection.find.call_args
+    assert filter_query["$or"] == [
+        {"created_at": {"$gt": after.created_at}},
+        {"created_at": after.created_at, "_id": {"$gt": str(after.id)}},
+        {"created_at": after.created_at, "_id": {"$type": ["binData", "objectId"]}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_legacy_collections_lists_only_unconverted_ones():
+    """Test that collections still holding non-binary _ids are reported."""
+    converted = AsyncMock()
+    converted.find_one.return_value = None
+    unconverted = AsyncMock()
+    unconverted.find_one.return_value = {"_id": str(uuid4())}
+    db = {"users": converted, "exam_registrations": unconverted}
+    
+    assert await identity.legacy_collections(db, ["users", "exam_registrations"]) == ["exam_registrations"]
+    unconverted.find_one.assert_awaited_once_with(identity.LEGACY_ID_FILTER, projection={"_id": 1})
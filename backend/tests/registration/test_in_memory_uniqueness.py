@@ -0,0 +1,53 @@
+import asyncio
+import pytest
+from uuid import uuid4
+
+from app.domain.registration.entity import ExamRegistration
+from app.domain.registration.exceptions import DuplicateRegistrationError
+from app.domain.user.entity import User
+from app.domain.user.exceptions import UserAlreadyExistsError
+from app.infrastructure.memory import InMemoryRegistrationRepository, InMemoryUserRepository
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_registrations_create_one():
+    """Test that concurrent registrations for the same user and exam create only one."""
+    reg_repo = InMemoryRegistrationRepository()
+    user_id, exam_id = uuid4(), uuid4()
+    
+    results = await asyncio.gather(
+        *(reg_repo.create(ExamRegistration(user_id=user_id, exam_id=exam_id)) for _ in range(10)),
+        return_exceptions=True,
+    )
+    
+    created = [r for r in results if isinstance(r, ExamRegistration)]
+    assert len(created) == 1
+    assert all(isinstance(r, DuplicateRegistrationError) for r in results if r not in created)
+    assert len(await reg_repo.get_by_exam_id(exam_id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_emails_are_unique():
+    """Test that a second user with the same email is rejected, also on update."""
+    user_repo = InMemoryUserRepository()
+    await user_repo.create(User(email="taken@example.com", name="First"))
+    
+    with pytest.raises(UserAlreadyExistsError):
+        await user_repo.create(User(email="TAKEN@example.com", name="Second"))
+    
+    other = await user_repo.create(User(email="other@example.com", name="Other"))
+    other.email = "taken@example.com"
+    with pytest.raises(UserAlreadyExistsError):
+        await user_repo.update(other)
+
+
+@pytest.mark.asyncio
+async def test_returned_entities_are_copies():
+    """Test that changing a returned entity does not change stored state."""
+    reg_repo = InMemoryRegistrationRepository()
+    registration = await reg_repo.create(ExamRegistration(user_id=uuid4(), exam_id=uuid4()))
+    
+    fetched = await reg_repo.get_by_id(registration.id)
+    fetched.exam_id = uuid4()
+    
+    assert (await reg_repo.get_by_id(registration.id)).exam_id == registration.exam_id
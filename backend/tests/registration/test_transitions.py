@@ -0,0 +1,129 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from pymongo import ReturnDocument
+
+from app.application.enrollment.services import EnrollmentService
+from app.domain.registration.entity import ExamRegistration, RegistrationStatus
+from app.domain.registration.exceptions import RegistrationNotFoundError
+from app.domain.registration.transitions import CONFIRM_PAYMENT, ENROLL, TRANSITIONS
+from app.domain.user.entity import UserRole
+from app.infrastructure.identity import id_filter, uuid_match
+from app.infrastructure.memory import InMemoryRegistrationRepository
+from app.infrastructure.registration.mapper import RegistrationMapper
+from app.infrastructure.registration.repository import MongoDBRegistrationRepository
+
+
+def mongo_repository(collection):
+    return MongoDBRegistrationRepository(SimpleNamespace(exam_registrations=collection))
+
+
+def test_transition_table_targets_are_not_sources():
+    """Test that no transition leaves a registration where it was."""
+    for transition in TRANSITIONS:
+        assert transition.target not in transition.sources
+
+
+def test_rejection_explains_each_failure():
+    """Test that rejections cover missing, foreign, repeated and out-of-order registrations."""
+    owner, other = uuid4(), uuid4()
+    registration = ExamRegistration(user_id=owner, exam_id=uuid4(), status=RegistrationStatus.PAID)
+    
+    assert isinstance(CONFIRM_PAYMENT.rejection(registration.id, None, owner), RegistrationNotFoundError)
+    assert isinstance(CONFIRM_PAYMENT.rejection(registration.id, registration, other), PermissionError)
+    assert str(CONFIRM_PAYMENT.rejection(registration.id, registration, owner)) == (
+        "Cannot confirm payment. Registration status must be PAYMENT_PENDING, but is PAID"
+    )
+    assert ENROLL.rejection(registration.id, registration) is None
+    
+    registration.status = RegistrationStatus.ENROLLED
+    assert str(ENROLL.rejection(registration.id, registration)) == (
+        f"Registration {registration.id} is already ENROLLED"
+    )
+
+
+@pytest.mark.asyncio
+async def test_mongodb_transition_is_one_conditional_update():
+    """Test that a successful transition filters on owner and status and reads nothing else."""
+    registration = ExamRegistration(
+        user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAYMENT_PENDING
+    )
+    collection = AsyncMock()
+    collection.find_one_and_update.return_value = {
+        **RegistrationMapper.to_document(registration),
+        "status": RegistrationStatus.PAID.value,
+    }
+    
+    updated = await mongo_repository(collection).apply_transition(
+        registration.id, CONFIRM_PAYMENT, user_id=registration.user_id
+    )
+    
+    assert updated.status == RegistrationStatus.PAID
+    (query, update), options = collection.find_one_and_update.call_args
+    assert query == {
+        **id_filter(registration.id),
+        "status": {"$in": ["PAYMENT_PENDING"]},
+        "user_id": uuid_match(registration.user_id),
+    }
+    assert update == {"$set": {"status": "PAID"}}
+    assert options == {"return_document": ReturnDocument.AFTER}
+    collection.find_one.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_mongodb_transition_reads_the_registration_only_to_explain_a_failure():
+    """Test that a failed transition reads the registration once and raises its error."""
+    registration = ExamRegistration(
+        user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAYMENT_PENDING
+    )
+    collection = AsyncMock()
+    collection.find_one_and_update.return_value = None
+    collection.find_one.return_value = RegistrationMapper.to_document(registration)
+    
+    with pytest.raises(PermissionError, match="another user's registration"):
+        await mongo_repository(collection).apply_transition(
+            registration.id, CONFIRM_PAYMENT, user_id=uuid4()
+        )
+    
+    collection.find_one.assert_awaited_once_with(id_filter(registration.id))
+
+
+@pytest.mark.asyncio
+async def test_enrollment_does_not_read_before_updating():
+    """Test that enrolling a registration goes straight to the conditional update."""
+    class CountingRegistrationRepository(InMemoryRegistrationRepository):
+        get_by_id_calls = 0
+        
+        async def get_by_id(self, registration_id):
+            self.get_by_id_calls += 1
+            return await super().get_by_id(registration_id)
+    
+    repo = CountingRegistrationRepository()
+    registration = await repo.create(ExamRegistration(user_id=uuid4(), exam_id=uuid4()))
+    service = EnrollmentService(repo)
+    
+    result = await service.enroll_registration(registration.id, uuid4(), UserRole.ADMIN)
+    
+    assert result["status"] == RegistrationStatus.ENROLLED
+    assert repo.get_by_id_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_owner_only_transition_requires_a_user():
+    """Test that an owner-only transition without a user id is refused before any write."""
+    registration = ExamRegistration(
+        user_id=uuid4(), exam_id=uuid4(), status=RegistrationStatus.PAYMENT_PENDING
+    )
+    collection = AsyncMock()
+    memory = InMemoryRegistrationRepository()
+    await memory.create(registration)
+    
+    with pytest.raises(ValueError, match="acting user"):
+        await mongo_repository(collection).apply_transition(registration.id, CONFIRM_PAYMENT)
+    with pytest.raises(ValueError, match="acting user"):
+        await memory.apply_transition(registration.id, CONFIRM_PAYMENT)
+    
+    collection.find_one_and_update.assert_not_called()
+    assert (await memory.get_by_id(registration.id)).status == RegistrationStatus.PAYMENT_PENDING